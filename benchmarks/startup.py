@@ -0,0 +1,70 @@
+"""
+Times constructing and destroying Sheets and Dropdowns
+
+Usage:
+    python benchmarks/startup.py [number of sheets]
+"""
+
+import os
+import sys
+import tkinter as tk
+from timeit import default_timer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tksheet import Dropdown, Sheet  # noqa: E402
+
+
+def time_constructions(root: tk.Tk, build, n: int) -> float:
+    """
+    Returns the mean time in milliseconds to build, draw and
+    destroy a widget, the draw is included because Sheet
+    construction defers it to the refresh timer
+    """
+    total = 0.0
+    for _ in range(n):
+        start = default_timer()
+        widget = build()
+        root.update()
+        total += default_timer() - start
+        widget.destroy()
+    return total / n * 1000
+
+
+def main(n: int = 50) -> None:
+    root = tk.Tk()
+    root.withdraw()
+    parent = Sheet(root, data=[[f"{r},{c}" for c in range(10)] for r in range(100)])
+    # the first construction loads fonts and styles for the whole
+    # interpreter, it is not counted
+    time_constructions(root, lambda: Sheet(root), 1)
+    results = {
+        "Sheet()": time_constructions(root, lambda: Sheet(root), n),
+        "Sheet(data)": time_constructions(
+            root,
+            lambda: Sheet(root, data=[[f"{r},{c}" for c in range(10)] for r in range(100)]),
+            n,
+        ),
+        "Dropdown()": time_constructions(
+            root,
+            lambda: Dropdown(
+                root,
+                0,
+                0,
+                ops=parent.ops,
+                outline_color=parent.ops.table_selected_cells_border_fg,
+                width=200,
+                height=150,
+                font=parent.ops.table_font,
+                values=[f"value {i}" for i in range(50)],
+            ),
+            n,
+        ),
+    }
+    for name, ms in results.items():
+        print(f"{name:<12} {ms:8.2f} ms")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -61,14 +61,20 @@ from .functions import (
     new_tk_event,
     num2alpha,
     rounded_box_coords,
+    set_text_measure_cache,
+    sort_key,
+    sort_permutation,
     span_dict,
+    text_measure_info,
     tksheet_type_error,
 )
 from .main_table import MainTable
 from .other_classes import (
+    Box_nt,
     DotDict,
     DraggedRowColumn,
     DrawnItem,
+    DropdownSearchIndex,
     EventDataDict,
     GeneratedMouseEvent,
     Highlight,
@@ -34,6 +34,7 @@ from .functions import (
     event_dict,
     get_n2a,
     is_contiguous,
+    measure_text,
     new_tk_event,
     pickled_event_dict,
     rounded_box_coords,
@@ -216,6 +217,8 @@ class ColumnHeaders(tk.Canvas):
     def rc(self, event):
         self.mouseclick_outside_editor_or_dropdown_all_canvases(inside=True)
         self.focus_set()
+        if self.MT.rc_popup_menus_enabled:
+            self.MT.build_rc_menus()
         popup_menu = None
         if self.MT.identify_col(x=event.x, allow_end=False) is None:
             self.MT.deselect("all")
@@ -955,6 +958,7 @@ class ColumnHeaders(tk.Canvas):
                     c += 1
                 if c > len(self.MT.col_positions) - 1:
                     c = len(self.MT.col_positions) - 1
+                self.MT.end_streams()
                 event_data = event_dict(
                     name="move_columns",
                     sheet=self.PAR.name,
@@ -1178,14 +1182,9 @@ class ColumnHeaders(tk.Canvas):
         """
         txt = self.get_valid_cell_data_as_str(datacn, fix=False)
         if txt:
-            self.MT.txt_measure_canvas.itemconfig(
-                self.MT.txt_measure_canvas_text,
-                text=txt,
-                font=self.PAR.ops.header_font,
-            )
-            b = self.MT.txt_measure_canvas.bbox(self.MT.txt_measure_canvas_text)
-            w = b[2] - b[0] + 7
-            h = b[3] - b[1] + 5
+            w, h = measure_text(self, txt, self.PAR.ops.header_font)
+            w += 7
+            h += 5
         else:
             w = self.MT.min_column_width
             h = self.MT.min_header_height
@@ -1217,15 +1216,10 @@ class ColumnHeaders(tk.Canvas):
         ):
             return h
         self.fix_header()
-        qconf = self.MT.txt_measure_canvas.itemconfig
-        qbbox = self.MT.txt_measure_canvas.bbox
-        qtxtm = self.MT.txt_measure_canvas_text
         qfont = self.PAR.ops.header_font
         default_header_height = self.MT.get_default_header_height()
         if text is not None and text:
-            qconf(qtxtm, text=text, font=qfont)
-            b = qbbox(qtxtm)
-            if (th := b[3] - b[1] + 5) > h:
+            if (th := measure_text(self, text, qfont)[1] + 5) > h:
                 h = th
         elif text is None:
             if self.MT.all_columns_displayed:
@@ -1244,9 +1238,7 @@ class ColumnHeaders(tk.Canvas):
                 datarn = self.MT._headers
                 for datacn in iterable:
                     if txt := self.MT.get_valid_cell_data_as_str(datarn, datacn, get_displayed=True):
-                        qconf(qtxtm, text=txt, font=qfont)
-                        b = qbbox(qtxtm)
-                        th = b[3] - b[1] + 5
+                        th = measure_text(self, txt, qfont)[1] + 5
                     else:
                         th = default_header_height
                     if th > h:
@@ -1300,21 +1292,17 @@ class ColumnHeaders(tk.Canvas):
                 else:
                     start_row, end_row = 0, len(self.MT.displayed_rows)
                 iterable = self.MT.displayed_rows[start_row:end_row]
-            qconf = self.MT.txt_measure_canvas.itemconfig
-            qbbox = self.MT.txt_measure_canvas.bbox
-            qtxtm = self.MT.txt_measure_canvas_text
             qtxth = self.MT.table_txt_height
             qfont = self.PAR.ops.table_font
             for datarn in iterable:
                 if txt := self.MT.get_valid_cell_data_as_str(datarn, datacn, get_displayed=True):
-                    qconf(qtxtm, text=txt, font=qfont)
-                    b = qbbox(qtxtm)
+                    txtw = measure_text(self, txt, qfont)[0]
                     if (
                         self.MT.get_cell_kwargs(datarn, datacn, key="dropdown")
                         or self.MT.get_cell_kwargs(datarn, datacn, key="checkbox")
-                    ) and (tw := b[2] - b[0] + qtxth + 7) > w:
+                    ) and (tw := txtw + qtxth + 7) > w:
                         w = tw
-                    elif (tw := b[2] - b[0] + 7) > w:
+                    elif (tw := txtw + 7) > w:
                         w = tw
         if hw > w:
             w = hw
@@ -2074,6 +2062,7 @@ class ColumnHeaders(tk.Canvas):
         Returns:
             bool: True if the editor was successfully opened, False otherwise.
         """
+        self.MT.end_streams()
         text = None
         extra_func_key = "??"
         if event is None or self.MT.event_opens_dropdown_or_checkbox(event):
@@ -2404,16 +2393,21 @@ class ColumnHeaders(tk.Canvas):
         """
         win_h = 5
         datacn = self.MT.datacn(c)
-        for i, v in enumerate(self.get_cell_kwargs(datacn, key="dropdown")["values"]):
-            v_numlines = len(v.split("\n") if isinstance(v, str) else f"{v}".split("\n"))
-            if v_numlines > 1:
-                win_h += (
-                    self.MT.header_first_ln_ins + (v_numlines * self.MT.header_xtra_lines_increment) + 5
-                )  # end of cell
-            else:
-                win_h += self.MT.min_header_height
-            if i == 5:
-                break
+        kwargs = self.get_cell_kwargs(datacn, key="dropdown")
+        if kwargs["values_provider"] is not None:
+            # values are not known until the provider returns
+            win_h += self.MT.min_header_height * min(6, kwargs["provider_limit"])
+        else:
+            for i, v in enumerate(kwargs["values"]):
+                v_numlines = len(v.split("\n") if isinstance(v, str) else f"{v}".split("\n"))
+                if v_numlines > 1:
+                    win_h += (
+                        self.MT.header_first_ln_ins + (v_numlines * self.MT.header_xtra_lines_increment) + 5
+                    )  # end of cell
+                else:
+                    win_h += self.MT.min_header_height
+                if i == 5:
+                    break
         if win_h > 500:
             win_h = 500
         space_bot = self.MT.get_space_bot(0, text_editor_h)
@@ -2454,6 +2448,7 @@ class ColumnHeaders(tk.Canvas):
             c (int): The column index for which to open the dropdown.
             event (object, optional): The event that triggered the dropdown. Defaults to None.
         """
+        self.MT.end_streams()
         self.hide_text_editor()
         kwargs = self.get_cell_kwargs(self.MT.datacn(c), key="dropdown")
         if kwargs["state"] == "normal":
@@ -2472,6 +2467,8 @@ class ColumnHeaders(tk.Canvas):
             "outline_color": self.PAR.ops.header_selected_columns_bg,
             "align": self.get_cell_align(c),
             "values": kwargs["values"],
+            "values_provider": kwargs["values_provider"],
+            "provider_limit": kwargs["provider_limit"],
         }
         if self.dropdown.window:
             self.dropdown.window.reset(**reset_kwargs)
@@ -2487,6 +2484,7 @@ class ColumnHeaders(tk.Canvas):
                 search_function=kwargs["search_function"],
                 arrowkey_RIGHT=self.MT.arrowkey_RIGHT,
                 arrowkey_LEFT=self.MT.arrowkey_LEFT,
+                provider_error=self.PAR.dropdown_provider_error,
             )
             self.dropdown.canvas_id = self.create_window(
                 (self.MT.col_positions[c], ypos),
@@ -2629,10 +2627,11 @@ class ColumnHeaders(tk.Canvas):
         """Hide the dropdown window if it is open.
 
         This method checks if the dropdown window is currently open.
-        If so, it unbinds the focus out event and hides the associated
-        canvas element.
+        If so, it cancels any pending values provider request, unbinds
+        the focus out event and hides the associated canvas element.
         """
         if self.dropdown.open:
+            self.dropdown.window.cancel_provider()
             self.dropdown.window.unbind("<FocusOut>")
             self.itemconfig(self.dropdown.canvas_id, state="hidden")
             self.dropdown.open = False
@@ -2747,7 +2746,7 @@ class ColumnHeaders(tk.Canvas):
         if self.cell_equal_to(datacn, value):
             return False
         kwargs = self.get_cell_kwargs(datacn, key="dropdown")
-        if kwargs and kwargs["validate_input"] and value not in kwargs["values"]:
+        if kwargs and kwargs["validate_input"] and kwargs["values_provider"] is None and value not in kwargs["values"]:
             return False
         return True
 
@@ -2939,6 +2938,7 @@ class ColumnHeaders(tk.Canvas):
             redraw (bool): If True, refreshes the display after the operation 
                 (default is True).
         """
+        self.MT.end_streams()
         if datacn is None:
             datacn = c if self.MT.all_columns_displayed else self.MT.displayed_columns[c]
         kwargs = self.get_cell_kwargs(datacn, key="checkbox")
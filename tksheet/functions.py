@@ -6,23 +6,31 @@ except SyntaxError:
 
 import csv
 import io
+import mmap
 import pickle
 import re
+import struct
 import tkinter as tk
 import zlib
+from array import array
 from bisect import (
     bisect_left,
 )
-from collections import deque
+from collections import OrderedDict, deque
 from collections.abc import (
+    Awaitable,
     Callable,
     Generator,
+    Hashable,
     Iterator,
     Sequence,
 )
+from contextlib import contextmanager
 from functools import partial
-from itertools import islice, repeat
-from typing import Literal
+from itertools import islice, repeat, zip_longest
+from operator import gt, itemgetter
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Literal
 
 from .formatters import (
     to_bool,
@@ -35,6 +43,18 @@ from .other_classes import (
     Loc,
     Span,
 )
+from .vars import (
+    arrow_index_name,
+    scrollbar_options_keys,
+    sheet_state_magic,
+    sheet_state_version,
+)
+
+if TYPE_CHECKING:
+    # asyncio and concurrent.futures are slow to import and are
+    # only needed once a sheet is given an async data provider
+    import asyncio
+    from concurrent.futures import Future
 
 compress = partial(zlib.compress, level=1)
 pickle_obj = partial(pickle.dumps, protocol=pickle.HIGHEST_PROTOCOL)
@@ -57,18 +77,93 @@ def get_csv_str_dialect(s: str, delimiters: str) -> csv.Dialect:
         return csv.excel_tab
 
 
-def get_data_from_clipboard(
-    widget: tk.Misc,
+def get_csv_str_dialect_fast(s: str, delimiters: str) -> csv.Dialect:
+    """
+    Counts each delimiter per line in the first lines of s
+    instead of sniffing, the delimiter found the same number
+    of times on the most lines wins
+    """
+    lines = s[:6000].split("\n", 300)[:300]
+    if len(lines) > 1:
+        # last line is likely cut off
+        lines.pop()
+    best, best_score = None, (0, 0)
+    for delimiter in delimiters:
+        counts = [line.count(delimiter) for line in lines]
+        if not (total := sum(counts)):
+            continue
+        score = (max(counts.count(n) for n in set(counts) if n), total)
+        if score > best_score:
+            best, best_score = delimiter, score
+    if best is None:
+        return csv.excel_tab
+    return type("tksheet_dialect", (csv.excel,), {"delimiter": best})
+
+
+def get_data_from_str(
+    data: str,
     delimiters: str,
     lineterminator: str = "\n",
 ) -> list[list[str]]:
-    data = widget.clipboard_get()
     dialect = get_csv_str_dialect(data, delimiters=delimiters)
     if dialect.delimiter in data or lineterminator in data:
         return list(csv.reader(io.StringIO(data), dialect=dialect, skipinitialspace=True))
     return [[data]]
 
 
+def iter_data_from_str(
+    data: str,
+    delimiters: str,
+    lineterminator: str = "\n",
+) -> Iterator[list[str]]:
+    dialect = get_csv_str_dialect_fast(data, delimiters=delimiters)
+    if dialect.delimiter in data or lineterminator in data:
+        return csv.reader(io.StringIO(data), dialect=dialect, skipinitialspace=True)
+    return iter(([data],))
+
+
+def tiled_rows(
+    rows: Iterator[list[str]],
+    numcols: int,
+    row_tiles: int = 1,
+    col_tiles: int = 1,
+) -> Generator[list[str]]:
+    """
+    Pads each row to numcols cells and repeats the cells col_tiles times
+    across, then the rows are repeated row_tiles times down, used to
+    tile a paste over a larger selection
+    """
+    first = []
+    for row in rows:
+        if len(row) < numcols:
+            row.extend(repeat("", numcols - len(row)))
+        row *= col_tiles
+        if row_tiles > 1:
+            first.append(row)
+        yield row
+    for _ in range(row_tiles - 1):
+        yield from (row.copy() for row in first)
+
+
+def get_data_from_clipboard(
+    widget: tk.Misc,
+    delimiters: str,
+    lineterminator: str = "\n",
+) -> list[list[str]]:
+    return get_data_from_str(widget.clipboard_get(), delimiters, lineterminator)
+
+
+def exhaust(gen: Generator) -> object:
+    """
+    Runs a generator to the end and returns its return value
+    """
+    try:
+        while True:
+            next(gen)
+    except StopIteration as stop:
+        return stop.value
+
+
 def pickle_compress(obj: object) -> bytes:
     return compress(pickle_obj(obj))
 
@@ -77,17 +172,127 @@ def decompress_load(b: bytes) -> object:
     return pickle.loads(zlib.decompress(b))
 
 
+worker_loop = None
+worker_loop_lock = Lock()
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    # one daemon thread running an event loop, shared by all sheets
+    global worker_loop
+    import asyncio
+
+    with worker_loop_lock:
+        if worker_loop is None:
+            worker_loop = asyncio.new_event_loop()
+            Thread(target=worker_loop.run_forever, name="tksheet-worker", daemon=True).start()
+    return worker_loop
+
+
+async def await_obj(awaitable: Awaitable) -> object:
+    return await awaitable
+
+
+def run_awaitable(awaitable: Awaitable) -> Future:
+    """
+    Runs an awaitable in the worker thread, the returned
+    Future can be polled from the tk thread and cancelled
+    """
+    import asyncio
+
+    return asyncio.run_coroutine_threadsafe(await_obj(awaitable), get_worker_loop())
+
+
 def tksheet_type_error(kwarg: str, valid_types: list[str], not_type: object) -> str:
     valid_types = ", ".join(f"{type_}" for type_ in valid_types)
     return f"Argument '{kwarg}' must be one of the following types: {valid_types}, " f"not {type(not_type)}."
 
 
+def check_sample_size(kwarg: str, sample: object) -> None:
+    if sample is not None and (not isinstance(sample, int) or isinstance(sample, bool) or sample < 1):
+        raise ValueError(f"Argument '{kwarg}' must be an int of 1 or more or None, not {sample!r}.")
+
+
 def new_tk_event(keysym: str) -> tk.Event:
     event = tk.Event()
     event.keysym = keysym
     return event
 
 
+measure_canvases = {}
+
+
+def get_measure_canvas(widget: tk.Misc) -> tuple[tk.Canvas, int]:
+    """
+    Returns a hidden canvas and text item used for measuring
+    text, one is made per Tk interpreter and shared by every
+    sheet, the font is given with the text being measured
+    """
+    canvas, text = measure_canvases.get(widget.tk, (None, None))
+    if canvas is None or not canvas.winfo_exists():
+        canvas = tk.Canvas(widget._root())
+        text = canvas.create_text(0, 0, text="")
+        measure_canvases[widget.tk] = (canvas, text)
+        # the canvas is destroyed with its root window
+        canvas.bind("<Destroy>", lambda _event, app=widget.tk: forget_measured_text(app))
+    return canvas, text
+
+
+def forget_measured_text(app: object) -> None:
+    """
+    Removes the measure canvas and cached text sizes of a Tk
+    interpreter so that a destroyed one is not kept alive
+    """
+    measure_canvases.pop(app, None)
+    for key in [key for key in measured_text if key[0] is app]:
+        del measured_text[key]
+
+
+measured_text = OrderedDict()
+measured_text_info = DotDict(hits=0, misses=0, maxsize=100_000)
+
+
+def measure_text(widget: tk.Misc, text: str, font: tuple[str, int, str]) -> tuple[int, int]:
+    """
+    Returns the width and height of text drawn using font, sizes
+    are kept for every sheet in the process in a cache of the
+    most recently used text and font pairs, keyed by the Tk
+    interpreter because its display and scaling affect the size
+    """
+    key = (widget.tk, text, font if isinstance(font, (str, tuple)) else tuple(font))
+    if (size := measured_text.get(key)) is not None:
+        measured_text.move_to_end(key)
+        measured_text_info.hits += 1
+        return size
+    measured_text_info.misses += 1
+    canvas, item = get_measure_canvas(widget)
+    canvas.itemconfig(item, text=text, font=font)
+    b = canvas.bbox(item)
+    measured_text[key] = size = (b[2] - b[0], b[3] - b[1])
+    if len(measured_text) > measured_text_info.maxsize:
+        measured_text.popitem(last=False)
+    return size
+
+
+def text_measure_info() -> DotDict:
+    return DotDict(
+        hits=measured_text_info.hits,
+        misses=measured_text_info.misses,
+        size=len(measured_text),
+        maxsize=measured_text_info.maxsize,
+    )
+
+
+def set_text_measure_cache(maxsize: int | None = None, clear: bool = False) -> None:
+    if clear:
+        measured_text.clear()
+        measured_text_info.hits = 0
+        measured_text_info.misses = 0
+    if maxsize is not None:
+        measured_text_info.maxsize = max(0, maxsize)
+        while len(measured_text) > measured_text_info.maxsize:
+            measured_text.popitem(last=False)
+
+
 def dropdown_search_function(
     search_for: object,
     data: Sequence[object],
@@ -161,34 +366,11 @@ def event_dict(
     named_spans: None | dict = None,
     **kwargs,
 ) -> EventDataDict:
-    return EventDataDict(
+    # cells, moved, sorted, added, deleted, named_spans, options and resized
+    # are created by EventDataDict when first accessed unless given here
+    event_data = EventDataDict(
         eventname="" if name is None else name,
         sheetname="!sheet" if sheet is None else sheet,
-        cells=DotDict(
-            table=DotDict() if cells_table is None else cells_table,
-            header=DotDict() if cells_header is None else cells_header,
-            index=DotDict() if cells_index is None else cells_index,
-        ),
-        moved=DotDict(
-            rows=DotDict(),
-            columns=DotDict(),
-        ),
-        added=DotDict(
-            rows=DotDict(),
-            columns=DotDict(),
-        ),
-        deleted=DotDict(
-            rows=DotDict(),
-            columns=DotDict(),
-            header=DotDict(),
-            index=DotDict(),
-            column_widths=DotDict(),
-            row_heights=DotDict(),
-            displayed_rows=None,
-            displayed_columns=None,
-        ),
-        named_spans=DotDict() if named_spans is None else named_spans,
-        options=DotDict(),
         selection_boxes=(
             {} if boxes is None else selection_box_tup_to_dict(boxes) if isinstance(boxes, tuple) else boxes
         ),
@@ -200,14 +382,24 @@ def event_dict(
         loc=tuple() if loc is None else loc,
         row=row,
         column=column,
-        resized=DotDict(
+        widget=widget,
+    )
+    if cells_table is not None or cells_header is not None or cells_index is not None:
+        event_data["cells"] = DotDict(
+            table=DotDict() if cells_table is None else cells_table,
+            header=DotDict() if cells_header is None else cells_header,
+            index=DotDict() if cells_index is None else cells_index,
+        )
+    if named_spans is not None:
+        event_data["named_spans"] = named_spans
+    if resized_rows is not None or resized_columns is not None:
+        event_data["resized"] = DotDict(
             rows=DotDict() if resized_rows is None else resized_rows,
             columns=DotDict() if resized_columns is None else resized_columns,
             # "header": DotDict() if resized_header is None else resized_header,
             # "index": DotDict() if resized_index is None else resized_index,
-        ),
-        widget=widget,
-    )
+        )
+    return event_data
 
 
 def change_eventname(event_dict: EventDataDict, newname: str) -> EventDataDict:
@@ -215,7 +407,9 @@ def change_eventname(event_dict: EventDataDict, newname: str) -> EventDataDict:
 
 
 def pickled_event_dict(d: DotDict) -> DotDict:
-    return DotDict(name=d["eventname"], data=pickle_compress(DotDict({k: v for k, v in d.items() if k != "widget"})))
+    return DotDict(
+        name=d["eventname"], data=pickle_compress(EventDataDict({k: v for k, v in d.items() if k != "widget"}))
+    )
 
 
 def len_to_idx(n: int) -> int:
@@ -244,6 +438,8 @@ def get_dropdown_kwargs(
     search_function: Callable = dropdown_search_function,
     validate_input: bool = True,
     text: None | str = None,
+    values_provider: Callable | None = None,
+    provider_limit: int = 100,
 ) -> dict:
     return {
         "values": values,
@@ -255,9 +451,35 @@ def get_dropdown_kwargs(
         "search_function": search_function,
         "validate_input": validate_input,
         "text": text,
+        "values_provider": values_provider,
+        "provider_limit": provider_limit,
     }
 
 
+def dropdown_style_options(ops: DotDict, outline_color: str, font: tuple[str, int, str] | None = None) -> dict:
+    """
+    Returns the Sheet options a Dropdown uses to match the
+    popup menu colors and scrollbars of the sheet it is in
+    """
+    options = {
+        "outline_color": outline_color,
+        "table_grid_fg": ops.popup_menu_fg,
+        "table_selected_cells_border_fg": ops.popup_menu_fg,
+        "table_selected_cells_bg": ops.popup_menu_highlight_bg,
+        "table_selected_rows_border_fg": ops.popup_menu_fg,
+        "table_selected_rows_bg": ops.popup_menu_highlight_bg,
+        "table_selected_rows_fg": ops.popup_menu_highlight_fg,
+        "table_selected_box_cells_fg": ops.popup_menu_highlight_bg,
+        "table_selected_box_rows_fg": ops.popup_menu_highlight_bg,
+        "table_fg": ops.popup_menu_fg,
+        "table_bg": ops.popup_menu_bg,
+        **{k: ops[k] for k in scrollbar_options_keys},
+    }
+    if font is not None:
+        options["font"] = font
+    return options
+
+
 def get_dropdown_dict(**kwargs) -> dict:
     return {
         "values": kwargs["values"],
@@ -267,6 +489,8 @@ def get_dropdown_dict(**kwargs) -> dict:
         "validate_input": kwargs["validate_input"],
         "text": kwargs["text"],
         "state": kwargs["state"],
+        "values_provider": kwargs["values_provider"],
+        "provider_limit": kwargs["provider_limit"],
     }
 
 
@@ -441,6 +665,34 @@ def consecutive_ranges(seq: Sequence[int]) -> Generator[tuple[int, int]]:
             yield seq[start], seq[-1] + 1
 
 
+def found_boxes(scan: Iterator[list[tuple[int, int]]]) -> Generator[Box_nt]:
+    """
+    Joins the cells found in each row, see MainTable.find_rows(), into
+    boxes of consecutive cells, a box grows downwards for as long as
+    the next row has a match of the same columns, so boxes are yielded
+    in the order they end rather than in row order
+    """
+    boxes = {}
+    for cells in scan:
+        runs = []
+        for datarn, datacn in cells:
+            if runs and runs[-1][1] == datacn:
+                runs[-1][1] = datacn + 1
+            else:
+                runs.append([datacn, datacn + 1])
+        ended, boxes = boxes, {}
+        for from_c, upto_c in runs:
+            box = ended.pop((from_c, upto_c), None)
+            if box is not None and box.upto_r == datarn:
+                boxes[(from_c, upto_c)] = box._replace(upto_r=datarn + 1)
+            else:
+                if box is not None:
+                    yield box
+                boxes[(from_c, upto_c)] = Box_nt(datarn, from_c, datarn + 1, upto_c)
+        yield from ended.values()
+    yield from boxes.values()
+
+
 def is_contiguous(iterable: Iterator[int]) -> bool:
     itr = iter(iterable)
     prev = next(itr)
@@ -532,6 +784,24 @@ def add_to_displayed(displayed: list[int], to_add: Iterator[int]) -> list[int]:
     return displayed
 
 
+def add_to_view(displayed: list[int], to_add: dict[int, object], positions: Iterator[int]) -> list[int]:
+    """
+    add_to_displayed() for displayed indexes which are not in order,
+    to_add and positions are both sorted in reverse and each added
+    index is shown at the displayed position paired with it
+    """
+    added = sorted(to_add)
+
+    def moved(e: int) -> int:
+        for i in added:
+            if i > e:
+                break
+            e += 1
+        return e
+
+    return insert_items(list(map(moved, displayed)), dict(zip(positions, to_add)))
+
+
 def move_elements_by_mapping(
     seq: list[object],
     new_idxs: dict[int, int],
@@ -568,6 +838,75 @@ def move_elements_by_mapping(
         return [next(remaining) if i not in old_idxs else e for i, e in enumerate(res)]
 
 
+def moved_range(new_idxs: dict[int, int]) -> tuple[int, int, dict[int, int], dict[int, int]]:
+    """
+    Moving elements by {old index: new index} only changes the
+    elements from the lowest to the highest old or new index,
+    returns that range and the mapping and its inverse relative
+    to the start of the range
+    """
+    if not new_idxs:
+        return 0, 0, {}, {}
+    lo = min(min(new_idxs), min(new_idxs.values()))
+    hi = max(max(new_idxs), max(new_idxs.values())) + 1
+    rel_new_idxs = {old - lo: new - lo for old, new in new_idxs.items()}
+    return lo, hi, rel_new_idxs, dict(zip(rel_new_idxs.values(), rel_new_idxs))
+
+
+def move_elements_in_range(seq: list[object], new_idxs: dict[int, int]) -> list[object]:
+    """
+    Same result as move_elements_by_mapping but done in place
+    and only over the range of elements that change
+    """
+    lo, hi, rel_new_idxs, rel_old_idxs = moved_range(new_idxs)
+    if lo < hi:
+        seq[lo:hi] = move_elements_by_mapping(seq[lo:hi], rel_new_idxs, rel_old_idxs)
+    return seq
+
+
+def changed_idxs(new_idxs: dict[int, int]) -> dict[int, int]:
+    """
+    {old index: new index} for every index which changes when
+    moving elements by new_idxs, including the displaced ones
+    """
+    lo, hi, rel_new_idxs, rel_old_idxs = moved_range(new_idxs)
+    return {
+        old: new
+        for new, old in enumerate(move_elements_by_mapping(range(lo, hi), rel_new_idxs, rel_old_idxs), lo)
+        if old != new
+    }
+
+
+def remap_keys(options: dict, new_idxs: dict[int, int]) -> None:
+    moved = [(new_idxs[k], options.pop(k)) for k in [k for k in new_idxs if k in options]]
+    options.update(moved)
+
+
+def remap_cell_keys(options: dict, new_idxs: dict[int, int], axis: int) -> None:
+    moved = [k for k in options if k[axis] in new_idxs]
+    if axis:
+        options.update([((r, new_idxs[c]), options.pop((r, c))) for r, c in moved])
+    else:
+        options.update([((new_idxs[r], c), options.pop((r, c))) for r, c in moved])
+
+
+def remap_tagged(tagged: dict[str, set], new_idxs: dict[int, int], axis: int | None = None) -> None:
+    for idxs in tagged.values():
+        if axis is None:
+            moved = idxs.intersection(new_idxs)
+            if moved:
+                idxs -= moved
+                idxs.update(map(new_idxs.__getitem__, moved))
+        else:
+            moved = {k for k in idxs if k[axis] in new_idxs}
+            if moved:
+                idxs -= moved
+                if axis:
+                    idxs.update((r, new_idxs[c]) for r, c in moved)
+                else:
+                    idxs.update((new_idxs[r], c) for r, c in moved)
+
+
 def move_elements_to(
     seq: list[object],
     move_to: int,
@@ -599,6 +938,275 @@ def get_new_indexes(
     return new_idxs
 
 
+def sort_key(value: object) -> tuple[int, object]:
+    """
+    Default key used to sort cells, numbers and strings which
+    convert to numbers come first, then everything else as
+    case insensitive strings, then empty cells
+    """
+    if value is None or value == "" or value != value:
+        return (2, "")
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (0, value)
+    if isinstance(value, str):
+        try:
+            num = float(value)
+            if num == num:
+                return (0, num)
+        except ValueError:
+            pass
+        return (1, value.lower())
+    return (1, f"{value}".lower())
+
+
+def index_value(value: object) -> Hashable:
+    """
+    A value usable as a dict key, unhashable
+    values are keyed by their string
+    """
+    try:
+        hash(value)
+    except TypeError:
+        return f"{value}"
+    return value
+
+
+def data_to_rows(data: object) -> object:
+    """
+    Turns a 2D numpy ndarray, pandas DataFrame or pyarrow
+    Table into a list of row lists, anything else is
+    returned unchanged
+    """
+    library = type(data).__module__.partition(".")[0]
+    if library == "numpy" and getattr(data, "ndim", None) == 2:
+        return data.tolist()
+    if library == "pandas" and hasattr(data, "columns"):
+        return data.to_numpy(dtype=object).tolist()
+    if library == "pyarrow" and hasattr(data, "column_names"):
+        # a stored DataFrame index is not part of the data
+        columns = zip(data.column_names, data.columns)
+        return list(map(list, zip(*(column.to_pylist() for name, column in columns if name != arrow_index_name))))
+    return data
+
+
+def data_labels(data: object) -> tuple[list[object] | None, list[object] | None]:
+    """
+    Returns the header and index of a pandas DataFrame or pyarrow
+    Table given to data_to_rows(), None for either if it has none
+    A DataFrame's default 0, 1, 2... index is not returned
+    """
+    library = type(data).__module__.partition(".")[0]
+    if library == "pandas" and hasattr(data, "columns"):
+        import pandas
+
+        if isinstance(data.index, pandas.RangeIndex) and data.index.start == 0 and data.index.step == 1:
+            return data.columns.tolist(), None
+        return data.columns.tolist(), data.index.tolist()
+    if library == "pyarrow" and hasattr(data, "column_names"):
+        if arrow_index_name in data.column_names:
+            return (
+                [name for name in data.column_names if name != arrow_index_name],
+                data.column(arrow_index_name).to_pylist(),
+            )
+        return list(data.column_names), None
+    return None, None
+
+
+def option_runs(options: dict) -> list[tuple[int, int, int, bytes]]:
+    """
+    Run-length encodes row, column, header, index or cell options
+    into (column, start, stop, pickled options) runs of consecutive
+    keys with equal options, column is -1 unless the keys are cells
+    """
+    runs = []
+    if options and isinstance(next(iter(options)), tuple):
+        keys = ((k[1], k[0], k) for k in sorted(options, key=itemgetter(1, 0)))
+    else:
+        keys = ((-1, k, k) for k in sorted(options))
+    run = None
+    for c, r, k in keys:
+        v = options[k]
+        if run and run[0] == c and run[2] == r and run[3] == v:
+            run[2] = r + 1
+        else:
+            if run:
+                runs.append((run[0], run[1], run[2], pickle_obj(run[3])))
+            run = [c, r, r + 1, v]
+    if run:
+        runs.append((run[0], run[1], run[2], pickle_obj(run[3])))
+    return runs
+
+
+def runs_to_options(runs: list[tuple[int, int, int, bytes]]) -> dict:
+    """
+    Every key gets its own copy of its runs options so that
+    they can still be changed one row, column or cell at a time
+    """
+    options = {}
+    for c, start, stop, v in runs:
+        if c == -1:
+            options.update((r, unpickle_obj(v)) for r in range(start, stop))
+        else:
+            options.update(((r, c), unpickle_obj(v)) for r in range(start, stop))
+    return options
+
+
+def rows_to_column_chunk(rows: Sequence[Sequence[object]]) -> bytes:
+    width = max(map(len, rows), default=0)
+    lengths = None if all(len(r) == width for r in rows) else array("Q", map(len, rows)).tobytes()
+    return pickle_obj((len(rows), width, lengths, list(zip_longest(*rows))))
+
+
+def column_chunk_to_rows(chunk: bytes | memoryview) -> list[list[object]]:
+    numrows, width, lengths, columns = unpickle_obj(chunk)
+    if not width:
+        return [[] for _ in range(numrows)]
+    rows = list(map(list, zip(*columns)))
+    if lengths:
+        for row, length in zip(rows, array("Q", lengths)):
+            if length < width:
+                del row[length:]
+    return rows
+
+
+def positions_to_bytes(positions: Iterator[float]) -> bytes:
+    return array("d", positions).tobytes()
+
+
+def bytes_to_positions(b: bytes | memoryview) -> list[float]:
+    positions = array("d")
+    positions.frombytes(b)
+    return positions.tolist()
+
+
+def write_state_file(path: str, sections: Iterator[tuple[str, bytes]]) -> int:
+    """
+    Writes named binary sections one after another between a
+    header and a trailing index of section offsets, returns the
+    number of bytes written
+    """
+    index = {}
+    with open(path, "wb") as file:
+        pos = file.write(struct.pack("<8sI", sheet_state_magic, sheet_state_version))
+        for name, b in sections:
+            index[name] = (pos, len(b))
+            pos += file.write(b)
+        index_pos = pos
+        pos += file.write(pickle_obj(index))
+        pos += file.write(struct.pack("<Q", index_pos))
+    return pos
+
+
+@contextmanager
+def open_state_file(path: str, memory_map: bool = True) -> Generator[dict[str, memoryview]]:
+    """
+    Yields the sections of a file made by write_state_file() as
+    memoryviews which are only usable inside the with statement,
+    when memory_map is True the file is not read into memory
+    """
+    with open(path, "rb") as file:
+        if memory_map:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            buffer = file.read()
+    view = memoryview(buffer)
+    sections = {}
+    try:
+        magic, version = struct.unpack_from("<8sI", view)
+        if magic != sheet_state_magic:
+            raise ValueError(f"'{path}' is not a tksheet state file.")
+        if version > sheet_state_version:
+            raise ValueError(f"'{path}' uses state file version {version}, newest supported is {sheet_state_version}.")
+        (index_pos,) = struct.unpack_from("<Q", view, len(view) - 8)
+        with view[index_pos:-8] as b:
+            index = unpickle_obj(b)
+        sections = {name: view[pos : pos + length] for name, (pos, length) in index.items()}
+        yield sections
+    finally:
+        for section in sections.values():
+            section.release()
+        view.release()
+        if memory_map:
+            buffer.close()
+
+
+def find_regex(
+    pattern: str,
+    regex: bool = False,
+    match_case: bool = False,
+    whole_cell: bool = False,
+) -> re.Pattern:
+    if not regex:
+        pattern = re.escape(pattern)
+    if whole_cell:
+        pattern = rf"\A(?:{pattern})\Z"
+    return re.compile(pattern, 0 if match_case else re.IGNORECASE)
+
+
+def get_numpy() -> object | None:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def sort_permutation(
+    columns: Sequence[Sequence[object]],
+    key: Callable | None = None,
+    reverse: bool = False,
+) -> list[int]:
+    """
+    Returns the stable permutation of indexes which sorts the
+    rows made up of columns, sorted by the first column, then
+    the second etc. e.g. [old index for new index 0, ...]
+    """
+    if not columns:
+        return []
+    n = len(columns[0])
+    if key is None and n > 1000 and (np := get_numpy()) is not None:
+        # numpy is only used for columns of all ints or all floats, mixed
+        # columns would be cast to float64 which loses ints above 2**53
+        arrays = []
+        for column in reversed(columns):
+            if (types := set(map(type, column))) != {int} and types != {float}:
+                break
+            arr = np.asarray(column)
+            if arr.dtype.kind == "i":
+                # ints too large for int64 are objects, the smallest int64 cannot be negated
+                if reverse and arr.min() == np.iinfo(arr.dtype).min:
+                    break
+            elif arr.dtype.kind != "f" or np.isnan(arr).any():
+                break
+            arrays.append(np.negative(arr) if reverse else arr)
+        else:
+            return np.lexsort(arrays).tolist()
+    if key is None:
+        if reverse:
+            # empty cells stay last when sorting in reverse, each column is
+            # sorted from the last to the first relying on the sort being stable
+            empty = sort_key(None)
+            order = list(range(n))
+            for column in reversed(columns):
+                keys = list(map(sort_key, column))
+                order.sort(key=keys.__getitem__, reverse=True)
+                order = [i for i in order if keys[i] != empty] + [i for i in order if keys[i] == empty]
+            return order
+        key = sort_key
+    if len(columns) == 1:
+        keys = list(map(key, columns[0]))
+    else:
+        keys = list(zip(*(map(key, column) for column in columns)))
+    return sorted(range(n), key=keys.__getitem__, reverse=reverse)
+
+
+def invert_permutation(order: Sequence[int]) -> list[int]:
+    inverse = [0] * len(order)
+    for new, old in enumerate(order):
+        inverse[old] = new
+    return inverse
+
+
 def insert_items(seq: list | tuple, to_insert: dict, seq_len_func: Callable | None = None) -> list:
     # inserts many items into a list using a dict of reverse sorted order of
     # {index: value, index: value, ...}
@@ -620,6 +1228,13 @@ def data_to_displayed_idxs(
     to_convert: list[int],
     displayed: list[int],
 ) -> list[int]:
+    if len(to_convert) < len(displayed) and not any(map(gt, displayed, islice(displayed, 1, None))):
+        # a binary search per index when displayed is ascending
+        return [
+            i
+            for e in sorted(set(to_convert))
+            if (i := bisect_left(displayed, e)) < len(displayed) and displayed[i] == e
+        ]
     data_indexes = set(to_convert)
     return [i for i, e in enumerate(displayed) if e in data_indexes]
 
@@ -1438,3 +2053,48 @@ def pop_positions(
             save_to[to_pop[i]] = pos
         else:
             yield pos
+
+
+def split_positions(seq: list, positions: Iterator[int]) -> tuple[list, list]:
+    """
+    positions must be ascending and unique, returns (seq without
+    the items at positions, the items at positions) using slices
+    rather than a loop over every item
+    """
+    kept, removed, start = [], [], 0
+    for i in positions:
+        if i < start:
+            continue
+        if i >= len(seq):
+            break
+        kept.extend(seq[start:i])
+        removed.append(seq[i])
+        start = i + 1
+    kept.extend(seq[start:])
+    return kept, removed
+
+
+def merge_displayed(
+    displayed: list[int],
+    sizes: list[int],
+    to_show: Iterator[int],
+    new_size: Callable[[int], int],
+) -> tuple[list[int], list[int]]:
+    """
+    Merges the ascending data indexes to_show into the ascending
+    displayed indexes in one pass, returns the new displayed
+    indexes and their sizes, new_size(data index) gives the size
+    of each newly displayed index
+    """
+    new_disp, new_sizes, start = [], [], 0
+    for idx in to_show:
+        i = bisect_left(displayed, idx, start)
+        new_disp.extend(displayed[start:i])
+        new_sizes.extend(sizes[start:i])
+        start = i
+        if i == len(displayed) or displayed[i] != idx:
+            new_disp.append(idx)
+            new_sizes.append(new_size(idx))
+    new_disp.extend(displayed[start:])
+    new_sizes.extend(sizes[start:])
+    return new_disp, new_sizes
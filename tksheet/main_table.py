@@ -10,6 +10,7 @@ import tkinter as tk
 from bisect import (
     bisect_left,
     bisect_right,
+    insort,
 )
 from collections import (
     defaultdict,
@@ -28,6 +29,7 @@ from functools import (
 from itertools import (
     accumulate,
     chain,
+    count,
     cycle,
     filterfalse,
     islice,
@@ -37,7 +39,8 @@ from math import (
     ceil,
     floor,
 )
-from operator import itemgetter
+from operator import gt, itemgetter
+from timeit import default_timer
 from tkinter import TclError
 from typing import Literal
 
@@ -54,33 +57,57 @@ from .formatters import (
 )
 from .functions import (
     add_to_displayed,
+    add_to_view,
     b_index,
+    bytes_to_positions,
     cell_right_within_box,
+    changed_idxs,
+    column_chunk_to_rows,
     consecutive_ranges,
+    data_labels,
+    data_to_rows,
     decompress_load,
     diff_gen,
     diff_list,
     down_cell_within_box,
     event_dict,
+    exhaust,
+    found_boxes,
     gen_formatted,
-    get_data_from_clipboard,
+    get_data_from_str,
     get_new_indexes,
     get_seq_without_gaps_at_index,
     index_exists,
+    index_value,
     insert_items,
     int_x_iter,
+    invert_permutation,
     is_iterable,
     is_type_int,
+    iter_data_from_str,
     len_to_idx,
+    measure_text,
     mod_event_val,
     mod_span,
     mod_span_widget,
     move_elements_by_mapping,
+    move_elements_in_range,
+    moved_range,
     new_tk_event,
+    option_runs,
     pickle_obj,
     pickled_event_dict,
+    positions_to_bytes,
+    remap_cell_keys,
+    remap_keys,
+    remap_tagged,
     rounded_box_coords,
+    rows_to_column_chunk,
+    runs_to_options,
+    sort_key,
+    sort_permutation,
     span_idxs_post_move,
+    tiled_rows,
     try_binding,
     unpickle_obj,
 )
@@ -92,6 +119,7 @@ from .other_classes import (
     DropdownStorage,
     EventDataDict,
     FontTuple,
+    Highlight,
     Loc,
     ProgressBar,
     Selected,
@@ -140,6 +168,17 @@ class MainTable(tk.Canvas):
         self.synced_scrolls = set()
         self.dropdown = DropdownStorage()
         self.text_editor = TextEditorStorage()
+        self.paste_stream = None
+        self.copy_stream = None
+        self.sort_key_cache = {}
+        self.sort_key_func = None
+        self.view_disprns = {}
+        self.view_disprns_of = None
+        self.value_index_cache = {}
+        self.data_cols_cache = None
+        self.find_stream = None
+        self.found_cells = {}
+        self.export_stream = None
         self.event_linker = {
             "<<Copy>>": self.ctrl_c,
             "<<Cut>>": self.ctrl_x,
@@ -195,6 +234,7 @@ class MainTable(tk.Canvas):
         self.extra_rc_func = None
 
         self.edit_validation_func = None
+        self.bulk_table_edit_validation_func = None
 
         self.extra_begin_ctrl_c_func = None
         self.extra_end_ctrl_c_func = None
@@ -297,9 +337,6 @@ class MainTable(tk.Canvas):
         self.PAR.ops.index_font = FontTuple(*self.PAR.ops.index_font)
         self.PAR.ops.header_font = FontTuple(*self.PAR.ops.header_font)
 
-        self.txt_measure_canvas = tk.Canvas(self)
-        self.txt_measure_canvas_text = self.txt_measure_canvas.create_text(0, 0, text="", font=self.PAR.ops.table_font)
-
         self.max_row_height = float(kwargs["max_row_height"])
         self.max_index_width = float(kwargs["max_index_width"])
         self.max_column_width = float(kwargs["max_column_width"])
@@ -309,10 +346,9 @@ class MainTable(tk.Canvas):
         self.set_table_font_help()
         self.set_header_font_help()
         self.set_index_font_help()
-        self.data = kwargs["data_reference"]
-        if isinstance(self.data, (list, tuple)):
-            self.data = kwargs["data_reference"]
-        else:
+        headers, index = data_labels(kwargs["data_reference"])
+        self.data = data_to_rows(kwargs["data_reference"])
+        if not isinstance(self.data, (list, tuple)):
             self.data = []
         if not self.data:
             if (
@@ -322,7 +358,11 @@ class MainTable(tk.Canvas):
                 and kwargs["total_cols"] > 0
             ):
                 self.data = [list(repeat("", kwargs["total_cols"])) for i in range(kwargs["total_rows"])]
+        if self.PAR.ops.rectangular_data:
+            self.check_rectangular(self.data)
         _header = kwargs["header"] if kwargs["header"] is not None else kwargs["headers"]
+        if _header is None:
+            _header = headers
         if isinstance(_header, int):
             self._headers = _header
         else:
@@ -331,6 +371,8 @@ class MainTable(tk.Canvas):
             else:
                 self._headers = []
         _row_index = kwargs["index"] if kwargs["index"] is not None else kwargs["row_index"]
+        if _row_index is None:
+            _row_index = index
         if isinstance(_row_index, int):
             self._row_index = _row_index
         else:
@@ -559,7 +601,7 @@ class MainTable(tk.Canvas):
         return s, writer
 
     def ctrl_c(self, event=None) -> None | EventDataDict:
-        if not self.selected:
+        if not self.selected or self.copy_stream is not None:
             return
         event_data = event_dict(
             name="begin_ctrl_c",
@@ -569,46 +611,139 @@ class MainTable(tk.Canvas):
         )
         boxes, maxrows = self.get_ctrl_x_c_boxes()
         event_data["selection_boxes"] = boxes
-        s, writer = self.io_csv_writer()
         if not try_binding(self.extra_begin_ctrl_c_func, event_data):
             return
         if self.selected.type_ in ("cells", "columns"):
-            for rn in range(maxrows):
-                row = []
-                for r1, c1, r2, c2 in boxes:
-                    datarn = (r1 + rn) if self.all_rows_displayed else self.displayed_rows[r1 + rn]
-                    for c in range(c1, c2):
-                        datacn = self.datacn(c)
-                        v = self.get_cell_clipboard(datarn, datacn)
-                        event_data["cells"]["table"][(datarn, datacn)] = v
-                        row.append(v)
-                writer.writerow(row)
+            total = maxrows * sum(c2 - c1 for r1, c1, r2, c2 in boxes)
         else:
-            for r1, c1, r2, c2 in boxes:
-                for rn in range(r2 - r1):
-                    row = []
-                    datarn = (r1 + rn) if self.all_rows_displayed else self.displayed_rows[r1 + rn]
-                    for c in range(c1, c2):
-                        datacn = self.datacn(c)
-                        v = self.get_cell_clipboard(datarn, datacn)
-                        event_data["cells"]["table"][(datarn, datacn)] = v
-                        row.append(v)
-                    writer.writerow(row)
+            total = sum((r2 - r1) * (c2 - c1) for r1, c1, r2, c2 in boxes)
         for r1, c1, r2, c2 in boxes:
             self.show_ctrl_outline(canvas="table", start_cell=(c1, r1), end_cell=(c2, r2))
         self.clipboard_clear()
-        if len(event_data["cells"]["table"]) == 1 and self.PAR.ops.to_clipboard_lineterminator not in next(
-            iter(event_data["cells"]["table"].values())
-        ):
-            self.clipboard_append(next(iter(event_data["cells"]["table"].values())))
-        else:
-            self.clipboard_append(s.getvalue())
+        if isinstance(self.PAR.ops.copy_stream_threshold, int) and total > self.PAR.ops.copy_stream_threshold:
+            # large copies are added to the clipboard a chunk of rows
+            # at a time using after() so the ui stays responsive, the
+            # copied cells are not added to the event data
+            self.copy_stream = self.copy_data(boxes, maxrows, event_data, stream=True)
+            self.after(1, self.copy_stream_step)
+            return
+        return exhaust(self.copy_data(boxes, maxrows, event_data, single=total == 1))
+
+    def copy_data(
+        self,
+        boxes: dict,
+        maxrows: int,
+        event_data: EventDataDict,
+        single: bool = False,
+        stream: bool = False,
+    ) -> Generator[None]:
+        """
+        Appends the copied rows to the clipboard as csv text a chunk
+        of rows at a time, yields after every chunk if stream is True
+        """
+        rows = self.gen_copy_rows(boxes, maxrows, None if stream else event_data["cells"]["table"])
+        if single:
+            row = next(rows)
+            if self.PAR.ops.to_clipboard_lineterminator not in f"{row[0]}":
+                # a single cell is copied without csv quoting
+                self.clipboard_append(f"{row[0]}")
+                rows = iter(())
+            else:
+                rows = chain((row,), rows)
+        s, writer = self.io_csv_writer()
+        chunk = max(1, self.PAR.ops.copy_stream_chunk_rows)
+        while True:
+            writer.writerows(islice(rows, chunk))
+            if not (text := s.getvalue()):
+                break
+            self.clipboard_append(text)
+            s.seek(0)
+            s.truncate()
+            if stream:
+                yield
         self.update_idletasks()
         try_binding(self.extra_end_ctrl_c_func, event_data, new_name="end_ctrl_c")
-        self.PAR.emit_event("<<Copy>>", EventDataDict({**event_data, **{"eventname": "copy"}}))
+        if self.PAR.bound_events["<<Copy>>"]:
+            self.PAR.emit_event("<<Copy>>", EventDataDict({**event_data, **{"eventname": "copy"}}))
         return event_data
 
+    def gen_copy_rows(self, boxes: dict, maxrows: int, cells: dict | None = None) -> Generator[list]:
+        """
+        Yields the clipboard values of each copied row, the
+        values are also added to cells if it is a dict
+        """
+        # each box's data columns and whether they have a format
+        columns = {
+            box: [(datacn, datacn in self.col_options) for datacn in map(self.datacn, range(box[1], box[3]))]
+            for box in boxes
+        }
+        if self.selected.type_ in ("cells", "columns"):
+            rows = ([(self.datarn(box[0] + rn), columns[box]) for box in boxes] for rn in range(maxrows))
+        else:
+            rows = ([(self.datarn(r), columns[box])] for box in boxes for r in range(box[0], box[2]))
+        get_clipboard = self.get_cell_clipboard
+        for parts in rows:
+            row = []
+            for datarn, cols in parts:
+                if datarn >= len(self.data) or datarn in self.row_options:
+                    values = [get_clipboard(datarn, datacn) for datacn, has_ops in cols]
+                else:
+                    data_row = self.data[datarn]
+                    lenrow = len(data_row)
+                    values = [
+                        (
+                            get_clipboard(datarn, datacn)
+                            if has_ops or (datarn, datacn) in self.cell_options
+                            else f"{data_row[datacn]}" if datacn < lenrow else ""
+                        )
+                        for datacn, has_ops in cols
+                    ]
+                if cells is not None:
+                    cells.update(zip(((datarn, datacn) for datacn, has_ops in cols), values))
+                row.extend(values)
+            yield row
+
+    def copy_stream_step(self) -> None:
+        if self.copy_stream is None:
+            return
+        try:
+            next(self.copy_stream)
+        except StopIteration:
+            self.copy_stream = None
+            return
+        self.after(1, self.copy_stream_step)
+
+    def finish_copy(self) -> bool:
+        """
+        Adds the rest of a streaming copy to the clipboard,
+        used before edits so the copy is of the unedited cells
+        """
+        if self.copy_stream is None:
+            return False
+        stream, self.copy_stream = self.copy_stream, None
+        exhaust(stream)
+        return True
+
+    def end_streams(self) -> None:
+        self.finish_copy()
+        self.cancel_paste()
+
+    def cancel_copy(self) -> bool:
+        """
+        Stops a streaming copy and clears
+        the partly copied clipboard
+        """
+        if self.copy_stream is None:
+            return False
+        self.copy_stream.close()
+        self.copy_stream = None
+        self.clipboard_clear()
+        return True
+
     def ctrl_x(self, event=None, validation: bool = True) -> None | EventDataDict:
+        # the clipboard is replaced so a streaming copy is stopped
+        self.cancel_copy()
+        self.cancel_paste()
         if not self.selected:
             return
         event_data = event_dict(
@@ -622,6 +757,7 @@ class MainTable(tk.Canvas):
         s, writer = self.io_csv_writer()
         if not try_binding(self.extra_begin_ctrl_x_func, event_data, "begin_ctrl_x"):
             return
+        proposed = {} if validation and self.bulk_table_edit_validation_func else None
         if self.selected.type_ in ("cells", "columns"):
             for rn in range(maxrows):
                 row = []
@@ -642,12 +778,15 @@ class MainTable(tk.Canvas):
                                 is not None
                             )
                         ):
-                            event_data = self.event_data_set_cell(
-                                datarn,
-                                datacn,
-                                val,
-                                event_data,
-                            )
+                            if proposed is None:
+                                event_data = self.event_data_set_cell(
+                                    datarn,
+                                    datacn,
+                                    val,
+                                    event_data,
+                                )
+                            else:
+                                proposed[(datarn, datacn)] = val
                 writer.writerow(row)
         else:
             for r1, c1, r2, c2 in boxes:
@@ -667,13 +806,18 @@ class MainTable(tk.Canvas):
                                 is not None
                             )
                         ):
-                            event_data = self.event_data_set_cell(
-                                datarn,
-                                datacn,
-                                val,
-                                event_data,
-                            )
+                            if proposed is None:
+                                event_data = self.event_data_set_cell(
+                                    datarn,
+                                    datacn,
+                                    val,
+                                    event_data,
+                                )
+                            else:
+                                proposed[(datarn, datacn)] = val
                     writer.writerow(row)
+        if proposed:
+            event_data = self.bulk_table_edit_validation(proposed, event_data)
         if event_data["cells"]["table"]:
             self.undo_stack.append(pickled_event_dict(event_data))
         self.clipboard_clear()
@@ -694,20 +838,19 @@ class MainTable(tk.Canvas):
         return event_data
 
     def ctrl_v(self, event: object = None, validation: bool = True) -> None | EventDataDict:
+        if self.paste_stream is not None:
+            return
+        self.finish_copy()
         if not self.PAR.ops.paste_can_expand_x and len(self.col_positions) == 1:
             return
         if not self.PAR.ops.paste_can_expand_y and len(self.row_positions) == 1:
             return
-        event_data = event_dict(
-            name="edit_table",
-            sheet=self.PAR.name,
-            widget=self,
-            selected=self.selected,
-        )
+        tile_box = None
         if self.selected:
             selected_r = self.selected.box.from_r
             selected_c = self.selected.box.from_c
             curr_coords = (self.selected.row, self.selected.column)
+            tile_box = self.selection_boxes[self.selected.fill_iid].coords
         elif not self.selected and not self.PAR.ops.paste_can_expand_x and not self.PAR.ops.paste_can_expand_y:
             return
         else:
@@ -722,38 +865,136 @@ class MainTable(tk.Canvas):
                     selected_c, selected_r = 0, len(self.row_positions) - 1
                 curr_coords = (selected_r, selected_c)
         try:
-            data = get_data_from_clipboard(
-                widget=self,
+            data = self.clipboard_get()
+        except Exception:
+            return
+        if isinstance(self.PAR.ops.paste_stream_threshold, int) and len(data) > self.PAR.ops.paste_stream_threshold:
+            # large pastes are parsed and applied a chunk
+            # of rows at a time using after() so the ui
+            # stays responsive, see paste_stream_step()
+            self.paste_stream = self.paste_data(
+                rows=partial(
+                    iter_data_from_str,
+                    data,
+                    delimiters=self.PAR.ops.from_clipboard_delimiters,
+                    lineterminator=self.PAR.ops.to_clipboard_lineterminator,
+                ),
+                selected_r=selected_r,
+                selected_c=selected_c,
+                curr_coords=curr_coords,
+                tile_box=tile_box,
+                validation=validation,
+                chunk=max(1, self.PAR.ops.paste_stream_chunk_rows),
+            )
+            self.after(1, self.paste_stream_step)
+            return
+        try:
+            data = get_data_from_str(
+                data,
                 delimiters=self.PAR.ops.from_clipboard_delimiters,
                 lineterminator=self.PAR.ops.to_clipboard_lineterminator,
             )
         except Exception:
             return
-        new_data_numcols = max(map(len, data))
-        new_data_numrows = len(data)
-        for rn, r in enumerate(data):
-            if len(r) < new_data_numcols:
-                data[rn] += list(repeat("", new_data_numcols - len(r)))
-        if self.selected:
-            (
-                lastbox_r1,
-                lastbox_c1,
-                lastbox_r2,
-                lastbox_c2,
-            ) = self.selection_boxes[self.selected.fill_iid].coords
-            lastbox_numrows = lastbox_r2 - lastbox_r1
-            lastbox_numcols = lastbox_c2 - lastbox_c1
-            if lastbox_numrows > new_data_numrows and not lastbox_numrows % new_data_numrows:
-                nd = []
-                for _ in range(int(lastbox_numrows / new_data_numrows)):
-                    nd.extend(r.copy() for r in data)
-                data.extend(nd)
-                new_data_numrows *= int(lastbox_numrows / new_data_numrows)
-            if lastbox_numcols > new_data_numcols and not lastbox_numcols % new_data_numcols:
-                for rn, r in enumerate(data):
-                    for _ in range(int(lastbox_numcols / new_data_numcols)):
-                        data[rn].extend(r.copy())
-                new_data_numcols *= int(lastbox_numcols / new_data_numcols)
+        return exhaust(
+            self.paste_data(
+                rows=data,
+                selected_r=selected_r,
+                selected_c=selected_c,
+                curr_coords=curr_coords,
+                tile_box=tile_box,
+                validation=validation,
+            )
+        )
+
+    def paste_stream_step(self) -> None:
+        if self.paste_stream is None:
+            return
+        try:
+            stage, done, total = next(self.paste_stream)
+        except StopIteration:
+            self.paste_stream = None
+            return
+        except Exception:
+            self.paste_stream = None
+            raise
+        self.PAR.emit_event(
+            "<<PasteProgress>>",
+            EventDataDict(
+                eventname="paste_progress",
+                sheetname=self.PAR.name,
+                stage=stage,
+                done=done,
+                total=total,
+            ),
+        )
+        self.after(1, self.paste_stream_step)
+
+    def cancel_paste(self) -> bool:
+        """
+        Stops a streaming paste, cells already pasted are kept
+        and added to the undo stack, rows/columns not yet added
+        are not added
+        """
+        if self.paste_stream is None:
+            return False
+        self.paste_stream.close()
+        self.paste_stream = None
+        return True
+
+    def paste_data(
+        self,
+        rows: list[list[str]] | Callable[[], Iterator[list[str]]],
+        selected_r: int,
+        selected_c: int,
+        curr_coords: tuple[int, int],
+        tile_box: tuple[int, int, int, int] | None = None,
+        validation: bool = True,
+        chunk: int | None = None,
+    ) -> Generator[tuple[str, int, int | None], None, None | EventDataDict]:
+        """
+        When chunk is an int rows is a function returning a new
+        iterator of the rows, the rows are counted then parsed again
+        and pasted chunk rows at a time, yielding (stage, rows done,
+        total rows) between, so only the rows pasted so far are held
+        The data is repeated to fill tile_box if it fits exactly
+        """
+        if chunk is None:
+            numrows = len(rows)
+            numcols = max(map(len, rows), default=0)
+            source = rows
+        else:
+            numrows = numcols = 0
+            try:
+                for numrows, row in enumerate(rows(), 1):
+                    if len(row) > numcols:
+                        numcols = len(row)
+                    if not numrows % chunk:
+                        yield "parse", numrows, None
+            except Exception:
+                # the clipboard could not be parsed
+                return
+            source = rows()
+        if not numrows:
+            return
+        event_data = event_dict(
+            name="edit_table",
+            sheet=self.PAR.name,
+            widget=self,
+            selected=self.selected,
+        )
+        row_tiles = col_tiles = 1
+        if tile_box is not None:
+            lastbox_numrows = tile_box[2] - tile_box[0]
+            lastbox_numcols = tile_box[3] - tile_box[1]
+            if lastbox_numrows > numrows and not lastbox_numrows % numrows:
+                row_tiles = lastbox_numrows // numrows
+            if numcols and lastbox_numcols > numcols and not lastbox_numcols % numcols:
+                col_tiles = lastbox_numcols // numcols
+        new_data_numrows = numrows * row_tiles
+        new_data_numcols = numcols * col_tiles
+        tiled = tiled_rows(source, numcols, row_tiles, col_tiles)
+        data = list(tiled) if chunk is None else []
         event_data["data"] = data
         added_rows = 0
         added_cols = 0
@@ -795,8 +1036,32 @@ class MainTable(tk.Canvas):
             ): "cells"
         }
         event_data["selection_boxes"] = boxes
+        if self.extra_begin_ctrl_v_func or (validation and self.bulk_table_edit_validation_func):
+            # these are given the whole paste
+            data.extend(tiled)
         if not try_binding(self.extra_begin_ctrl_v_func, event_data, "begin_ctrl_v"):
             return
+        rejected = set()
+        if validation and self.bulk_table_edit_validation_func:
+            # keys are the data indexes the cells will have once
+            # any rows/columns have been added to the end of the sheet
+            datarns = [self.datarn(r) for r in range(selected_r, selected_r_adjusted_new_data_numrows)]
+            datarns.extend(range(len(self.data), len(self.data) + added_rows))
+            datacns = [self.datacn(c) for c in range(selected_c, selected_c_adjusted_new_data_numcols)]
+            if added_cols:
+                datacns.extend(range(total_data_cols, total_data_cols + added_cols))
+            proposed = {
+                (datarn, datacn): data[ndr][ndc]
+                for ndr, datarn in enumerate(datarns)
+                for ndc, datacn in enumerate(datacns)
+            }
+            validated = self.run_bulk_table_edit_validation(proposed, event_data)
+            for ndr, datarn in enumerate(datarns):
+                for ndc, datacn in enumerate(datacns):
+                    if (datarn, datacn) in validated:
+                        data[ndr][ndc] = validated[(datarn, datacn)]
+                    else:
+                        rejected.add((ndr, ndc))
         # the order of actions here is important:
         # edit existing sheet (not including any added rows/columns)
 
@@ -804,140 +1069,180 @@ class MainTable(tk.Canvas):
         # create empty rows/columns dicts for any added rows/columns
         # edit those dicts with so far unused cells of data from clipboard
         # instead of editing table using set cell data, add any new rows then columns with pasted data
-        for ndr, r in enumerate(range(selected_r, selected_r_adjusted_new_data_numrows)):
-            for ndc, c in enumerate(range(selected_c, selected_c_adjusted_new_data_numcols)):
-                val = data[ndr][ndc]
-                if (
-                    not self.edit_validation_func
-                    or not validation
-                    or (
-                        self.edit_validation_func
-                        and (val := self.edit_validation_func(mod_event_val(event_data, val, (r, c)))) is not None
-                    )
-                ):
-                    event_data = self.event_data_set_cell(
-                        datarn=self.datarn(r),
-                        datacn=self.datacn(c),
-                        value=val,
-                        event_data=event_data,
-                    )
-        if added_rows:
-            ctr = 0
-            data_ins_row = len(self.data)
-            displayed_ins_row = len(self.row_positions) - 1
-            if total_data_cols is None:
-                total_data_cols = self.total_data_cols()
-            rows, index, row_heights = self.get_args_for_add_rows(
-                data_ins_row=data_ins_row,
-                displayed_ins_row=displayed_ins_row,
-                numrows=added_rows,
-                total_data_cols=total_data_cols,
-            )
-            for ndr, r in zip(
-                range(
-                    adjusted_new_data_numrows,
-                    new_data_numrows,
-                ),
-                reversed(rows),
-            ):
-                for ndc, c in enumerate(
-                    range(
-                        selected_c,
-                        selected_c_adjusted_new_data_numcols,
-                    )
-                ):
+
+        # the end row of the cells pasted so far, for a streaming paste which is cancelled
+        pasted_r = selected_r
+        try:
+            for ndr, r in enumerate(range(selected_r, selected_r_adjusted_new_data_numrows)):
+                if ndr == len(data):
+                    data.extend(islice(tiled, chunk))
+                for ndc, c in enumerate(range(selected_c, selected_c_adjusted_new_data_numcols)):
+                    if rejected and (ndr, ndc) in rejected:
+                        continue
                     val = data[ndr][ndc]
-                    datacn = self.datacn(c)
                     if (
                         not self.edit_validation_func
                         or not validation
                         or (
                             self.edit_validation_func
                             and (val := self.edit_validation_func(mod_event_val(event_data, val, (r, c)))) is not None
-                            and self.input_valid_for_cell(r, datacn, val, ignore_empty=True)
                         )
                     ):
-                        rows[r][datacn] = val
-                        ctr += 1
-            if ctr:
-                event_data = self.add_rows(
-                    rows=rows,
-                    index=index,
-                    row_heights=row_heights,
-                    event_data=event_data,
-                    mod_event_boxes=False,
-                )
-        if added_cols:
-            ctr = 0
-            if total_data_cols is None:
-                total_data_cols = self.total_data_cols()
-            data_ins_col = total_data_cols
-            displayed_ins_col = len(self.col_positions) - 1
-            columns, headers, column_widths = self.get_args_for_add_columns(
-                data_ins_col=data_ins_col,
-                displayed_ins_col=displayed_ins_col,
-                numcols=added_cols,
-            )
-            # only add the extra rows if expand_y is allowed
-            if self.PAR.ops.paste_can_expand_x and self.PAR.ops.paste_can_expand_y:
-                endrow = selected_r + new_data_numrows
-            else:
-                endrow = selected_r + adjusted_new_data_numrows
-            for ndr, r in enumerate(
-                range(
-                    selected_r,
-                    endrow,
+                        event_data = self.event_data_set_cell(
+                            datarn=self.datarn(r),
+                            datacn=self.datacn(c),
+                            value=val,
+                            event_data=event_data,
+                        )
+                if chunk and not (ndr + 1) % chunk:
+                    pasted_r = r + 1
+                    yield "paste", ndr + 1, new_data_numrows
+            pasted_r = selected_r_adjusted_new_data_numrows
+            data.extend(tiled)
+            if added_rows:
+                ctr = 0
+                data_ins_row = len(self.data)
+                displayed_ins_row = len(self.row_positions) - 1
+                if total_data_cols is None:
+                    total_data_cols = self.total_data_cols()
+                rows, index, row_heights = self.get_args_for_add_rows(
+                    data_ins_row=data_ins_row,
+                    displayed_ins_row=displayed_ins_row,
+                    numrows=added_rows,
+                    total_data_cols=total_data_cols,
                 )
-            ):
-                for ndc, c in zip(
+                for ndr, r in zip(
                     range(
-                        adjusted_new_data_numcols,
-                        new_data_numcols,
+                        adjusted_new_data_numrows,
+                        new_data_numrows,
                     ),
-                    reversed(columns),
+                    reversed(rows),
                 ):
-                    val = data[ndr][ndc]
-                    datarn = self.datarn(r)
-                    if (
-                        not self.edit_validation_func
-                        or not validation
-                        or (
-                            self.edit_validation_func
-                            and (val := self.edit_validation_func(mod_event_val(event_data, val, (r, c)))) is not None
-                            and self.input_valid_for_cell(datarn, c, val, ignore_empty=True)
+                    for ndc, c in enumerate(
+                        range(
+                            selected_c,
+                            selected_c_adjusted_new_data_numcols,
                         )
                     ):
-                        columns[c][datarn] = val
-                        ctr += 1
-            if ctr:
-                event_data = self.add_columns(
-                    columns=columns,
-                    header=headers,
-                    column_widths=column_widths,
-                    event_data=event_data,
-                    mod_event_boxes=False,
+                        if rejected and (ndr, ndc) in rejected:
+                            continue
+                        val = data[ndr][ndc]
+                        datacn = self.datacn(c)
+                        if (
+                            not self.edit_validation_func
+                            or not validation
+                            or (
+                                self.edit_validation_func
+                                and (val := self.edit_validation_func(mod_event_val(event_data, val, (r, c))))
+                                is not None
+                                and self.input_valid_for_cell(r, datacn, val, ignore_empty=True)
+                            )
+                        ):
+                            rows[r][datacn] = val
+                            ctr += 1
+                    if chunk and not (ndr + 1) % chunk:
+                        yield "paste", ndr + 1, new_data_numrows
+                if ctr:
+                    event_data = self.add_rows(
+                        rows=rows,
+                        index=index,
+                        row_heights=row_heights,
+                        event_data=event_data,
+                        mod_event_boxes=False,
+                    )
+                    pasted_r = selected_r + new_data_numrows
+            if added_cols:
+                ctr = 0
+                if total_data_cols is None:
+                    total_data_cols = self.total_data_cols()
+                data_ins_col = total_data_cols
+                displayed_ins_col = len(self.col_positions) - 1
+                columns, headers, column_widths = self.get_args_for_add_columns(
+                    data_ins_col=data_ins_col,
+                    displayed_ins_col=displayed_ins_col,
+                    numcols=added_cols,
                 )
-        if added_rows:
-            selboxr = selected_r + new_data_numrows
-        else:
-            selboxr = selected_r_adjusted_new_data_numrows
-        if added_cols:
-            selboxc = selected_c + new_data_numcols
-        else:
+                # only add the extra rows if expand_y is allowed
+                if self.PAR.ops.paste_can_expand_x and self.PAR.ops.paste_can_expand_y:
+                    endrow = selected_r + new_data_numrows
+                else:
+                    endrow = selected_r + adjusted_new_data_numrows
+                for ndr, r in enumerate(
+                    range(
+                        selected_r,
+                        endrow,
+                    )
+                ):
+                    for ndc, c in zip(
+                        range(
+                            adjusted_new_data_numcols,
+                            new_data_numcols,
+                        ),
+                        reversed(columns),
+                    ):
+                        if rejected and (ndr, ndc) in rejected:
+                            continue
+                        val = data[ndr][ndc]
+                        datarn = self.datarn(r)
+                        if (
+                            not self.edit_validation_func
+                            or not validation
+                            or (
+                                self.edit_validation_func
+                                and (val := self.edit_validation_func(mod_event_val(event_data, val, (r, c))))
+                                is not None
+                                and self.input_valid_for_cell(datarn, c, val, ignore_empty=True)
+                            )
+                        ):
+                            columns[c][datarn] = val
+                            ctr += 1
+                    if chunk and not (ndr + 1) % chunk:
+                        yield "paste_columns", ndr + 1, endrow - selected_r
+                if ctr:
+                    event_data = self.add_columns(
+                        columns=columns,
+                        header=headers,
+                        column_widths=column_widths,
+                        event_data=event_data,
+                        mod_event_boxes=False,
+                    )
+        except GeneratorExit:
+            # streaming paste cancelled, keep and select only what has been pasted so far,
+            # columns not yet added are not added
+            if not (event_data["cells"]["table"] or event_data["added"]["rows"]):
+                return
+            selboxr = pasted_r
             selboxc = selected_c_adjusted_new_data_numcols
+        except Exception:
+            # cells pasted before the error can still be undone
+            if event_data["cells"]["table"] or event_data["added"]["rows"] or event_data["added"]["columns"]:
+                self.undo_stack.append(pickled_event_dict(event_data))
+                self.refresh()
+                self.sheet_modified(event_data)
+            raise
+        else:
+            if added_rows:
+                selboxr = selected_r + new_data_numrows
+            else:
+                selboxr = selected_r_adjusted_new_data_numrows
+            if added_cols:
+                selboxc = selected_c + new_data_numcols
+            else:
+                selboxc = selected_c_adjusted_new_data_numcols
         self.deselect("all", redraw=False)
-        self.set_currently_selected(
-            *curr_coords,
-            item=self.create_selection_box(
-                selected_r,
-                selected_c,
-                selboxr,
-                selboxc,
-                type_="cells",
-                set_current=False,
-                run_binding=True,
-            ),
-        )
+        if selboxr > selected_r and selboxc > selected_c:
+            self.set_currently_selected(
+                *curr_coords,
+                item=self.create_selection_box(
+                    selected_r,
+                    selected_c,
+                    selboxr,
+                    selboxc,
+                    type_="cells",
+                    set_current=False,
+                    run_binding=True,
+                ),
+            )
         event_data["selection_boxes"] = self.get_boxes()
         event_data["selected"] = self.selected
         if event_data["cells"]["table"] or event_data["added"]["rows"] or event_data["added"]["columns"]:
@@ -959,6 +1264,7 @@ class MainTable(tk.Canvas):
         return event_data
 
     def delete_key(self, event: object = None, validation: bool = True) -> None | EventDataDict:
+        self.end_streams()
         if not self.selected:
             return
         event_data = event_dict(
@@ -971,6 +1277,7 @@ class MainTable(tk.Canvas):
         event_data["selection_boxes"] = boxes
         if not try_binding(self.extra_begin_delete_key_func, event_data, "begin_delete"):
             return
+        proposed = {} if validation and self.bulk_table_edit_validation_func else None
         for r1, c1, r2, c2 in boxes:
             for r in range(r1, r2):
                 for c in range(c1, c2):
@@ -984,12 +1291,17 @@ class MainTable(tk.Canvas):
                             and (val := self.edit_validation_func(mod_event_val(event_data, val, (r, c)))) is not None
                         )
                     ):
-                        event_data = self.event_data_set_cell(
-                            datarn,
-                            datacn,
-                            val,
-                            event_data,
-                        )
+                        if proposed is None:
+                            event_data = self.event_data_set_cell(
+                                datarn,
+                                datacn,
+                                val,
+                                event_data,
+                            )
+                        else:
+                            proposed[(datarn, datacn)] = val
+        if proposed:
+            event_data = self.bulk_table_edit_validation(proposed, event_data)
         if event_data["cells"]["table"]:
             self.undo_stack.append(pickled_event_dict(event_data))
             try_binding(self.extra_end_delete_key_func, event_data, "end_delete")
@@ -1004,6 +1316,25 @@ class MainTable(tk.Canvas):
             self.set_cell_data(datarn, datacn, value)
         return event_data
 
+    def run_bulk_table_edit_validation(self, proposed: dict, event_data: EventDataDict) -> dict:
+        """
+        Calls the bulk validation function once with every proposed
+        {(data row, data column): value} change in event_data.value,
+        returns only the changes it accepted
+        """
+        event_data.value = proposed
+        event_data.loc, event_data.row, event_data.column = tuple(), None, None
+        validated = self.bulk_table_edit_validation_func(event_data)
+        event_data.value = None
+        if not validated:
+            return {}
+        return {k: v for k, v in validated.items() if k in proposed}
+
+    def bulk_table_edit_validation(self, proposed: dict, event_data: EventDataDict) -> EventDataDict:
+        for (datarn, datacn), val in self.run_bulk_table_edit_validation(proposed, event_data).items():
+            event_data = self.event_data_set_cell(datarn, datacn, val, event_data)
+        return event_data
+
     def get_args_for_move_columns(
         self,
         move_to: int,
@@ -1046,6 +1377,7 @@ class MainTable(tk.Canvas):
         event_data: EventDataDict | None = None,
     ) -> tuple[dict[int, int], dict[int, int], EventDataDict]:
         self.saved_column_widths = {}
+        self.reset_column_caches()
         if not isinstance(totalcols, int):
             totalcols = max(data_new_idxs.values(), default=0)
             if totalcols:
@@ -1063,22 +1395,15 @@ class MainTable(tk.Canvas):
                 "data": data_new_idxs,
                 "displayed": {} if disp_new_idxs is None else disp_new_idxs,
             }
-        event_data["options"] = self.pickle_options()
+        column_spans = any(isinstance(span["from_c"], int) for span in self.named_spans.values())
+        if column_spans:
+            # named spans over columns can add and remove options,
+            # otherwise moving the columns back restores the options
+            event_data["options"] = self.pickle_options()
         event_data["named_spans"] = {k: span.pickle_self() for k, span in self.named_spans.items()}
         if move_widths and disp_new_idxs and (not data_indexes or self.all_columns_displayed):
             self.deselect("all", run_binding=False, redraw=False)
-            self.set_col_positions(
-                itr=move_elements_by_mapping(
-                    self.get_column_widths(),
-                    disp_new_idxs,
-                    dict(
-                        zip(
-                            disp_new_idxs.values(),
-                            disp_new_idxs,
-                        )
-                    ),
-                )
-            )
+            self.move_positions(self.col_positions, disp_new_idxs)
             if create_selections:
                 for boxst, boxend in consecutive_ranges(sorted(disp_new_idxs.values())):
                     self.create_selection_box(
@@ -1090,37 +1415,31 @@ class MainTable(tk.Canvas):
                         run_binding=True,
                     )
         if move_data:
-            self.data = list(
-                map(
-                    move_elements_by_mapping,
-                    self.data,
-                    repeat(data_new_idxs),
-                    repeat(data_old_idxs),
-                ),
-            )
+            lo, hi, rel_new_idxs, rel_old_idxs = moved_range(data_new_idxs)
+            for row in self.data:
+                row[lo:hi] = move_elements_by_mapping(row[lo:hi], rel_new_idxs, rel_old_idxs)
             maxidx = len_to_idx(totalcols)
             self.CH.fix_header(maxidx)
             if isinstance(self._headers, list) and self._headers:
-                self._headers = move_elements_by_mapping(self._headers, data_new_idxs, data_old_idxs)
-            maxidx = self.get_max_column_idx(maxidx)
-            full_new_idxs = self.get_full_new_idxs(
-                max_idx=maxidx,
-                new_idxs=data_new_idxs,
-                old_idxs=data_old_idxs,
-            )
-            full_old_idxs = dict(zip(full_new_idxs.values(), full_new_idxs))
-            self.tagged_cells = {
-                tags: {(k[0], full_new_idxs[k[1]]) for k in tagged} for tags, tagged in self.tagged_cells.items()
-            }
-            self.cell_options = {(k[0], full_new_idxs[k[1]]): v for k, v in self.cell_options.items()}
-            self.progress_bars = {(k[0], full_new_idxs[k[1]]): v for k, v in self.progress_bars.items()}
-            self.col_options = {full_new_idxs[k]: v for k, v in self.col_options.items()}
-            self.tagged_columns = {
-                tags: {full_new_idxs[k] for k in tagged} for tags, tagged in self.tagged_columns.items()
-            }
-            self.CH.cell_options = {full_new_idxs[k]: v for k, v in self.CH.cell_options.items()}
-            self.displayed_columns = sorted(full_new_idxs[k] for k in self.displayed_columns)
-            if self.named_spans:
+                move_elements_in_range(self._headers, data_new_idxs)
+            if column_spans:
+                full_new_idxs = self.get_full_new_idxs(
+                    max_idx=self.get_max_column_idx(maxidx),
+                    new_idxs=data_new_idxs,
+                    old_idxs=data_old_idxs,
+                )
+                full_old_idxs = dict(zip(full_new_idxs.values(), full_new_idxs))
+            # only the columns between the lowest and highest
+            # moved index change, options are moved in place
+            new_idxs = changed_idxs(data_new_idxs)
+            remap_tagged(self.tagged_cells, new_idxs, axis=1)
+            remap_cell_keys(self.cell_options, new_idxs, axis=1)
+            remap_cell_keys(self.progress_bars, new_idxs, axis=1)
+            remap_keys(self.col_options, new_idxs)
+            remap_tagged(self.tagged_columns, new_idxs)
+            remap_keys(self.CH.cell_options, new_idxs)
+            self.displayed_columns = self.remap_displayed(self.displayed_columns, new_idxs)
+            if column_spans:
                 totalrows = self.total_data_rows()
                 new_ops = self.PAR.create_options_from_span
                 qkspan = self.span()
@@ -1278,6 +1597,7 @@ class MainTable(tk.Canvas):
         event_data: EventDataDict | None = None,
     ) -> tuple[dict[int, int], dict[int, int], EventDataDict]:
         self.saved_row_heights = {}
+        self.reset_column_caches()
         if not isinstance(totalrows, int):
             totalrows = max(
                 self.total_data_rows(),
@@ -1297,22 +1617,15 @@ class MainTable(tk.Canvas):
                 "data": data_new_idxs,
                 "displayed": {} if disp_new_idxs is None else disp_new_idxs,
             }
-        event_data["options"] = self.pickle_options()
+        row_spans = any(isinstance(span["from_r"], int) for span in self.named_spans.values())
+        if row_spans:
+            # named spans over rows can add and remove options,
+            # otherwise moving the rows back restores the options
+            event_data["options"] = self.pickle_options()
         event_data["named_spans"] = {k: span.pickle_self() for k, span in self.named_spans.items()}
         if move_heights and disp_new_idxs and (not data_indexes or self.all_rows_displayed):
             self.deselect("all", run_binding=False, redraw=False)
-            self.set_row_positions(
-                itr=move_elements_by_mapping(
-                    self.get_row_heights(),
-                    disp_new_idxs,
-                    dict(
-                        zip(
-                            disp_new_idxs.values(),
-                            disp_new_idxs,
-                        )
-                    ),
-                )
-            )
+            self.move_positions(self.row_positions, disp_new_idxs)
             if create_selections:
                 for boxst, boxend in consecutive_ranges(sorted(disp_new_idxs.values())):
                     self.create_selection_box(
@@ -1324,33 +1637,32 @@ class MainTable(tk.Canvas):
                         run_binding=True,
                     )
         if move_data:
-            self.data = move_elements_by_mapping(
-                self.data,
-                data_new_idxs,
-                data_old_idxs,
-            )
+            move_elements_in_range(self.data, data_new_idxs)
             maxidx = len_to_idx(totalrows)
             self.RI.fix_index(maxidx)
             if isinstance(self._row_index, list) and self._row_index:
-                self._row_index = move_elements_by_mapping(self._row_index, data_new_idxs, data_old_idxs)
-            maxidx = self.get_max_row_idx(maxidx)
-            full_new_idxs = self.get_full_new_idxs(
-                max_idx=maxidx,
-                new_idxs=data_new_idxs,
-                old_idxs=data_old_idxs,
-            )
-            full_old_idxs = dict(zip(full_new_idxs.values(), full_new_idxs))
-            self.tagged_cells = {
-                tags: {(full_new_idxs[k[0]], k[1]) for k in tagged} for tags, tagged in self.tagged_cells.items()
-            }
-            self.cell_options = {(full_new_idxs[k[0]], k[1]): v for k, v in self.cell_options.items()}
-            self.progress_bars = {(full_new_idxs[k[0]], k[1]): v for k, v in self.progress_bars.items()}
-            self.tagged_rows = {tags: {full_new_idxs[k] for k in tagged} for tags, tagged in self.tagged_rows.items()}
-            self.row_options = {full_new_idxs[k]: v for k, v in self.row_options.items()}
-            self.RI.cell_options = {full_new_idxs[k]: v for k, v in self.RI.cell_options.items()}
-            self.RI.tree_rns = {v: full_new_idxs[k] for v, k in self.RI.tree_rns.items()}
-            self.displayed_rows = sorted(full_new_idxs[k] for k in self.displayed_rows)
-            if self.named_spans:
+                move_elements_in_range(self._row_index, data_new_idxs)
+            if row_spans:
+                full_new_idxs = self.get_full_new_idxs(
+                    max_idx=self.get_max_row_idx(maxidx),
+                    new_idxs=data_new_idxs,
+                    old_idxs=data_old_idxs,
+                )
+                full_old_idxs = dict(zip(full_new_idxs.values(), full_new_idxs))
+            # only the rows between the lowest and highest
+            # moved index change, options are moved in place
+            new_idxs = changed_idxs(data_new_idxs)
+            remap_tagged(self.tagged_cells, new_idxs, axis=0)
+            remap_cell_keys(self.cell_options, new_idxs, axis=0)
+            remap_cell_keys(self.progress_bars, new_idxs, axis=0)
+            remap_tagged(self.tagged_rows, new_idxs)
+            remap_keys(self.row_options, new_idxs)
+            remap_keys(self.RI.cell_options, new_idxs)
+            for iid, datarn in self.RI.tree_rns.items():
+                if datarn in new_idxs:
+                    self.RI.tree_rns[iid] = new_idxs[datarn]
+            self.displayed_rows = self.remap_displayed(self.displayed_rows, new_idxs)
+            if row_spans:
                 totalcols = self.total_data_cols()
                 new_ops = self.PAR.create_options_from_span
                 qkspan = self.span()
@@ -1450,6 +1762,32 @@ class MainTable(tk.Canvas):
                     span["from_r"], span["upto_r"] = newfrom, newupto
         return data_new_idxs, disp_new_idxs, event_data
 
+    def move_positions(self, positions: list[float], disp_new_idxs: dict[int, int]) -> None:
+        """
+        Moves row heights or column widths by {old displayed index:
+        new displayed index}, only the positions between the lowest
+        and highest moved index are rewritten
+        """
+        lo, hi, rel_new_idxs, rel_old_idxs = moved_range(disp_new_idxs)
+        sizes = move_elements_by_mapping(
+            [positions[i + 1] - positions[i] for i in range(lo, hi)],
+            rel_new_idxs,
+            rel_old_idxs,
+        )
+        for i, pos in enumerate(accumulate(sizes, initial=positions[lo]), lo):
+            positions[i] = pos
+
+    def remap_displayed(self, displayed: list[int], new_idxs: dict[int, int]) -> list[int]:
+        if not new_idxs:
+            return displayed
+        if any(map(gt, displayed, islice(displayed, 1, None))):
+            return sorted(new_idxs.get(k, k) for k in displayed)
+        # ascending, only the moved range changes
+        start = bisect_left(displayed, min(new_idxs))
+        end = bisect_right(displayed, max(new_idxs))
+        displayed[start:end] = sorted(new_idxs.get(k, k) for k in islice(displayed, start, end))
+        return displayed
+
     def get_max_row_idx(self, maxidx: int | None = None) -> int:
         if maxidx is None:
             maxidx = len_to_idx(self.total_data_rows())
@@ -1462,7 +1800,8 @@ class MainTable(tk.Canvas):
             max(map(max, self.tagged_rows.values()), default=maxidx),
             max((d.from_r for d in self.named_spans.values() if isinstance(d.from_r, int)), default=maxidx),
             max((d.upto_r for d in self.named_spans.values() if isinstance(d.upto_r, int)), default=maxidx),
-            self.displayed_rows[-1] if self.displayed_rows else maxidx,
+            # displayed rows can be out of order when sorted by a view
+            max(self.displayed_rows, default=maxidx),
         )
 
     def get_full_new_idxs(
@@ -1485,7 +1824,186 @@ class MainTable(tk.Canvas):
             )
         )
 
+    def sort_rows(
+        self,
+        by_columns: Sequence[int],
+        key: Callable | None = None,
+        reverse: bool = False,
+    ) -> EventDataDict:
+        self.end_streams()
+        event_data = event_dict(
+            name="sort_rows",
+            sheet=self.PAR.name,
+            widget=self,
+            boxes=self.get_boxes(),
+            selected=self.selected,
+        )
+        columns = [self.get_column_values(datacn, len(self.data)) for datacn in by_columns]
+        new_order = sort_permutation(columns, key=key, reverse=reverse)
+        if any(
+            isinstance(span.from_r, int) and (span.from_r or span.upto_r is not None)
+            for span in self.named_spans.values()
+        ):
+            # named spans over some of the rows can't be permuted, they
+            # have to be adjusted the same way as moving rows does
+            data_new_idxs = {old: new for new, old in enumerate(new_order) if old != new}
+            disp_new_idxs = None
+            if self.all_rows_displayed:
+                disp_new_idxs = {old: new for old, new in data_new_idxs.items() if old < len(self.row_positions) - 1}
+            _, _, event_data = self.move_rows_adjust_options_dict(
+                data_new_idxs=data_new_idxs,
+                data_old_idxs=dict(zip(data_new_idxs.values(), data_new_idxs)),
+                totalrows=None,
+                disp_new_idxs=disp_new_idxs,
+                create_selections=False,
+                event_data=event_data,
+            )
+            event_data["moved"]["rows"] = {
+                "data": data_new_idxs,
+                "displayed": {} if disp_new_idxs is None else disp_new_idxs,
+            }
+            return event_data
+        return self.permute_rows(new_order, event_data)
+
+    def sort_columns(
+        self,
+        by_rows: Sequence[int],
+        key: Callable | None = None,
+        reverse: bool = False,
+    ) -> EventDataDict:
+        self.end_streams()
+        event_data = event_dict(
+            name="sort_columns",
+            sheet=self.PAR.name,
+            widget=self,
+            boxes=self.get_boxes(),
+            selected=self.selected,
+        )
+        totalcols = self.equalize_data_row_lengths()
+        if self.cell_options or self.row_options or self.col_options:
+            rows = [[self.get_cell_data(datarn, datacn) for datacn in range(totalcols)] for datarn in by_rows]
+        else:
+            rows = [self.data[datarn] if datarn < len(self.data) else [""] * totalcols for datarn in by_rows]
+        new_order = sort_permutation(rows, key=key, reverse=reverse)
+        if any(
+            isinstance(span.from_c, int) and (span.from_c or span.upto_c is not None)
+            for span in self.named_spans.values()
+        ):
+            data_new_idxs = {old: new for new, old in enumerate(new_order) if old != new}
+            disp_new_idxs = None
+            if self.all_columns_displayed:
+                disp_new_idxs = {old: new for old, new in data_new_idxs.items() if old < len(self.col_positions) - 1}
+            _, _, event_data = self.move_columns_adjust_options_dict(
+                data_new_idxs=data_new_idxs,
+                data_old_idxs=dict(zip(data_new_idxs.values(), data_new_idxs)),
+                totalcols=totalcols,
+                disp_new_idxs=disp_new_idxs,
+                create_selections=False,
+                event_data=event_data,
+            )
+            event_data["moved"]["columns"] = {
+                "data": data_new_idxs,
+                "displayed": {} if disp_new_idxs is None else disp_new_idxs,
+            }
+            return event_data
+        return self.permute_columns(new_order, event_data)
+
+    def permute_rows(self, new_order: list[int], event_data: EventDataDict) -> EventDataDict:
+        """
+        Puts data row new_order[i] at data row i, the index, options,
+        tags and row heights move with their rows, rows past the
+        end of new_order are not moved
+        """
+        n = len(new_order)
+        new_idxs = invert_permutation(new_order)
+        self.saved_row_heights = {}
+        self.data[:n] = [self.data[datarn] for datarn in new_order]
+        if isinstance(self._row_index, list) and self._row_index:
+            self.RI.fix_index(n - 1)
+            self._row_index[:n] = [self._row_index[datarn] for datarn in new_order]
+        self.tagged_cells = {
+            tags: {(new_idxs[r] if r < n else r, c) for r, c in tagged} for tags, tagged in self.tagged_cells.items()
+        }
+        self.cell_options = {(new_idxs[r] if r < n else r, c): v for (r, c), v in self.cell_options.items()}
+        self.progress_bars = {(new_idxs[r] if r < n else r, c): v for (r, c), v in self.progress_bars.items()}
+        self.tagged_rows = {
+            tags: {new_idxs[r] if r < n else r for r in tagged} for tags, tagged in self.tagged_rows.items()
+        }
+        self.row_options = {new_idxs[r] if r < n else r: v for r, v in self.row_options.items()}
+        self.RI.cell_options = {new_idxs[r] if r < n else r: v for r, v in self.RI.cell_options.items()}
+        self.RI.tree_rns = {iid: new_idxs[r] if r < n else r for iid, r in self.RI.tree_rns.items()}
+        for keys in self.sort_key_cache.values():
+            keys[:n] = [keys[r] for r in new_order]
+        self.value_index_cache = {
+            k: (
+                totalrows,
+                {v: sorted(new_idxs[r] if r < n else r for r in rows) for v, rows in index.items()},
+            )
+            for k, (totalrows, index) in self.value_index_cache.items()
+        }
+        self.found_cells = {(new_idxs[r] if r < n else r, c): v for (r, c), v in self.found_cells.items()}
+        if self.all_rows_displayed:
+            heights = self.get_row_heights()
+            if len(heights) < n:
+                # rows which have no height yet have the default height
+                moved = heights + [self.get_default_row_height()] * (n - len(heights))
+                heights = [moved[r] for r in new_order[: len(heights)]]
+            else:
+                heights[:n] = [heights[r] for r in new_order]
+            self.set_row_positions(itr=heights)
+        else:
+            heights = dict(zip(self.displayed_rows, self.get_row_heights()))
+            if self.rows_view_ordered():
+                # a view order from view_rows() keeps showing the same rows in the same order
+                self.displayed_rows = [new_idxs[r] if r < n else r for r in self.displayed_rows]
+            else:
+                self.displayed_rows = sorted(new_idxs[r] if r < n else r for r in self.displayed_rows)
+            self.set_row_positions(itr=(heights[new_order[r] if r < n else r] for r in self.displayed_rows))
+        event_data["sorted"]["rows"] = new_order
+        return event_data
+
+    def permute_columns(self, new_order: list[int], event_data: EventDataDict) -> EventDataDict:
+        """
+        Puts data column new_order[i] at data column i, the header,
+        options, tags and column widths move with their columns,
+        columns past the end of new_order are not moved
+        """
+        n = len(new_order)
+        new_idxs = invert_permutation(new_order)
+        self.saved_column_widths = {}
+        self.reset_column_caches()
+        for row in self.data:
+            row[:n] = [row[datacn] for datacn in new_order]
+        if isinstance(self._headers, list) and self._headers:
+            self.CH.fix_header(n - 1)
+            self._headers[:n] = [self._headers[datacn] for datacn in new_order]
+        self.tagged_cells = {
+            tags: {(r, new_idxs[c] if c < n else c) for r, c in tagged} for tags, tagged in self.tagged_cells.items()
+        }
+        self.cell_options = {(r, new_idxs[c] if c < n else c): v for (r, c), v in self.cell_options.items()}
+        self.progress_bars = {(r, new_idxs[c] if c < n else c): v for (r, c), v in self.progress_bars.items()}
+        self.tagged_columns = {
+            tags: {new_idxs[c] if c < n else c for c in tagged} for tags, tagged in self.tagged_columns.items()
+        }
+        self.col_options = {new_idxs[c] if c < n else c: v for c, v in self.col_options.items()}
+        self.CH.cell_options = {new_idxs[c] if c < n else c: v for c, v in self.CH.cell_options.items()}
+        if self.all_columns_displayed:
+            widths = self.get_column_widths()
+            if len(widths) < n:
+                moved = widths + [self.PAR.ops.default_column_width] * (n - len(widths))
+                widths = [moved[c] for c in new_order[: len(widths)]]
+            else:
+                widths[:n] = [widths[c] for c in new_order]
+            self.set_col_positions(itr=widths)
+        else:
+            widths = dict(zip(self.displayed_columns, self.get_column_widths()))
+            self.displayed_columns = sorted(new_idxs[c] if c < n else c for c in self.displayed_columns)
+            self.set_col_positions(itr=(widths[new_order[c] if c < n else c] for c in self.displayed_columns))
+        event_data["sorted"]["columns"] = new_order
+        return event_data
+
     def undo(self, event: object = None) -> None | EventDataDict:
+        self.end_streams()
         if not self.undo_stack:
             return
         modification = decompress_load(self.undo_stack[-1]["data"])
@@ -1500,6 +2018,7 @@ class MainTable(tk.Canvas):
         return event_data
 
     def redo(self, event: object = None) -> None | EventDataDict:
+        self.end_streams()
         if not self.redo_stack:
             return
         modification = decompress_load(self.redo_stack[-1]["data"])
@@ -1573,6 +2092,12 @@ class MainTable(tk.Canvas):
             event_data = self.save_cells_using_modification(modification, event_data)
             saved_cells = True
 
+        if modification["sorted"]["columns"]:
+            event_data = self.permute_columns(invert_permutation(modification["sorted"]["columns"]), event_data)
+
+        if modification["sorted"]["rows"]:
+            event_data = self.permute_rows(invert_permutation(modification["sorted"]["rows"]), event_data)
+
         if modification["moved"]["columns"]:
             totalcols = max(self.equalize_data_row_lengths(), max(modification["moved"]["columns"]["data"].values()))
             data_new_idxs, disp_new_idxs, event_data = self.move_columns_adjust_options_dict(
@@ -1673,7 +2198,7 @@ class MainTable(tk.Canvas):
             )
             self.restore_options_named_spans(modification)
 
-        if modification["eventname"].startswith(("edit", "move")):
+        if modification["eventname"].startswith(("edit", "move", "sort")):
             if not saved_cells:
                 event_data = self.save_cells_using_modification(modification, event_data)
             event_data = self.edit_cells_using_modification(modification, event_data)
@@ -2326,7 +2851,16 @@ class MainTable(tk.Canvas):
             pass
         menu.add_command(**kwargs)
 
-    def create_rc_menus(self):
+    def create_rc_menus(self) -> None:
+        # the menus are only built when one is opened,
+        # creating a sheet or changing its options or
+        # bindings just marks them as needing a rebuild
+        self.rc_menus_stale = True
+
+    def build_rc_menus(self) -> None:
+        if not self.rc_menus_stale:
+            return
+        self.rc_menus_stale = False
         if not self.rc_popup_menu:
             self.rc_popup_menu = tk.Menu(self, tearoff=0, background=self.PAR.ops.popup_menu_bg)
         if not self.CH.ch_rc_popup_menu:
@@ -2810,6 +3344,8 @@ class MainTable(tk.Canvas):
     def rc(self, event=None):
         self.mouseclick_outside_editor_or_dropdown_all_canvases()
         self.focus_set()
+        if self.rc_popup_menus_enabled:
+            self.build_rc_menus()
         popup_menu = None
         if (self.single_selection_enabled or self.toggle_selection_enabled) and self.not_currently_resizing():
             r = self.identify_row(y=event.y)
@@ -3294,7 +3830,8 @@ class MainTable(tk.Canvas):
         if self.show_header:
             self.CH.update_idletasks()
             self.CH.xview(*args)
-        self.main_table_redraw_grid_and_text(redraw_header=True, redraw_row_index=False)
+        if redraw:
+            self.main_table_redraw_grid_and_text(redraw_header=True, redraw_row_index=False)
         if move_synced:
             self.x_move_synced_scrolls(*args)
         self.fix_views()
@@ -3306,7 +3843,8 @@ class MainTable(tk.Canvas):
         if self.show_index:
             self.RI.update_idletasks()
             self.RI.yview(*args)
-        self.main_table_redraw_grid_and_text(redraw_header=False, redraw_row_index=True)
+        if redraw:
+            self.main_table_redraw_grid_and_text(redraw_header=False, redraw_row_index=True)
         if move_synced:
             self.y_move_synced_scrolls(*args)
         self.fix_views()
@@ -3383,16 +3921,26 @@ class MainTable(tk.Canvas):
             c_pc = 0.0
         old_min_row_height = int(self.min_row_height)
         old_default_row_height = int(self.get_default_row_height())
+        old_txt_width = self.table_txt_width
+        old_txt_height = self.table_txt_height
         self.set_table_font(
             table_font,
             reset_row_positions=False,
         )
         self.set_index_font(index_font)
         self.set_header_font(header_font)
-        if self.PAR.ops.set_cell_sizes_on_zoom:
+        if self.PAR.ops.set_cell_sizes_on_zoom == "visible":
+            self.scale_cell_sizes(
+                self.table_txt_width / old_txt_width if old_txt_width else 1,
+                self.table_txt_height / old_txt_height if old_txt_height else 1,
+            )
+            self.main_table_redraw_grid_and_text(setting_views=True)
+            self.see(r, c, check_cell_visibility=False, redraw=False, r_pc=r_pc, c_pc=c_pc)
+            self.set_visible_cell_sizes_to_text()
+            self.recreate_all_selection_boxes()
+        elif self.PAR.ops.set_cell_sizes_on_zoom:
             self.set_all_cell_sizes_to_text()
-            self.main_table_redraw_grid_and_text(redraw_header=True, redraw_row_index=True)
-        elif not self.PAR.ops.set_cell_sizes_on_zoom:
+        else:
             default_row_height = self.get_default_row_height()
             self.row_positions = list(
                 accumulate(
@@ -3415,9 +3963,10 @@ class MainTable(tk.Canvas):
                     )
                 )
             )
-            self.main_table_redraw_grid_and_text(redraw_header=True, redraw_row_index=True)
             self.recreate_all_selection_boxes()
-        self.main_table_redraw_grid_and_text(redraw_header=True, redraw_row_index=True)
+        # only the scroll region is updated here, the
+        # table is drawn once after the view is restored
+        self.main_table_redraw_grid_and_text(setting_views=True)
         self.refresh_open_window_positions(zoom=zoom)
         self.RI.refresh_open_window_positions(zoom=zoom)
         self.CH.refresh_open_window_positions(zoom=zoom)
@@ -3425,37 +3974,34 @@ class MainTable(tk.Canvas):
             r,
             c,
             check_cell_visibility=False,
-            redraw=True,
+            redraw=False,
             r_pc=r_pc,
             c_pc=c_pc,
         )
+        self.PAR.set_refresh_timer()
+
+    def scale_cell_sizes(self, width_ratio: float, height_ratio: float) -> None:
+        min_rh = self.min_row_height
+        max_rh = self.max_row_height
+        min_cw = self.min_column_width
+        max_cw = self.max_column_width
+        self.set_row_positions(itr=(min(max(round(h * height_ratio), min_rh), max_rh) for h in self.gen_row_heights()))
+        self.set_col_positions(itr=(min(max(round(w * width_ratio), min_cw), max_cw) for w in self.gen_column_widths()))
+
+    def set_visible_cell_sizes_to_text(self) -> None:
+        for c in range(*self.visible_text_columns):
+            self.CH.set_col_width(c, visible_only=True, recreate=False)
+        for r in range(*self.visible_text_rows):
+            self.RI.set_row_height(r, visible_only=True, recreate=False)
 
     def get_txt_w(self, txt, font=None):
-        self.txt_measure_canvas.itemconfig(
-            self.txt_measure_canvas_text,
-            text=txt,
-            font=self.PAR.ops.table_font if font is None else font,
-        )
-        b = self.txt_measure_canvas.bbox(self.txt_measure_canvas_text)
-        return b[2] - b[0]
+        return measure_text(self, txt, self.PAR.ops.table_font if font is None else font)[0]
 
     def get_txt_h(self, txt, font=None):
-        self.txt_measure_canvas.itemconfig(
-            self.txt_measure_canvas_text,
-            text=txt,
-            font=self.PAR.ops.table_font if font is None else font,
-        )
-        b = self.txt_measure_canvas.bbox(self.txt_measure_canvas_text)
-        return b[3] - b[1]
+        return measure_text(self, txt, self.PAR.ops.table_font if font is None else font)[1]
 
     def get_txt_dimensions(self, txt, font=None):
-        self.txt_measure_canvas.itemconfig(
-            self.txt_measure_canvas_text,
-            text=txt,
-            font=self.PAR.ops.table_font if font is None else font,
-        )
-        b = self.txt_measure_canvas.bbox(self.txt_measure_canvas_text)
-        return b[2] - b[0], b[3] - b[1]
+        return measure_text(self, txt, self.PAR.ops.table_font if font is None else font)
 
     def get_lines_cell_height(self, n, font=None):
         return (
@@ -3599,9 +4145,15 @@ class MainTable(tk.Canvas):
         return_id: bool = True,
         keep_formatting: bool = True,
     ) -> object:
+        labels = data_labels(newdataref)
+        newdataref = data_to_rows(newdataref)
         if isinstance(newdataref, (list, tuple)):
+            if self.PAR.ops.rectangular_data:
+                self.check_rectangular(newdataref)
             self.hide_dropdown_editor_all_canvases()
             self.data = newdataref
+            self.set_data_labels(*labels)
+            self.reset_column_caches()
             if keep_formatting:
                 self.reapply_formatting()
             else:
@@ -3618,13 +4170,22 @@ class MainTable(tk.Canvas):
         else:
             return self.data
 
+    def set_data_labels(self, headers: list[object] | None, index: list[object] | None) -> None:
+        """
+        Uses the labels of a DataFrame or Table
+        given as data, see functions.data_labels()
+        """
+        if headers is not None:
+            self._headers = headers
+        if index is not None:
+            self._row_index = index
+
     def get_cell_dimensions(self, datarn, datacn):
         txt = self.get_valid_cell_data_as_str(datarn, datacn, get_displayed=True)
         if txt:
-            self.txt_measure_canvas.itemconfig(self.txt_measure_canvas_text, text=txt, font=self.PAR.ops.table_font)
-            b = self.txt_measure_canvas.bbox(self.txt_measure_canvas_text)
-            w = b[2] - b[0] + 7
-            h = b[3] - b[1] + 5
+            w, h = measure_text(self, txt, self.PAR.ops.table_font)
+            w += 7
+            h += 5
         else:
             w = self.min_column_width
             h = self.min_row_height
@@ -3708,15 +4269,13 @@ class MainTable(tk.Canvas):
         self,
         width: int | None = None,
         slim: bool = False,
+        sample: int | None = None,
     ) -> tuple[list[float], list[float]]:
         min_column_width = int(self.min_column_width)
         min_rh = int(self.min_row_height)
         h = min_rh
         rhs = defaultdict(lambda: int(min_rh))
         cws = []
-        qconf = self.txt_measure_canvas.itemconfig
-        qbbox = self.txt_measure_canvas.bbox
-        qtxtm = self.txt_measure_canvas_text
         qtxth = self.table_txt_height
         qfont = self.PAR.ops.table_font
         numrows = self.total_data_rows()
@@ -3729,6 +4288,12 @@ class MainTable(tk.Canvas):
             iterrows = range(numrows)
         else:
             iterrows = self.displayed_rows
+        # only measure the first 'sample' rows, the rest get the min row height
+        if isinstance(sample, int) and len(iterrows) > sample:
+            unmeasured = len(iterrows) - sample
+            iterrows = iterrows[:sample]
+        else:
+            unmeasured = 0
         if is_iterable(self._row_index):
             for datarn in iterrows:
                 w_, h = self.RI.get_cell_dimensions(datarn)
@@ -3747,10 +4312,9 @@ class MainTable(tk.Canvas):
                 w = min_column_width
             for datarn in iterrows:
                 if txt := self.get_valid_cell_data_as_str(datarn, datacn, get_displayed=True):
-                    qconf(qtxtm, text=txt, font=qfont)
-                    b = qbbox(qtxtm)
-                    tw = b[2] - b[0] + added_w_space
-                    h = b[3] - b[1] + 5
+                    tw, h = measure_text(self, txt, qfont)
+                    tw += added_w_space
+                    h += 5
                 else:
                     tw = min_column_width
                     h = min_rh
@@ -3777,7 +4341,7 @@ class MainTable(tk.Canvas):
             elif w > self.max_column_width:
                 w = int(self.max_column_width)
             cws.append(w)
-        self.set_row_positions(itr=rhs.values())
+        self.set_row_positions(itr=chain(rhs.values(), repeat(min_rh, unmeasured if rhs else 0)))
         self.set_col_positions(itr=cws)
         self.recreate_all_selection_boxes()
         return self.row_positions, self.col_positions
@@ -4318,6 +4882,7 @@ class MainTable(tk.Canvas):
         mod_event_boxes: bool = True,
     ) -> EventDataDict:
         self.saved_column_widths = {}
+        self.reset_column_caches()
         saved_displayed_columns = list(self.displayed_columns)
         if isinstance(displayed_columns, list):
             self.displayed_columns = displayed_columns
@@ -4344,6 +4909,9 @@ class MainTable(tk.Canvas):
                 if rn > maxrn:
                     maxrn = rn
                 self.data[rn].insert(cn, v)
+        self.reset_data_cols()
+        if self.PAR.ops.rectangular_data:
+            self.make_rectangular()
         # if not hiding rows then we can extend row positions if necessary
         if add_row_positions and self.all_rows_displayed and maxrn >= len(self.row_positions) - 1:
             default_height = self.get_default_row_height()
@@ -4389,6 +4957,7 @@ class MainTable(tk.Canvas):
         return event_data
 
     def rc_add_columns(self, event: object = None):
+        self.end_streams()
         rowlen = self.equalize_data_row_lengths()
         selcols = sorted(self.get_selected_cols())
         if (
@@ -4454,9 +5023,13 @@ class MainTable(tk.Canvas):
         mod_event_boxes: bool = True,
     ) -> EventDataDict:
         self.saved_row_heights = {}
+        self.reset_column_caches()
         saved_displayed_rows = list(self.displayed_rows)
         if isinstance(displayed_rows, list):
             self.displayed_rows = displayed_rows
+        elif self.rows_view_ordered():
+            # a view keeps its order, new rows are shown where their heights are inserted
+            self.displayed_rows = add_to_view(self.displayed_rows, rows, row_heights)
         elif not self.all_rows_displayed:
             self.displayed_rows = add_to_displayed(self.displayed_rows, rows)
         rhs = self.get_row_heights()
@@ -4471,6 +5044,7 @@ class MainTable(tk.Canvas):
             )
         )
         maxcn = 0
+        width = len(self.data[0]) if self.data else 0
         # rn needed for insert but cn indexing
         for rn, row in reversed(rows.items()):
             cn = len(row) - 1
@@ -4479,6 +5053,14 @@ class MainTable(tk.Canvas):
             self.data.insert(rn, row)
             if cn > maxcn:
                 maxcn = cn
+        self.track_data_cols(maxcn + 1, len(rows))
+        if self.PAR.ops.rectangular_data:
+            if maxcn >= width:
+                self.fix_row_len(0, maxcn)
+            else:
+                for rn in rows:
+                    if (lnr := len(self.data[rn])) < width:
+                        self.data[rn] += self.get_empty_row_seq(rn, end=width, start=lnr)
         if isinstance(self._row_index, list) and index:
             self._row_index = insert_items(self._row_index, index, self.RI.fix_index)
         # if not hiding columns then we can extend col positions if necessary
@@ -4524,6 +5106,9 @@ class MainTable(tk.Canvas):
         return event_data
 
     def rc_add_rows(self, event: object = None):
+        self.end_streams()
+        if self.rows_view_ordered():
+            return
         total_data_rows = self.total_data_rows()
         selrows = sorted(self.get_selected_rows())
         if (
@@ -4688,8 +5273,87 @@ class MainTable(tk.Canvas):
             }
         )
 
+    def state_sections(self, chunk_rows: int = 5000) -> Generator[tuple[str, bytes]]:
+        chunks = range(0, len(self.data), chunk_rows)
+        yield "meta", pickle_obj(
+            {
+                "chunks": len(chunks),
+                "headers": self._headers,
+                "row_index": self._row_index,
+                "displayed_rows": self.displayed_rows,
+                "displayed_columns": self.displayed_columns,
+                "all_rows_displayed": self.all_rows_displayed,
+                "all_columns_displayed": self.all_columns_displayed,
+                "saved_row_heights": self.saved_row_heights,
+                "saved_column_widths": self.saved_column_widths,
+                "tagged_cells": self.tagged_cells,
+                "tagged_rows": self.tagged_rows,
+                "tagged_columns": self.tagged_columns,
+                "named_spans": {k: span.pickle_self() for k, span in self.named_spans.items()},
+            }
+        )
+        for i, start in enumerate(chunks):
+            yield f"data{i}", rows_to_column_chunk(self.data[start : start + chunk_rows])
+        yield "options", pickle_obj(
+            {
+                "cell_options": option_runs(self.cell_options),
+                "column_options": option_runs(self.col_options),
+                "row_options": option_runs(self.row_options),
+                "CH_cell_options": option_runs(self.CH.cell_options),
+                "RI_cell_options": option_runs(self.RI.cell_options),
+            }
+        )
+        yield "row_positions", positions_to_bytes(self.row_positions)
+        yield "col_positions", positions_to_bytes(self.col_positions)
+
+    def restore_state(self, sections: dict[str, memoryview]) -> None:
+        if self.PAR.ops.treeview:
+            raise ValueError("State files cannot be loaded in treeview mode.")
+        meta = unpickle_obj(sections["meta"])
+        row_positions = bytes_to_positions(sections["row_positions"])
+        col_positions = bytes_to_positions(sections["col_positions"])
+        if not row_positions or (
+            not meta["all_rows_displayed"] and len(row_positions) - 1 != len(meta["displayed_rows"])
+        ):
+            raise ValueError("State file row heights do not match its displayed rows.")
+        if not col_positions or (
+            not meta["all_columns_displayed"] and len(col_positions) - 1 != len(meta["displayed_columns"])
+        ):
+            raise ValueError("State file column widths do not match its displayed columns.")
+        data = []
+        for i in range(meta["chunks"]):
+            data.extend(column_chunk_to_rows(sections[f"data{i}"]))
+        if self.PAR.ops.rectangular_data:
+            self.check_rectangular(data)
+        options = unpickle_obj(sections["options"])
+        self.deselect("all", redraw=False)
+        self.hide_dropdown_editor_all_canvases()
+        self.data = data
+        self.reset_column_caches()
+        self.purge_undo_and_redo_stack()
+        self._headers = meta["headers"]
+        self._row_index = meta["row_index"]
+        self.cell_options = runs_to_options(options["cell_options"])
+        self.col_options = runs_to_options(options["column_options"])
+        self.row_options = runs_to_options(options["row_options"])
+        self.CH.cell_options = runs_to_options(options["CH_cell_options"])
+        self.RI.cell_options = runs_to_options(options["RI_cell_options"])
+        self.tagged_cells = meta["tagged_cells"]
+        self.tagged_rows = meta["tagged_rows"]
+        self.tagged_columns = meta["tagged_columns"]
+        self.named_spans = {k: mod_span_widget(unpickle_obj(v), self.PAR) for k, v in meta["named_spans"].items()}
+        self.displayed_rows = meta["displayed_rows"]
+        self.displayed_columns = meta["displayed_columns"]
+        self.all_rows_displayed = meta["all_rows_displayed"]
+        self.all_columns_displayed = meta["all_columns_displayed"]
+        self.saved_row_heights = meta["saved_row_heights"]
+        self.saved_column_widths = meta["saved_column_widths"]
+        self.row_positions = row_positions
+        self.col_positions = col_positions
+
     def delete_columns_data(self, cols: list, event_data: dict) -> EventDataDict:
         self.mouseclick_outside_editor_or_dropdown_all_canvases()
+        self.reset_column_caches()
         event_data["deleted"]["displayed_columns"] = (
             list(self.displayed_columns) if not isinstance(self.displayed_columns, int) else int(self.displayed_columns)
         )
@@ -4707,6 +5371,7 @@ class MainTable(tk.Canvas):
                 event_data["deleted"]["header"][datacn] = self._headers.pop(datacn)
             except Exception:
                 continue
+        self.reset_data_cols()
         cols_set = set(cols)
         self.adjust_options_post_delete_columns(
             to_del=cols_set,
@@ -4729,6 +5394,7 @@ class MainTable(tk.Canvas):
         return event_data
 
     def rc_delete_columns(self, event: object = None):
+        self.end_streams()
         selected = sorted(self.get_selected_cols())
         if not self.selected:
             return
@@ -4752,6 +5418,9 @@ class MainTable(tk.Canvas):
 
     def delete_rows_data(self, rows: list, event_data: dict) -> EventDataDict:
         self.mouseclick_outside_editor_or_dropdown_all_canvases()
+        self.reset_column_caches()
+        # data rows taken from a view's displayed rows can be out of order
+        rows = sorted(rows)
         event_data["deleted"]["displayed_rows"] = (
             list(self.displayed_rows) if not isinstance(self.displayed_rows, int) else int(self.displayed_rows)
         )
@@ -4763,6 +5432,7 @@ class MainTable(tk.Canvas):
                 event_data["deleted"]["index"][datarn] = self._row_index.pop(datarn)
             except Exception:
                 continue
+        self.reset_data_cols()
         rows_set = set(rows)
         self.adjust_options_post_delete_rows(
             to_del=rows_set,
@@ -4785,6 +5455,7 @@ class MainTable(tk.Canvas):
         return event_data
 
     def rc_delete_rows(self, event: object = None):
+        self.end_streams()
         selected = sorted(self.get_selected_rows())
         if not self.selected:
             return
@@ -4865,6 +5536,360 @@ class MainTable(tk.Canvas):
         if deselect_all:
             self.deselect("all", redraw=False)
 
+    def view_rows(
+        self,
+        sort_by: Sequence[int] = (),
+        key: Callable | None = None,
+        reverse: Sequence[bool] = (),
+        filters: dict[int, Callable | object] | None = None,
+    ) -> list[int]:
+        """
+        Sets the displayed rows to the data rows which pass every
+        filter, ordered by the sort_by columns, row heights are
+        kept and the data is not moved, a filter which is not
+        callable keeps the rows whose value equals it
+        """
+        if len(reverse) != len(sort_by):
+            raise ValueError(
+                f"Argument 'reverse' must have one bool per 'sort_by' column, not {len(reverse)} for {len(sort_by)}."
+            )
+        totalrows = self.total_data_rows()
+        heights = dict(self.saved_row_heights)
+        heights.update(
+            zip(
+                range(totalrows) if self.all_rows_displayed else self.displayed_rows,
+                self.gen_row_heights(),
+            )
+        )
+        rows = None
+        if filters:
+            # equality filters use the column value index
+            for datacn, value in filters.items():
+                if not callable(value):
+                    matched = self.get_value_index(datacn).get(index_value(value), [])
+                    if rows is None:
+                        rows = matched.copy()
+                    else:
+                        matched = set(matched)
+                        rows = [datarn for datarn in rows if datarn in matched]
+            for datacn, func in filters.items():
+                if callable(func):
+                    if rows is None:
+                        values = self.get_column_values(datacn, totalrows)
+                        rows = [datarn for datarn in range(totalrows) if func(values[datarn])]
+                    else:
+                        rows = [datarn for datarn in rows if func(self.get_cell_data(datarn, datacn))]
+        if rows is None:
+            rows = list(range(totalrows))
+        # stable sorts from the last sort column to the first
+        empty = sort_key(None)
+        for datacn, rev in reversed(tuple(zip(sort_by, reverse))):
+            keys = self.get_sort_keys(datacn, key)
+            rows.sort(key=keys.__getitem__, reverse=rev)
+            if rev and key is None:
+                # empty cells stay last, the same as sort_permutation()
+                rows = [datarn for datarn in rows if keys[datarn] != empty] + [
+                    datarn for datarn in rows if keys[datarn] == empty
+                ]
+        self.purge_undo_and_redo_stack()
+        self.deselect("all", redraw=False)
+        self.displayed_rows = rows
+        self.all_rows_displayed = not filters and not sort_by
+        default_row_height = self.get_default_row_height()
+        self.set_row_positions(itr=(heights.pop(datarn, default_row_height) for datarn in rows))
+        self.saved_row_heights = heights
+        return rows
+
+    def rows_view_ordered(self) -> bool:
+        return not self.all_rows_displayed and any(
+            map(gt, self.displayed_rows, islice(self.displayed_rows, 1, None))
+        )
+
+    def end_rows_view_order(self) -> None:
+        """
+        Puts the displayed rows back into data order,
+        rows hidden by a view stay hidden
+        """
+        if self.rows_view_ordered():
+            heights = dict(zip(self.displayed_rows, self.gen_row_heights()))
+            self.displayed_rows = sorted(self.displayed_rows)
+            self.set_row_positions(itr=map(heights.__getitem__, self.displayed_rows))
+            self.deselect("all", redraw=False)
+
+    def get_column_values(self, datacn: int, totalrows: int | None = None) -> list[object]:
+        if totalrows is None:
+            totalrows = self.total_data_rows()
+        if self.cell_options or self.row_options or self.col_options:
+            # may have formatters
+            return [self.get_cell_data(datarn, datacn) for datarn in range(totalrows)]
+        values = [row[datacn] if len(row) > datacn else "" for row in islice(self.data, totalrows)]
+        if len(values) < totalrows:
+            values.extend(repeat("", totalrows - len(values)))
+        return values
+
+    def get_span_column(
+        self,
+        rows: Sequence[int],
+        datacn: int,
+        get_displayed: bool = False,
+        fmt_kw: dict | None = None,
+    ) -> list[object]:
+        get_data = self.get_cell_data
+        if get_displayed or fmt_kw is not None or self.row_options or datacn in self.col_options:
+            return [get_data(datarn, datacn, get_displayed, fmt_kw=fmt_kw) for datarn in rows]
+        # cells without options are read straight from the data
+        data, totalrows = self.data, len(self.data)
+        return [
+            (
+                get_data(datarn, datacn)
+                if datarn >= totalrows or datacn >= len(data[datarn]) or (datarn, datacn) in self.cell_options
+                else data[datarn][datacn]
+            )
+            for datarn in rows
+        ]
+
+    def get_sort_keys(self, datacn: int, key: Callable | None = None) -> list[object]:
+        """
+        Sort keys for every row of a data column, cached and kept
+        up to date by cell edits until rows or columns are added,
+        deleted or moved
+        """
+        if key is not self.sort_key_func:
+            self.sort_key_cache = {}
+            self.sort_key_func = key
+        totalrows = self.total_data_rows()
+        if datacn not in self.sort_key_cache or len(self.sort_key_cache[datacn]) != totalrows:
+            self.sort_key_cache[datacn] = list(
+                map(sort_key if key is None else key, self.get_column_values(datacn, totalrows))
+            )
+        return self.sort_key_cache[datacn]
+
+    def get_index_value(self, datarn: int, datacn: int, get_displayed: bool = False) -> Hashable:
+        if get_displayed:
+            return self.get_valid_cell_data_as_str(datarn, datacn, get_displayed=True)
+        return index_value(self.get_cell_data(datarn, datacn))
+
+    def get_value_index(self, datacn: int, get_displayed: bool = False) -> dict[Hashable, list[int]]:
+        """
+        {value: ascending data rows with that value} for a data
+        column, built when first needed and kept up to date by cell
+        edits until rows or columns are added, deleted or moved
+        """
+        totalrows = self.total_data_rows()
+        cached = self.value_index_cache.get((datacn, get_displayed))
+        if cached is None or cached[0] != totalrows:
+            index = {}
+            if get_displayed:
+                values = (self.get_index_value(datarn, datacn, True) for datarn in range(totalrows))
+            else:
+                values = map(index_value, self.get_column_values(datacn, totalrows))
+            for datarn, value in enumerate(values):
+                if value in index:
+                    index[value].append(datarn)
+                else:
+                    index[value] = [datarn]
+            cached = self.value_index_cache[(datacn, get_displayed)] = (totalrows, index)
+        return cached[1]
+
+    def update_value_indexes(self, datarn: int, datacn: int, add: bool) -> None:
+        for get_displayed in (False, True):
+            cached = self.value_index_cache.get((datacn, get_displayed))
+            if cached is None or datarn >= cached[0]:
+                continue
+            index = cached[1]
+            value = self.get_index_value(datarn, datacn, get_displayed)
+            if add:
+                if value in index:
+                    insort(index[value], datarn)
+                else:
+                    index[value] = [datarn]
+            elif (rows := index.get(value)) is not None:
+                i = bisect_left(rows, datarn)
+                if i < len(rows) and rows[i] == datarn:
+                    del rows[i]
+                    if not rows:
+                        del index[value]
+
+    def reset_column_caches(self) -> None:
+        self.clear_value_caches()
+        self.found_cells = {}
+
+    def clear_value_caches(self, datacn: int | None = None) -> None:
+        """
+        Sort keys and value indexes are built from cell values which
+        depend on the cell options, they are cleared for a column, or
+        for every column if datacn is None, when its options change
+        """
+        if datacn is None:
+            self.sort_key_cache = {}
+            self.value_index_cache = {}
+        else:
+            self.sort_key_cache.pop(datacn, None)
+            self.value_index_cache.pop((datacn, False), None)
+            self.value_index_cache.pop((datacn, True), None)
+
+    def find_rows(
+        self,
+        rows: Iterator[int],
+        columns: Sequence[int],
+        match: Callable,
+        get_displayed: bool = True,
+    ) -> Generator[list[tuple[int, int]]]:
+        """
+        Yields the (data row, data column) cells of each row whose
+        text match() accepts, one row at a time so that a scan can
+        be split across idle callbacks
+        """
+        get_str = self.get_valid_cell_data_as_str
+        for datarn in rows:
+            if datarn < len(self.data) and not (self.cell_options or self.row_options or self.col_options):
+                # no formatters or dropdowns, the displayed text is the value
+                row = self.data[datarn]
+                lenrow = len(row)
+                yield [
+                    (datarn, datacn)
+                    for datacn in columns
+                    if match("" if datacn >= lenrow or row[datacn] is None else f"{row[datacn]}")
+                ]
+            else:
+                yield [(datarn, datacn) for datacn in columns if match(get_str(datarn, datacn, get_displayed))]
+
+    def set_found_cells(self, cells: Iterator[tuple[int, int]], bg: str | None) -> None:
+        if bg is None:
+            self.found_cells = {}
+        else:
+            highlight = Highlight(bg=bg, fg=None, end=False)
+            self.found_cells = dict.fromkeys(cells, highlight)
+
+    def start_find(
+        self,
+        scan: Generator[list[tuple[int, int]]],
+        callback: Callable,
+        bg: str | None,
+        time_slice: int,
+    ) -> None:
+        self.cancel_find()
+        self.find_stream = DotDict(scan=scan, callback=callback, bg=bg, time_slice=time_slice / 1000, rows=[])
+        self.after_idle(self.find_step)
+
+    def find_step(self) -> None:
+        if (stream := self.find_stream) is None:
+            return
+        stop = default_timer() + stream.time_slice
+        for cells in stream.scan:
+            stream.rows.append(cells)
+            if default_timer() > stop:
+                self.after_idle(self.find_step)
+                return
+        self.find_stream = None
+        self.set_found_cells(chain.from_iterable(stream.rows), stream.bg)
+        self.main_table_redraw_grid_and_text(redraw_header=False, redraw_row_index=False)
+        stream.callback(list(found_boxes(stream.rows)))
+
+    def cancel_find(self) -> bool:
+        if self.find_stream is None:
+            return False
+        self.find_stream.scan.close()
+        self.find_stream = None
+        return True
+
+    def export_rows(
+        self,
+        rows: Sequence[int],
+        columns: Sequence[int],
+        get_displayed: bool = True,
+    ) -> Generator[list[str]]:
+        get_str = self.get_valid_cell_data_as_str
+        # only cells with options need get_valid_cell_data_as_str(),
+        # every other cell is converted straight from the data
+        plain = [datacn not in self.col_options for datacn in columns]
+        for datarn in rows:
+            if datarn >= len(self.data) or datarn in self.row_options:
+                yield [get_str(datarn, datacn, get_displayed) for datacn in columns]
+                continue
+            row = self.data[datarn]
+            lenrow = len(row)
+            yield [
+                (
+                    ("" if datacn >= lenrow or row[datacn] is None else f"{row[datacn]}")
+                    if is_plain and (datarn, datacn) not in self.cell_options
+                    else get_str(datarn, datacn, get_displayed)
+                )
+                for datacn, is_plain in zip(columns, plain)
+            ]
+
+    def write_csv(
+        self,
+        file: object,
+        close: bool,
+        rows: Sequence[int],
+        columns: Sequence[int],
+        get_displayed: bool = True,
+        header: bool = False,
+        index: bool = False,
+        chunk: int = 5000,
+        **fmtparams,
+    ) -> Generator[tuple[int, int]]:
+        """
+        Writes rows to file a chunk at a time, yields the
+        number of rows done so far and the total before
+        the first chunk and after each chunk
+        """
+        try:
+            writer = csv.writer(file, **fmtparams)
+            if header:
+                writer.writerow(
+                    ([""] if index else [])
+                    + [self.CH.get_valid_cell_data_as_str(datacn, fix=False) for datacn in columns]
+                )
+            lines = self.export_rows(rows, columns, get_displayed)
+            if index:
+                get_index = self.RI.get_valid_cell_data_as_str
+                lines = ([get_index(datarn, fix=False)] + line for datarn, line in zip(rows, lines))
+            done, total = 0, len(rows)
+            yield done, total
+            while done < total:
+                writer.writerows(islice(lines, chunk))
+                done = min(done + chunk, total)
+                yield done, total
+        finally:
+            if close:
+                file.close()
+
+    def export_step(self) -> None:
+        if self.export_stream is None:
+            return
+        try:
+            done, total = next(self.export_stream)
+        except Exception as error:
+            # finished, errors writing the file are raised
+            self.export_stream = None
+            if isinstance(error, StopIteration):
+                return
+            raise
+        self.PAR.emit_event(
+            "<<ExportProgress>>",
+            EventDataDict(
+                eventname="export_progress",
+                sheetname=self.PAR.name,
+                done=done,
+                total=total,
+            ),
+        )
+        self.after(1, self.export_step)
+
+    def cancel_export(self) -> bool:
+        """
+        Stops a streaming export, rows already
+        written are kept and the file is closed
+        if it was opened by the export
+        """
+        if self.export_stream is None:
+            return False
+        self.export_stream.close()
+        self.export_stream = None
+        return True
+
     def display_columns(
         self,
         columns: int | Iterator | None = None,
@@ -4992,9 +6017,46 @@ class MainTable(tk.Canvas):
 
     def total_data_cols(self, include_header: bool = True) -> int:
         h_total = len(self._headers) if include_header and isinstance(self._headers, (list, tuple)) else 0
-        # map() for some reason is 15% faster than max(key=len) using python 3.11 windows 11
-        d_total = max(map(len, self.data), default=0)
-        return max(h_total, d_total)
+        if self.PAR.ops.rectangular_data:
+            return max(h_total, len(self.data[0]) if self.data else 0)
+        # the longest row length is kept in data_cols_cache as (data, number of rows, longest row length)
+        # and is only measured again if it was reset or the data or its number of rows has changed
+        if (cache := self.data_cols_cache) is None or cache[0] is not self.data or cache[1] != len(self.data):
+            # map() for some reason is 15% faster than max(key=len) using python 3.11 windows 11
+            cache = self.data_cols_cache = (self.data, len(self.data), max(map(len, self.data), default=0))
+        return max(h_total, cache[2])
+
+    def track_data_cols(self, ncols: int, rows_added: int = 0) -> None:
+        """
+        Keeps the longest row length used by total_data_cols() current
+        after rows were lengthened to ncols or rows_added rows of up
+        to ncols length were added, rows must not have been shortened
+        """
+        if (
+            (cache := self.data_cols_cache) is not None
+            and cache[0] is self.data
+            and cache[1] + rows_added == len(self.data)
+        ):
+            self.data_cols_cache = (self.data, len(self.data), max(cache[2], ncols))
+        else:
+            self.data_cols_cache = None
+
+    def reset_data_cols(self) -> None:
+        self.data_cols_cache = None
+
+    def check_rectangular(self, data: list | tuple) -> None:
+        if len(set(map(len, data))) > 1:
+            raise ValueError("rectangular_data is True but the rows in data are not all the same length.")
+
+    def make_rectangular(self) -> None:
+        """
+        Used when rectangular_data is True after operations
+        which may have lengthened only some of the rows
+        """
+        ncols = max(map(len, self.data), default=0)
+        for rn, r in enumerate(self.data):
+            if (lnr := len(r)) < ncols:
+                r += self.get_empty_row_seq(rn, end=ncols, start=lnr)
 
     def total_data_rows(self, include_index: bool = True) -> int:
         i_total = len(self._row_index) if include_index and isinstance(self._row_index, (list, tuple)) else 0
@@ -5016,6 +6078,7 @@ class MainTable(tk.Canvas):
                     r = r[:total_columns]
                 elif lnr < total_columns:
                     r += self.get_empty_row_seq(rn, end=total_columns, start=lnr)
+        self.reset_data_cols()
 
     def equalize_data_row_lengths(
         self,
@@ -5030,9 +6093,13 @@ class MainTable(tk.Canvas):
         total_data_cols = max(total_data_cols, len(self.col_positions) - 1)
         if not isinstance(self._headers, int) and include_header and total_data_cols > len(self._headers):
             self.CH.fix_header(total_data_cols - 1)
+        if self.PAR.ops.rectangular_data and (not self.data or len(self.data[0]) >= total_data_cols):
+            # every row is already long enough
+            return total_data_cols
         for rn, r in enumerate(self.data):
             if total_data_cols > (lnr := len(r)):
                 r += self.get_empty_row_seq(rn, end=total_data_cols, start=lnr)
+        self.track_data_cols(total_data_cols)
         return total_data_cols
 
     def get_canvas_visible_area(self) -> tuple[float, float, float, float]:
@@ -5078,6 +6145,8 @@ class MainTable(tk.Canvas):
         redrawn = False
         if (datarn, datacn) in self.progress_bars:
             kwargs = self.progress_bars[(datarn, datacn)]
+        elif (datarn, datacn) in self.found_cells:
+            kwargs = self.found_cells[(datarn, datacn)]
         else:
             kwargs = self.get_cell_kwargs(datarn, datacn, key="highlight")
         if kwargs:
@@ -5793,8 +6862,11 @@ class MainTable(tk.Canvas):
                 scrollpos_bot=scrollpos_bot,
                 row_pos_exists=row_pos_exists,
             )
-        event_data = {"sheetname": "", "header": redraw_header, "row_index": redraw_row_index, "table": redraw_table}
-        self.PAR.emit_event("<<SheetRedrawn>>", data=event_data)
+        if self.PAR.bound_events["<<SheetRedrawn>>"]:
+            self.PAR.emit_event(
+                "<<SheetRedrawn>>",
+                data={"sheetname": "", "header": redraw_header, "row_index": redraw_row_index, "table": redraw_table},
+            )
         return True
 
     def get_selection_items(
@@ -6521,6 +7593,7 @@ class MainTable(tk.Canvas):
         state: str = "normal",
         dropdown: bool = False,
     ) -> bool:
+        self.end_streams()
         text = None
         extra_func_key = "??"
         if event is None or self.event_opens_dropdown_or_checkbox(event):
@@ -6884,14 +7957,19 @@ class MainTable(tk.Canvas):
     def get_dropdown_height_anchor(self, r: int, c: int, text_editor_h: int | None = None) -> tuple:
         win_h = 5
         datarn, datacn = self.datarn(r), self.datacn(c)
-        for i, v in enumerate(self.get_cell_kwargs(datarn, datacn, key="dropdown")["values"]):
-            v_numlines = len(v.split("\n") if isinstance(v, str) else f"{v}".split("\n"))
-            if v_numlines > 1:
-                win_h += self.table_first_ln_ins + (v_numlines * self.table_xtra_lines_increment) + 5  # end of cell
-            else:
-                win_h += self.min_row_height
-            if i == 5:
-                break
+        kwargs = self.get_cell_kwargs(datarn, datacn, key="dropdown")
+        if kwargs["values_provider"] is not None:
+            # values are not known until the provider returns
+            win_h += self.min_row_height * min(6, kwargs["provider_limit"])
+        else:
+            for i, v in enumerate(kwargs["values"]):
+                v_numlines = len(v.split("\n") if isinstance(v, str) else f"{v}".split("\n"))
+                if v_numlines > 1:
+                    win_h += self.table_first_ln_ins + (v_numlines * self.table_xtra_lines_increment) + 5  # end of cell
+                else:
+                    win_h += self.min_row_height
+                if i == 5:
+                    break
         if win_h > 500:
             win_h = 500
         space_bot = self.get_space_bot(r, text_editor_h)
@@ -6930,6 +8008,7 @@ class MainTable(tk.Canvas):
     ) -> None:
         self.hide_text_editor()
         datarn = self.datarn(r)
+        self.end_streams()
         datacn = self.datacn(c)
         kwargs = self.get_cell_kwargs(datarn, datacn, key="dropdown")
         if kwargs["state"] == "normal":
@@ -6955,6 +8034,8 @@ class MainTable(tk.Canvas):
             "outline_color": self.get_selected_box_bg_fg(type_="cells")[1],
             "align": self.get_cell_align(r, c),
             "values": kwargs["values"],
+            "values_provider": kwargs["values_provider"],
+            "provider_limit": kwargs["provider_limit"],
         }
         if self.dropdown.window:
             self.dropdown.window.reset(**reset_kwargs)
@@ -6969,6 +8050,7 @@ class MainTable(tk.Canvas):
                 search_function=kwargs["search_function"],
                 arrowkey_RIGHT=self.arrowkey_RIGHT,
                 arrowkey_LEFT=self.arrowkey_LEFT,
+                provider_error=self.PAR.dropdown_provider_error,
             )
             self.dropdown.canvas_id = self.create_window(
                 (self.col_positions[c], ypos),
@@ -7090,6 +8172,7 @@ class MainTable(tk.Canvas):
 
     def hide_dropdown_window(self):
         if self.dropdown.open:
+            self.dropdown.window.cancel_provider()
             self.dropdown.window.unbind("<FocusOut>")
             self.itemconfig(self.dropdown.canvas_id, state="hidden")
             self.dropdown.open = False
@@ -7105,6 +8188,7 @@ class MainTable(tk.Canvas):
     ) -> None:
         if datarn is None:
             datarn = self.datarn(r)
+        self.end_streams()
         if datacn is None:
             datacn = self.datacn(c)
         kwargs = self.get_cell_kwargs(datarn, datacn, key="checkbox")
@@ -7189,6 +8273,8 @@ class MainTable(tk.Canvas):
             elif datacn >= len(self.data[datarn]):
                 self.fix_row_len(datarn, datacn)
         if expand_sheet or (len(self.data) > datarn and len(self.data[datarn]) > datacn):
+            if self.value_index_cache:
+                self.update_value_indexes(datarn, datacn, add=False)
             if (
                 datarn,
                 datacn,
@@ -7204,6 +8290,12 @@ class MainTable(tk.Canvas):
                         self.data[datarn][datacn] = kwargs["formatter"](value, **kwargs)
                 else:
                     self.data[datarn][datacn] = value
+            if self.value_index_cache:
+                self.update_value_indexes(datarn, datacn, add=True)
+            if datacn in self.sort_key_cache and datarn < len(self.sort_key_cache[datacn]):
+                self.sort_key_cache[datacn][datarn] = (self.sort_key_func or sort_key)(
+                    self.get_cell_data(datarn, datacn)
+                )
 
     def get_value_for_empty_cell(self, datarn: int, datacn: int, r_ops: bool = True, c_ops: bool = True) -> object:
         if self.get_cell_kwargs(
@@ -7238,7 +8330,14 @@ class MainTable(tk.Canvas):
         return [self.get_value_for_empty_cell(datarn, datacn, r_ops=r_ops, c_ops=c_ops) for datacn in range(start, end)]
 
     def fix_row_len(self, datarn: int, datacn: int) -> None:
+        if self.PAR.ops.rectangular_data:
+            # every row is lengthened so that they stay the same length
+            for rn, r in enumerate(self.data):
+                if (lnr := len(r)) <= datacn:
+                    r += self.get_empty_row_seq(rn, end=datacn + 1, start=lnr)
+            return
         self.data[datarn].extend(self.get_empty_row_seq(datarn, end=datacn + 1, start=len(self.data[datarn])))
+        self.track_data_cols(len(self.data[datarn]))
 
     def fix_row_values(self, datarn: int, start: int | None = None, end: int | None = None):
         if datarn < len(self.data):
@@ -7248,7 +8347,13 @@ class MainTable(tk.Canvas):
 
     def fix_data_len(self, datarn: int, datacn: int | None = None) -> int:
         ncols = self.total_data_cols() if datacn is None else datacn + 1
-        self.data.extend(self.get_empty_row_seq(rn, end=ncols, start=0) for rn in range(len(self.data), datarn + 1))
+        if self.PAR.ops.rectangular_data and self.data:
+            if ncols > len(self.data[0]):
+                self.fix_row_len(0, ncols - 1)
+            ncols = len(self.data[0])
+        if (rows_added := datarn + 1 - len(self.data)) > 0:
+            self.data.extend(self.get_empty_row_seq(rn, end=ncols, start=0) for rn in range(len(self.data), datarn + 1))
+            self.track_data_cols(ncols, rows_added)
         return len(self.data)
 
     def reapply_formatting(self):
@@ -7282,8 +8387,10 @@ class MainTable(tk.Canvas):
     ) -> None:
         if isinstance(datarn, str) and datarn.lower() == "all":
             itr = gen_formatted(self.cell_options)
+            self.clear_value_caches()
         else:
             itr = ((datarn, datacn),)
+            self.clear_value_caches(datacn)
         get_val = self.get_value_for_empty_cell
         for key in itr:
             try:
@@ -7294,6 +8401,7 @@ class MainTable(tk.Canvas):
                 self.set_cell_data(*key, get_val(*key), expand_sheet=False)
 
     def delete_row_format(self, datarn: Literal["all"] | int = "all", clear_values: bool = False) -> None:
+        self.clear_value_caches()
         if isinstance(datarn, str) and datarn.lower() == "all":
             itr = gen_formatted(self.row_options)
         else:
@@ -7311,8 +8419,10 @@ class MainTable(tk.Canvas):
     def delete_column_format(self, datacn: Literal["all"] | int = "all", clear_values: bool = False) -> None:
         if isinstance(datacn, str) and datacn.lower() == "all":
             itr = gen_formatted(self.col_options)
+            self.clear_value_caches()
         else:
             itr = (datacn,)
+            self.clear_value_caches(datacn)
         get_val = self.get_value_for_empty_cell
         for datacn in itr:
             try:
@@ -7388,7 +8498,7 @@ class MainTable(tk.Canvas):
         if self.cell_equal_to(datarn, datacn, value, ignore_empty=ignore_empty):
             return False
         kwargs = self.get_cell_kwargs(datarn, datacn, key="dropdown")
-        if kwargs and kwargs["validate_input"] and value not in kwargs["values"]:
+        if kwargs and kwargs["validate_input"] and kwargs["values_provider"] is None and value not in kwargs["values"]:
             return False
         if self.get_cell_kwargs(datarn, datacn, key="checkbox"):
             return is_bool_like(value)
@@ -7456,7 +8566,25 @@ class MainTable(tk.Canvas):
             return None
 
     def disprn(self, datarn: int) -> int:
-        return datarn if self.all_rows_displayed else b_index(self.displayed_rows, datarn)
+        if self.all_rows_displayed:
+            return datarn
+        try:
+            return b_index(self.displayed_rows, datarn)
+        except ValueError:
+            # displayed rows can be out of order when sorted by a view
+            if (disprn := self.get_view_disprns().get(datarn)) is None:
+                raise
+            return disprn
+
+    def get_view_disprns(self) -> dict[int, int]:
+        """
+        {data row: displayed row}, rebuilt only
+        when the displayed rows have changed
+        """
+        if self.view_disprns_of is not self.displayed_rows or len(self.view_disprns) != len(self.displayed_rows):
+            self.view_disprns = dict(zip(self.displayed_rows, count()))
+            self.view_disprns_of = self.displayed_rows
+        return self.view_disprns
 
     def try_disprn(self, datarn: int) -> int | None:
         try:
@@ -5,8 +5,9 @@ except SyntaxError:
     pass
 
 import pickle
+from bisect import bisect_left
 from collections import namedtuple
-from collections.abc import Callable, Generator, Hashable, Iterator
+from collections.abc import Callable, Generator, Hashable, ItemsView, Iterator, KeysView, Sequence, ValuesView
 from functools import partial
 from typing import Literal
 
@@ -82,10 +83,12 @@ class SpanRange:
 
 
 class DotDict(dict):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         # Recursively turn nested dicts into DotDicts
-        for key, value in self.items():
+        for key, value in dict.items(self):
             if type(value) is dict:  # noqa: E721
                 self[key] = DotDict(value)
 
@@ -108,10 +111,88 @@ class DotDict(dict):
 
 class EventDataDict(DotDict):
     """
-    A subclass of DotDict with no changes
-    For better clarity in type hinting
+    A subclass of DotDict for event data
+    Keys in event_data_defaults are only created when first accessed,
+    membership tests, iterating, len() and printing always include them
     """
 
+    __slots__ = ()
+
+    def __missing__(self, key: Hashable) -> object:
+        if key in event_data_defaults:
+            value = event_data_defaults[key]()
+            dict.__setitem__(self, key, value)
+            return value
+        raise KeyError(key)
+
+    def __reduce__(self) -> tuple[type, tuple[dict]]:
+        # only the keys which have been created are pickled
+        return self.__class__, (dict(dict.items(self)),)
+
+    def create_defaults(self) -> EventDataDict:
+        for key in event_data_defaults:
+            if not dict.__contains__(self, key):
+                self.__missing__(key)
+        return self
+
+    def get(self, key: Hashable, default: object = None) -> object:
+        if key in event_data_defaults:
+            return self[key]
+        return super().get(key, default)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in event_data_defaults or dict.__contains__(self, key)
+
+    def __iter__(self) -> Iterator:
+        return dict.__iter__(self.create_defaults())
+
+    def __len__(self) -> int:
+        return dict.__len__(self.create_defaults())
+
+    def __repr__(self) -> str:
+        return dict.__repr__(self.create_defaults())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EventDataDict):
+            other.create_defaults()
+        return dict.__eq__(self.create_defaults(), other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def keys(self) -> KeysView:
+        return dict.keys(self.create_defaults())
+
+    def values(self) -> ValuesView:
+        return dict.values(self.create_defaults())
+
+    def items(self) -> ItemsView:
+        return dict.items(self.create_defaults())
+
+    def copy(self) -> dict:
+        return dict.copy(self.create_defaults())
+
+
+event_data_defaults = {
+    "cells": lambda: DotDict(table=DotDict(), header=DotDict(), index=DotDict()),
+    "moved": lambda: DotDict(rows=DotDict(), columns=DotDict()),
+    "sorted": lambda: DotDict(rows=None, columns=None),
+    "added": lambda: DotDict(rows=DotDict(), columns=DotDict()),
+    "deleted": lambda: DotDict(
+        rows=DotDict(),
+        columns=DotDict(),
+        header=DotDict(),
+        index=DotDict(),
+        column_widths=DotDict(),
+        row_heights=DotDict(),
+        displayed_rows=None,
+        displayed_columns=None,
+    ),
+    "named_spans": DotDict,
+    "options": DotDict,
+    "resized": lambda: DotDict(rows=DotDict(), columns=DotDict()),
+}
+
 
 class Span(dict):
     def __init__(self, *args, **kwargs) -> None:
@@ -205,6 +286,8 @@ class Span(dict):
         search_function: Callable | None = None,
         validate_input: bool = True,
         text: None | str = None,
+        values_provider: Callable | None = None,
+        provider_limit: int = 100,
     ) -> Span:
         return self["widget"].dropdown(
             self,
@@ -219,6 +302,8 @@ class Span(dict):
             search_function=search_function,
             validate_input=validate_input,
             text=text,
+            values_provider=values_provider,
+            provider_limit=provider_limit,
         )
 
     def del_dropdown(self) -> Span:
@@ -346,6 +431,15 @@ class Span(dict):
         self["transposed"] = not self["transposed"]
         return self
 
+    def to_numpy(self, dtype: object = None) -> object:
+        return self["widget"].to_numpy(self, dtype=dtype)
+
+    def to_pandas(self) -> object:
+        return self["widget"].to_pandas(self)
+
+    def to_arrow(self) -> object:
+        return self["widget"].to_arrow(self)
+
     def expand(self, direction: Literal["both", "table", "down", "right"] = "both") -> Span:
         if direction == "both" or direction == "table":
             self["upto_r"], self["upto_c"] = None, None
@@ -436,6 +530,84 @@ class DropdownStorage:
         return None
 
 
+class DropdownSearchIndex:
+    """
+    Built once per dropdown values list, gives the same
+    results as functions.dropdown_search_function without
+    lowering and scanning every row on each keystroke
+    """
+
+    __slots__ = ("lowered", "prefixes", "prefix_keys", "trigrams")
+
+    def __init__(self, data: Sequence[Sequence[object]]) -> None:
+        self.lowered = [f"{row[0]}".lower() for row in data]
+        order = sorted(range(len(self.lowered)), key=self.lowered.__getitem__)
+        self.prefixes = [self.lowered[rn] for rn in order]
+        # (length, row number) in sorted prefix order, the min of
+        # any slice is the shortest and earliest prefix match
+        self.prefix_keys = [(len(self.lowered[rn]), rn) for rn in order]
+        # built on first use, many searches never need it
+        self.trigrams = None
+
+    def search(self, search_for: str) -> int | None:
+        rn = self.prefix_match(search_for)
+        if rn is None:
+            rn = self.substring_match(search_for)
+        if rn is None:
+            rn = self.partial_match(search_for)
+        return rn
+
+    def prefix_match(self, search_for: str) -> int | None:
+        lo = bisect_left(self.prefixes, search_for)
+        hi = bisect_left(self.prefixes, f"{search_for}\U0010ffff", lo)
+        if lo == hi:
+            return None
+        return min(self.prefix_keys[lo:hi])[1]
+
+    def substring_match(self, search_for: str) -> int | None:
+        best = None
+        for rn in self.candidates(search_for):
+            if (st := self.lowered[rn].find(search_for)) > -1 and (
+                best is None or (st, len(self.lowered[rn]), rn) < best
+            ):
+                best = (st, len(self.lowered[rn]), rn)
+        return None if best is None else best[2]
+
+    def partial_match(self, search_for: str) -> int | None:
+        # longest part of search_for found in a row,
+        # then earliest start, then earliest row
+        search_len = len(search_for)
+        for numchars in range(search_len - 2, 1, -1):
+            best = None
+            for from_idx in range(search_len - numchars + 1):
+                part = search_for[from_idx : from_idx + numchars]
+                for rn in self.candidates(part):
+                    if (st := self.lowered[rn].find(part)) > -1 and (best is None or (st, rn) < best):
+                        best = (st, rn)
+            if best is not None:
+                return best[1]
+        return None
+
+    def candidates(self, search_for: str) -> Iterator[int]:
+        if len(search_for) < 3:
+            return range(len(self.lowered))
+        if self.trigrams is None:
+            self.trigrams = {}
+            for rn, s in enumerate(self.lowered):
+                for i in range(len(s) - 2):
+                    if (tg := s[i : i + 3]) in self.trigrams:
+                        self.trigrams[tg].add(rn)
+                    else:
+                        self.trigrams[tg] = {rn}
+        postings = []
+        for i in range(len(search_for) - 2):
+            if (tg := search_for[i : i + 3]) not in self.trigrams:
+                return ()
+            postings.append(self.trigrams[tg])
+        postings.sort(key=len)
+        return postings[0].intersection(*postings[1:])
+
+
 class TextEditorStorage:
     __slots__ = ("canvas_id", "window", "open")
 
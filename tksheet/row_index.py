@@ -43,6 +43,7 @@ from .functions import (
     event_dict,
     get_n2a,
     is_contiguous,
+    measure_text,
     new_tk_event,
     num2alpha,
     pickled_event_dict,
@@ -119,6 +120,8 @@ class RowIndex(tk.Canvas):
         self.currently_resizing_width = False
         self.currently_resizing_height = False
         self.ri_rc_popup_menu = None
+        self.index_widths = {}
+        self.index_widths_ops = None
         self.dropdown = DropdownStorage()
         self.text_editor = TextEditorStorage()
 
@@ -195,6 +198,8 @@ class RowIndex(tk.Canvas):
     def rc(self, event):
         self.mouseclick_outside_editor_or_dropdown_all_canvases(inside=True)
         self.focus_set()
+        if self.MT.rc_popup_menus_enabled:
+            self.MT.build_rc_menus()
         popup_menu = None
         if self.MT.identify_row(y=event.y, allow_end=False) is None:
             self.MT.deselect("all")
@@ -856,11 +861,13 @@ class RowIndex(tk.Canvas):
                     and r <= self.dragged_row.to_move[-1]
                     and is_contiguous(self.dragged_row.to_move)
                 )
+                and not self.MT.rows_view_ordered()
             ):
                 if r > self.dragged_row.to_move[-1]:
                     r += 1
                 if r > len(self.MT.row_positions) - 1:
                     r = len(self.MT.row_positions) - 1
+                self.MT.end_streams()
                 event_data = event_dict(
                     name="move_rows",
                     sheet=self.PAR.name,
@@ -1043,12 +1050,9 @@ class RowIndex(tk.Canvas):
     def get_cell_dimensions(self, datarn: int) -> tuple[int, int]:
         txt = self.get_valid_cell_data_as_str(datarn, fix=False)
         if txt:
-            self.MT.txt_measure_canvas.itemconfig(
-                self.MT.txt_measure_canvas_text, text=txt, font=self.PAR.ops.index_font
-            )
-            b = self.MT.txt_measure_canvas.bbox(self.MT.txt_measure_canvas_text)
-            w = b[2] - b[0] + 7
-            h = b[3] - b[1] + 5
+            w, h = measure_text(self, txt, self.PAR.ops.index_font)
+            w += 7
+            h += 5
         else:
             w = self.PAR.ops.default_row_index_width
             h = self.MT.min_row_height
@@ -1156,6 +1160,76 @@ class RowIndex(tk.Canvas):
             w = int(self.MT.max_index_width)
         return w
 
+    def get_visible_index_width(self, rows: Iterator[int]) -> int:
+        """
+        Widths of the visible index cells are kept along with the raw
+        label and cell options they were measured from, only rows
+        whose label or options changed or which have scrolled into
+        view are measured, rows which scrolled out of view are dropped
+        """
+        ops = (
+            self.PAR.ops.index_font,
+            self.PAR.ops.treeview,
+            self.PAR.ops.treeview_indent,
+            self.PAR.ops.default_row_index_width,
+            self.PAR.ops.default_row_index,
+            self.PAR.ops.show_default_index_for_empty,
+            self.align,
+        )
+        if ops != self.index_widths_ops:
+            self.index_widths = {}
+            self.index_widths_ops = ops
+        self.fix_index()
+        w = self.PAR.ops.default_row_index_width
+        if (not self.MT._row_index and isinstance(self.MT._row_index, list)) or (
+            isinstance(self.MT._row_index, int) and self.MT._row_index >= len(self.MT.data)
+        ):
+            return w
+        old_widths, widths = self.index_widths, {}
+        row_index = self.MT._row_index
+        index_is_list = isinstance(row_index, list)
+        len_index = len(row_index) if index_is_list else 0
+        treeview = self.PAR.ops.treeview
+        cell_options = self.cell_options
+        for datarn in rows:
+            if treeview:
+                # tree items can be renamed without being replaced
+                value = (
+                    row_index[datarn] if datarn < len_index else None,
+                    self.get_valid_cell_data_as_str(datarn, fix=False),
+                )
+            elif index_is_list:
+                # the type is kept too, e.g. 1 == 1.0 but their labels differ
+                value = row_index[datarn] if datarn < len_index else None
+                value = (value.__class__, value)
+            else:
+                # an index from a data column can be formatted
+                value = self.get_valid_cell_data_as_str(datarn, fix=False)
+            if (options := cell_options.get(datarn)) is None:
+                label = (value, None)
+            else:
+                label = (
+                    value,
+                    (
+                        d["text"] if (d := options.get("dropdown")) else None,
+                        c["text"] if (c := options.get("checkbox")) else None,
+                        bool(d or c),
+                        options.get("align"),
+                    ),
+                )
+            if (cached := old_widths.get(datarn)) is not None and cached[0] == label:
+                widths[datarn] = cached
+                cell_w = cached[1]
+            else:
+                cell_w = self.get_cell_dimensions(datarn)[0]
+                widths[datarn] = (label, cell_w)
+            if cell_w > w:
+                w = cell_w
+        self.index_widths = widths
+        if w > self.MT.max_index_width:
+            w = int(self.MT.max_index_width)
+        return w
+
     def set_width_of_index_to_text(
         self,
         text: None | str = None,
@@ -1168,9 +1242,7 @@ class RowIndex(tk.Canvas):
         ):
             return w
         if text is not None and text:
-            self.MT.txt_measure_canvas.itemconfig(self.MT.txt_measure_canvas_text, text=text)
-            b = self.MT.txt_measure_canvas.bbox(self.MT.txt_measure_canvas_text)
-            if (tw := b[2] - b[0] + 10) > w:
+            if (tw := measure_text(self, text, self.PAR.ops.index_font)[0] + 10) > w:
                 w = tw
         elif text is None:
             w = self.get_index_text_width(only_rows=only_rows)
@@ -1213,7 +1285,7 @@ class RowIndex(tk.Canvas):
             elif self.PAR.ops.default_row_index is None:
                 new_w = 20
         elif self.PAR.ops.auto_resize_row_index is True:
-            new_w = self.get_index_text_width(only_rows=only_rows)
+            new_w = self.get_visible_index_width(only_rows)
         else:
             new_w = None
         if new_w is not None and (sheet_w_x := floor(self.PAR.winfo_width() * 0.7)) < new_w:
@@ -1876,6 +1948,7 @@ class RowIndex(tk.Canvas):
         state: str = "normal",
         dropdown: bool = False,
     ) -> bool:
+        self.MT.end_streams()
         text = None
         extra_func_key = "??"
         if event is None or self.MT.event_opens_dropdown_or_checkbox(event):
@@ -2123,16 +2196,21 @@ class RowIndex(tk.Canvas):
     def get_dropdown_height_anchor(self, r: int, text_editor_h: None | int = None) -> tuple[int, str]:
         win_h = 5
         datarn = self.MT.datarn(r)
-        for i, v in enumerate(self.get_cell_kwargs(datarn, key="dropdown")["values"]):
-            v_numlines = len(v.split("\n") if isinstance(v, str) else f"{v}".split("\n"))
-            if v_numlines > 1:
-                win_h += (
-                    self.MT.index_first_ln_ins + (v_numlines * self.MT.index_xtra_lines_increment) + 5
-                )  # end of cell
-            else:
-                win_h += self.MT.min_row_height
-            if i == 5:
-                break
+        kwargs = self.get_cell_kwargs(datarn, key="dropdown")
+        if kwargs["values_provider"] is not None:
+            # values are not known until the provider returns
+            win_h += self.MT.min_row_height * min(6, kwargs["provider_limit"])
+        else:
+            for i, v in enumerate(kwargs["values"]):
+                v_numlines = len(v.split("\n") if isinstance(v, str) else f"{v}".split("\n"))
+                if v_numlines > 1:
+                    win_h += (
+                        self.MT.index_first_ln_ins + (v_numlines * self.MT.index_xtra_lines_increment) + 5
+                    )  # end of cell
+                else:
+                    win_h += self.MT.min_row_height
+                if i == 5:
+                    break
         if win_h > 500:
             win_h = 500
         space_bot = self.MT.get_space_bot(r, text_editor_h)
@@ -2164,6 +2242,7 @@ class RowIndex(tk.Canvas):
 
     # r is displayed row
     def open_dropdown_window(self, r: int, event: object = None) -> None:
+        self.MT.end_streams()
         self.hide_text_editor()
         kwargs = self.get_cell_kwargs(self.MT.datarn(r), key="dropdown")
         if kwargs["state"] == "normal":
@@ -2189,6 +2268,8 @@ class RowIndex(tk.Canvas):
             "outline_color": self.PAR.ops.index_selected_rows_bg,
             "align": self.get_cell_align(r),
             "values": kwargs["values"],
+            "values_provider": kwargs["values_provider"],
+            "provider_limit": kwargs["provider_limit"],
         }
         if self.dropdown.window:
             self.dropdown.window.reset(**reset_kwargs)
@@ -2204,6 +2285,7 @@ class RowIndex(tk.Canvas):
                 search_function=kwargs["search_function"],
                 arrowkey_RIGHT=self.MT.arrowkey_RIGHT,
                 arrowkey_LEFT=self.MT.arrowkey_LEFT,
+                provider_error=self.PAR.dropdown_provider_error,
             )
             self.dropdown.canvas_id = self.create_window(
                 (0, ypos),
@@ -2309,6 +2391,7 @@ class RowIndex(tk.Canvas):
 
     def hide_dropdown_window(self):
         if self.dropdown.open:
+            self.dropdown.window.cancel_provider()
             self.dropdown.window.unbind("<FocusOut>")
             self.itemconfig(self.dropdown.canvas_id, state="hidden")
             self.dropdown.open = False
@@ -2379,7 +2462,7 @@ class RowIndex(tk.Canvas):
         if self.cell_equal_to(datarn, value):
             return False
         kwargs = self.get_cell_kwargs(datarn, key="dropdown")
-        if kwargs and kwargs["validate_input"] and value not in kwargs["values"]:
+        if kwargs and kwargs["validate_input"] and kwargs["values_provider"] is None and value not in kwargs["values"]:
             return False
         return True
 
@@ -2470,6 +2553,7 @@ class RowIndex(tk.Canvas):
 
     # internal event use
     def click_checkbox(self, r: int, datarn: int | None = None, undo: bool = True, redraw: bool = True) -> None:
+        self.MT.end_streams()
         if datarn is None:
             datarn = r if self.MT.all_rows_displayed else self.MT.displayed_rows[r]
         kwargs = self.get_cell_kwargs(datarn, key="checkbox")
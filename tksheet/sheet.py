@@ -8,6 +8,7 @@ import tkinter as tk
 from bisect import bisect_left
 from collections import defaultdict, deque
 from collections.abc import (
+    Awaitable,
     Callable,
     Generator,
     Hashable,
@@ -18,7 +19,6 @@ from functools import partial
 from itertools import (
     accumulate,
     chain,
-    filterfalse,
     islice,
     product,
     repeat,
@@ -32,37 +32,52 @@ from .column_headers import ColumnHeaders
 from .functions import (
     add_highlight,
     add_to_options,
+    check_sample_size,
     consecutive_ranges,
     convert_align,
+    data_labels,
     data_to_displayed_idxs,
+    data_to_rows,
     del_from_options,
     del_named_span_options,
     del_named_span_options_nested,
     dropdown_search_function,
+    dropdown_style_options,
     event_dict,
+    exhaust,
+    find_regex,
     fix_format_kwargs,
     force_bool,
+    found_boxes,
     get_checkbox_dict,
     get_checkbox_kwargs,
     get_dropdown_dict,
     get_dropdown_kwargs,
     idx_param_to_int,
+    index_value,
     is_iterable,
     key_to_span,
+    merge_displayed,
     new_tk_event,
     num2alpha,
+    open_state_file,
     pickled_event_dict,
-    pop_positions,
+    run_awaitable,
     set_align,
     set_readonly,
+    sort_key,
     span_froms,
     span_ranges,
+    split_positions,
     tksheet_type_error,
     unpack,
+    write_state_file,
 )
 from .main_table import MainTable
 from .other_classes import (
+    Box_nt,
     DotDict,
+    DropdownSearchIndex,
     EventDataDict,
     FontTuple,
     GeneratedMouseEvent,
@@ -90,6 +105,7 @@ from .types import (
 )
 from .vars import (
     USER_OS,
+    arrow_index_name,
     backwards_compatibility_keys,
     emitted_events,
     named_span_types,
@@ -155,13 +171,21 @@ class Sheet(tk.Frame):
         paste_can_expand_y: bool = False,
         paste_insert_column_limit: int | None = None,
         paste_insert_row_limit: int | None = None,
+        paste_stream_threshold: int | None = None,
+        paste_stream_chunk_rows: int = 5000,
+        copy_stream_threshold: int | None = None,
+        copy_stream_chunk_rows: int = 5000,
+        batch_modified_events: bool = False,
+        rectangular_data: bool = False,
         show_dropdown_borders: bool = False,
+        dropdown_sample_size: int | None = None,
+        dropdown_provider_delay: int = 150,
         arrow_key_down_right_scroll_page: bool = False,
         cell_auto_resize_enabled: bool = True,
         auto_resize_row_index: bool | Literal["empty"] = "empty",
         auto_resize_columns: int | None = None,
         auto_resize_rows: int | None = None,
-        set_cell_sizes_on_zoom: bool = False,
+        set_cell_sizes_on_zoom: bool | Literal["visible"] = False,
         font: tuple[str, int, str] = FontTuple(
             "Calibri",
             13 if USER_OS == "darwin" else 11,
@@ -323,12 +347,15 @@ class Sheet(tk.Frame):
             if isinstance(from_clipboard_delimiters, str)
             else "".join(from_clipboard_delimiters)
         )
+        check_sample_size("dropdown_sample_size", dropdown_sample_size)
         self.PAR = parent
         self.name = name
         self.last_event_data = EventDataDict()
         self.bound_events = DotDict({k: [] for k in emitted_events})
         self.dropdown_class = Dropdown
         self.after_redraw_id = None
+        self.after_modified_id = None
+        self.modified_batch = []
         self.after_redraw_time_ms = after_redraw_time_ms
         self.named_span_id = 0
         if width is not None or height is not None:
@@ -468,9 +495,6 @@ class Sheet(tk.Frame):
             self.yscroll_showing = False
             self.yscroll_disabled = True
         self.update_idletasks()
-        self.MT.update_idletasks()
-        self.RI.update_idletasks()
-        self.CH.update_idletasks()
         if theme != "light blue":
             self.change_theme(theme)
             for k, v in locals().items():
@@ -503,8 +527,10 @@ class Sheet(tk.Frame):
                     self.see(0, startup_select[0])
             except Exception:
                 pass
-
-        self.refresh()
+        # the first draw is done after construction so that
+        # it is shared with any redraws that follow, e.g. when
+        # a Dropdown sets its values
+        self.set_refresh_timer()
         if startup_focus:
             self.MT.focus_set()
 
@@ -1034,6 +1060,10 @@ class Sheet(tk.Frame):
         self.MT.edit_validation_func = func
         return self
 
+    def bulk_table_edit_validation(self, func: Callable | None = None) -> Sheet:
+        self.MT.bulk_table_edit_validation_func = func
+        return self
+
     def popup_menu_add_command(
         self,
         label: str,
@@ -1089,6 +1119,12 @@ class Sheet(tk.Frame):
     def delete(self, event: object = None, validation: bool = True) -> None | EventDataDict:
         return self.MT.delete_key(event, validation)
 
+    def cancel_paste(self) -> bool:
+        return self.MT.cancel_paste()
+
+    def cancel_copy(self) -> bool:
+        return self.MT.cancel_copy()
+
     def undo(self, event: object = None) -> None | EventDataDict:
         return self.MT.undo(event)
 
@@ -1267,6 +1303,7 @@ class Sheet(tk.Frame):
                 range(rng_from_c, rng_upto_c),
                 type_,
             )
+        self.MT.clear_value_caches()
         del self.MT.named_spans[name]
         return self
 
@@ -1445,6 +1482,60 @@ class Sheet(tk.Frame):
             return span.convert(res)
         return res
 
+    def span_columns(self, span: Span) -> tuple[list[object], list[list[object]], list[object] | None]:
+        """
+        Gets a span's table data one column at a time
+        Returns the column names, columns and index, the names are
+        the header values if span.header else the column indexes
+        The index is None unless span.index
+        """
+        rows, cols = self.ranges_from_span(span)
+        fmt_kw = span.kwargs if span.type_ == "format" and span.kwargs else None
+        columns = [self.MT.get_span_column(rows, datacn, span.tdisp, fmt_kw) for datacn in cols]
+        if span.header:
+            names = [self.CH.get_cell_data(datacn, get_displayed=span.hdisp) for datacn in cols]
+        else:
+            names = list(cols)
+        index = [self.RI.get_cell_data(datarn, get_displayed=span.idisp) for datarn in rows] if span.index else None
+        return names, columns, index
+
+    def to_numpy(self, *key: CreateSpanTypes, dtype: object = None) -> object:
+        import numpy
+
+        span = self.span_from_key(*key)
+        arr = numpy.array(self.span_columns(span)[1], dtype=dtype)
+        return arr if span.transposed or arr.ndim < 2 else arr.T
+
+    def to_pandas(self, *key: CreateSpanTypes) -> object:
+        import pandas
+
+        span = self.span_from_key(*key)
+        names, columns, index = self.span_columns(span)
+        df = pandas.DataFrame(dict(enumerate(columns)), index=index)
+        df.columns = names
+        return df.T if span.transposed else df
+
+    def to_arrow(self, *key: CreateSpanTypes) -> object:
+        import pyarrow
+
+        span = self.span_from_key(*key)
+        names, columns, index = self.span_columns(span)
+        if span.transposed:
+            # the same layout as to_pandas(), each row becomes a
+            # column named by its index value or its position
+            names, columns, index = (
+                list(range(len(columns[0]) if columns else 0)) if index is None else index,
+                list(map(list, zip(*columns))),
+                names,
+            )
+        arrays = list(map(pyarrow.array, columns))
+        names = [f"{name}" for name in names]
+        if index is not None:
+            # stored the same way as pyarrow.Table.from_pandas() stores a DataFrame index
+            arrays.insert(0, pyarrow.array(index))
+            names.insert(0, arrow_index_name)
+        return pyarrow.Table.from_arrays(arrays, names=names)
+
     def get_total_rows(self, include_index: bool = False) -> int:
         return self.MT.total_data_rows(include_index=include_index)
 
@@ -1534,7 +1625,7 @@ class Sheet(tk.Frame):
 
     def set_sheet_data(
         self,
-        data: list | tuple | None = None,
+        data: list | tuple | object | None = None,
         reset_col_positions: bool = True,
         reset_row_positions: bool = True,
         redraw: bool = True,
@@ -1545,12 +1636,15 @@ class Sheet(tk.Frame):
     ) -> object:
         if data is None:
             data = []
+        labels = data_labels(data)
+        data = data_to_rows(data)
         if verify and (not isinstance(data, list) or not all(isinstance(row, list) for row in data)):
             raise ValueError("Data argument must be a list of lists, sublists being rows")
         if delete_options:
             self.reset_all_options()
         elif reset_highlights:
             self.dehighlight_all()
+        self.MT.set_data_labels(*labels)
         return self.MT.data_reference(
             data,
             reset_col_positions,
@@ -1892,6 +1986,161 @@ class Sheet(tk.Frame):
         self.set_refresh_timer(redraw)
         return event_data
 
+    def find_iter(
+        self,
+        pattern: str,
+        *key: CreateSpanTypes,
+        regex: bool = False,
+        match_case: bool = False,
+        whole_cell: bool = False,
+        get_displayed: bool = True,
+    ) -> Iterator[Box_nt]:
+        rows, cols = self.ranges_from_span(self.span_from_key(*key))
+        return found_boxes(
+            self.MT.find_rows(
+                rows,
+                cols,
+                find_regex(pattern, regex, match_case, whole_cell).search,
+                get_displayed,
+            )
+        )
+
+    def find_all(
+        self,
+        pattern: str,
+        *key: CreateSpanTypes,
+        regex: bool = False,
+        match_case: bool = False,
+        whole_cell: bool = False,
+        get_displayed: bool = True,
+        highlight: str | None = "yellow",
+        callback: Callable | None = None,
+        time_slice: int = 20,
+        redraw: bool = True,
+    ) -> list[Box_nt] | None:
+        rows, cols = self.ranges_from_span(self.span_from_key(*key))
+        scan = self.MT.find_rows(
+            rows,
+            cols,
+            find_regex(pattern, regex, match_case, whole_cell).search,
+            get_displayed,
+        )
+        if callback is not None:
+            self.MT.start_find(scan, callback, highlight, time_slice)
+            return None
+        self.MT.cancel_find()
+        found = list(scan)
+        self.MT.set_found_cells(chain.from_iterable(found), highlight)
+        self.set_refresh_timer(redraw)
+        return list(found_boxes(found))
+
+    def cancel_find(self) -> bool:
+        return self.MT.cancel_find()
+
+    def clear_found(self, redraw: bool = True) -> Sheet:
+        self.MT.cancel_find()
+        self.MT.found_cells = {}
+        return self.set_refresh_timer(redraw)
+
+    def replace_all(
+        self,
+        pattern: str,
+        replacement: str,
+        *key: CreateSpanTypes,
+        regex: bool = False,
+        match_case: bool = False,
+        whole_cell: bool = False,
+        undo: bool | None = None,
+        emit_event: bool | None = None,
+        redraw: bool = True,
+    ) -> EventDataDict:
+        self.MT.end_streams()
+        span = self.span_from_key(*key)
+        rows, cols = self.ranges_from_span(span)
+        compiled = find_regex(pattern, regex, match_case, whole_cell)
+        if not regex:
+            replacement = replacement.replace("\\", "\\\\")
+        get_str = self.MT.get_valid_cell_data_as_str
+        set_t = self.event_data_set_table_cell
+        event_data = event_dict(
+            name="edit_table",
+            sheet=self.name,
+            widget=self,
+            selected=self.MT.selected,
+        )
+        for cells in self.MT.find_rows(rows, cols, compiled.search, get_displayed=False):
+            for datarn, datacn in cells:
+                # a cell whose text is unchanged keeps its value and type
+                if (text := compiled.sub(replacement, old := get_str(datarn, datacn))) != old:
+                    event_data = set_t(datarn, datacn, text, event_data, check_readonly=True)
+        if event_data["cells"]["table"]:
+            if undo is True or (undo is None and span.undo):
+                self.MT.undo_stack.append(pickled_event_dict(event_data))
+            if emit_event is True or (emit_event is None and span.emit_event):
+                self.emit_event("<<SheetModified>>", event_data)
+        self.set_refresh_timer(redraw)
+        return event_data
+
+    def to_csv(
+        self,
+        path_or_file: str | object,
+        *key: CreateSpanTypes,
+        displayed_only: bool = False,
+        get_displayed: bool = True,
+        header: bool = False,
+        index: bool = False,
+        delimiter: str = ",",
+        quotechar: str = '"',
+        lineterminator: str = "\r\n",
+        encoding: str = "utf-8",
+        chunk_rows: int = 5000,
+        stream: bool = False,
+    ) -> int | None:
+        rows, cols = self.ranges_from_span(self.span_from_key(*key))
+        # displayed rows may be in a view order so they are not bisected
+        if displayed_only and not self.MT.all_rows_displayed:
+            disp = set(self.MT.displayed_rows)
+            rows = [r for r in rows if r in disp]
+        if displayed_only and not self.MT.all_columns_displayed:
+            disp = set(self.MT.displayed_columns)
+            cols = [c for c in cols if c in disp]
+        self.MT.cancel_export()
+        if close := isinstance(path_or_file, str):
+            path_or_file = open(path_or_file, "w", newline="", encoding=encoding)
+        export = self.MT.write_csv(
+            path_or_file,
+            close,
+            rows,
+            cols,
+            get_displayed=get_displayed,
+            header=header,
+            index=index,
+            chunk=max(1, chunk_rows),
+            delimiter=delimiter,
+            quotechar=quotechar,
+            lineterminator=lineterminator,
+        )
+        if stream:
+            # starts the export so that the file
+            # is closed if it is cancelled
+            next(export)
+            self.MT.export_stream = export
+            self.after(1, self.MT.export_step)
+            return None
+        exhaust(export)
+        return len(rows)
+
+    def cancel_export(self) -> bool:
+        return self.MT.cancel_export()
+
+    def save_state(self, path: str, chunk_rows: int = 5000) -> int:
+        return write_state_file(path, self.MT.state_sections(max(1, chunk_rows)))
+
+    def load_state(self, path: str, memory_map: bool = True, redraw: bool = True) -> Sheet:
+        with open_state_file(path, memory_map) as sections:
+            self.MT.restore_state(sections)
+        return self.set_refresh_timer(redraw)
+
     def event_data_set_table_cell(
         self,
         datarn: int,
@@ -2034,6 +2283,7 @@ class Sheet(tk.Frame):
         if self.MT.all_rows_displayed:
             displayed_ins_idx = idx
         else:
+            self.MT.end_rows_view_order()
             displayed_ins_idx = bisect_left(self.MT.displayed_rows, idx)
         event_data = self.MT.add_rows(
             *self.MT.get_args_for_add_rows(
@@ -2353,6 +2603,7 @@ class Sheet(tk.Frame):
         move_heights: bool = True,
         redraw: bool = True,
     ) -> tuple[dict, dict, dict]:
+        self.MT.end_rows_view_order()
         data_idxs, disp_idxs, event_data = self.MT.move_rows_adjust_options_dict(
             *self.MT.get_args_for_move_rows(
                 move_to=move_to,
@@ -2401,6 +2652,55 @@ class Sheet(tk.Frame):
         self.set_refresh_timer(redraw)
         return data_idxs, disp_idxs, event_data
 
+    def sort_rows(
+        self,
+        by_columns: int | Iterator[int] = 0,
+        key: Callable | None = None,
+        reverse: bool = False,
+        undo: bool = False,
+        emit_event: bool = False,
+        redraw: bool = True,
+    ) -> EventDataDict:
+        """
+        Sorts all the data rows by the values in one or more data
+        columns, the sort is stable so sorting by one column then
+        another keeps the first order between equal values
+        """
+        if self.ops.treeview:
+            raise ValueError("Rows cannot be sorted in treeview mode.")
+        event_data = self.MT.sort_rows(
+            by_columns=[by_columns] if isinstance(by_columns, int) else list(by_columns),
+            key=key,
+            reverse=reverse,
+        )
+        if undo:
+            self.MT.undo_stack.append(pickled_event_dict(event_data))
+        if emit_event:
+            self.emit_event("<<SheetModified>>", event_data)
+        self.set_refresh_timer(redraw)
+        return event_data
+
+    def sort_columns(
+        self,
+        by_rows: int | Iterator[int] = 0,
+        key: Callable | None = None,
+        reverse: bool = False,
+        undo: bool = False,
+        emit_event: bool = False,
+        redraw: bool = True,
+    ) -> EventDataDict:
+        event_data = self.MT.sort_columns(
+            by_rows=[by_rows] if isinstance(by_rows, int) else list(by_rows),
+            key=key,
+            reverse=reverse,
+        )
+        if undo:
+            self.MT.undo_stack.append(pickled_event_dict(event_data))
+        if emit_event:
+            self.emit_event("<<SheetModified>>", event_data)
+        self.set_refresh_timer(redraw)
+        return event_data
+
     def mapping_move_columns(
         self,
         data_new_idxs: dict[int, int],
@@ -2439,6 +2739,7 @@ class Sheet(tk.Frame):
         emit_event: bool = False,
         redraw: bool = True,
     ) -> tuple[dict[int, int], dict[int, int], EventDataDict]:
+        self.MT.end_rows_view_order()
         data_idxs, disp_idxs, event_data = self.MT.move_rows_adjust_options_dict(
             data_new_idxs=data_new_idxs,
             data_old_idxs=dict(zip(data_new_idxs.values(), data_new_idxs)),
@@ -2575,6 +2876,8 @@ class Sheet(tk.Frame):
         search_function: Callable | None = None,
         validate_input: bool = True,
         text: None | str = None,
+        values_provider: Callable | None = None,
+        provider_limit: int = 100,
     ) -> Span:
         if not search_function:
             search_function = dropdown_search_function
@@ -2587,6 +2890,8 @@ class Sheet(tk.Frame):
             "search_function": search_function,
             "validate_input": validate_input,
             "text": text,
+            "values_provider": values_provider,
+            "provider_limit": provider_limit,
         }
         d = get_dropdown_dict(**kwargs)
         span = self.span_from_key(*key)
@@ -3887,32 +4192,16 @@ class Sheet(tk.Frame):
             if not columns:
                 return
         if self.MT.all_columns_displayed:
-            self.MT.displayed_columns = list(filterfalse(columns.__contains__, range(self.MT.total_data_cols())))
-            to_pop = {c: c for c in columns}
+            displayed = list(range(self.MT.total_data_cols()))
+            positions = sorted(columns)
         else:
-            to_pop = {}
-            new_disp = []
-            if data_indexes:
-                for i, c in enumerate(self.MT.displayed_columns):
-                    if c not in columns:
-                        new_disp.append(c)
-                    else:
-                        to_pop[i] = c
-            else:
-                for i, c in enumerate(self.MT.displayed_columns):
-                    if i not in columns:
-                        new_disp.append(c)
-                    else:
-                        to_pop[i] = c
-            self.MT.displayed_columns = new_disp
+            displayed = self.MT.displayed_columns
+            positions = data_to_displayed_idxs(columns, displayed) if data_indexes else sorted(columns)
+        self.MT.displayed_columns, hidden = split_positions(displayed, positions)
         self.MT.all_columns_displayed = False
-        self.MT.set_col_positions(
-            pop_positions(
-                itr=self.MT.gen_column_widths,
-                to_pop=to_pop,
-                save_to=self.MT.saved_column_widths,
-            ),
-        )
+        widths, hidden_widths = split_positions(self.MT.get_column_widths(), positions)
+        self.MT.saved_column_widths.update(zip(hidden, hidden_widths))
+        self.MT.set_col_positions(widths)
         if deselect_all:
             self.MT.deselect(redraw=False)
         return self.set_refresh_timer(redraw)
@@ -3929,15 +4218,13 @@ class Sheet(tk.Frame):
         """
         if self.MT.all_columns_displayed:
             return
-        if isinstance(columns, int):
-            columns = [columns]
-        cws = self.MT.get_column_widths()
-        for column in columns:
-            idx = bisect_left(self.MT.displayed_columns, column)
-            if len(self.MT.displayed_columns) == idx or self.MT.displayed_columns[idx] != column:
-                self.MT.displayed_columns.insert(idx, column)
-                cws.insert(idx, self.MT.saved_column_widths.pop(column, self.ops.default_column_width))
-        self.MT.set_col_positions(cws)
+        self.MT.displayed_columns, widths = merge_displayed(
+            displayed=self.MT.displayed_columns,
+            sizes=self.MT.get_column_widths(),
+            to_show=[columns] if isinstance(columns, int) else sorted(set(columns)),
+            new_size=lambda c: self.MT.saved_column_widths.pop(c, self.ops.default_column_width),
+        )
+        self.MT.set_col_positions(widths)
         if deselect_all:
             self.MT.deselect(redraw=False)
         return self.set_refresh_timer(redraw)
@@ -4005,6 +4292,66 @@ class Sheet(tk.Frame):
         self.set_refresh_timer(redraw)
         return res
 
+    def view_rows(
+        self,
+        sort_by: int | Iterator[int] | None = None,
+        key: Callable | None = None,
+        reverse: bool | Iterator[bool] = False,
+        filters: dict[int, Callable | object] | None = None,
+        redraw: bool = True,
+    ) -> list[int]:
+        if self.ops.treeview:
+            raise ValueError("Row views cannot be used in treeview mode.")
+        if sort_by is None:
+            sort_by = []
+        elif isinstance(sort_by, int):
+            sort_by = [sort_by]
+        else:
+            sort_by = list(sort_by)
+        rows = self.MT.view_rows(
+            sort_by=sort_by,
+            key=key,
+            reverse=[reverse] * len(sort_by) if isinstance(reverse, bool) else list(reverse),
+            filters=filters,
+        )
+        self.set_refresh_timer(redraw)
+        return rows
+
+    def value_rows(self, column: int, value: object, get_displayed: bool = False) -> list[int]:
+        return self.MT.get_value_index(column, get_displayed).get(index_value(value), []).copy()
+
+    def distinct_values(self, column: int, get_displayed: bool = False) -> list[object]:
+        return sorted(self.MT.get_value_index(column, get_displayed), key=sort_key)
+
+    def select_rows_with_value(
+        self,
+        column: int,
+        value: object,
+        get_displayed: bool = False,
+        redraw: bool = True,
+        run_binding_func: bool = True,
+    ) -> list[int]:
+        self.MT.deselect("all", redraw=False)
+        rows = self.value_rows(column, value, get_displayed)
+        if not self.MT.all_rows_displayed:
+            if self.MT.rows_view_ordered():
+                disprns = {datarn: disprn for disprn, datarn in enumerate(self.MT.displayed_rows)}
+                rows = sorted(disprns[datarn] for datarn in rows if datarn in disprns)
+            else:
+                disprows = self.MT.displayed_rows
+                rows = [
+                    disprn
+                    for datarn in rows
+                    if (disprn := bisect_left(disprows, datarn)) < len(disprows) and disprows[disprn] == datarn
+                ]
+        last_col = len(self.MT.col_positions) - 1
+        for i, (r1, r2) in enumerate(consecutive_ranges(rows)):
+            self.MT.create_selection_box(r1, 0, r2, last_col, "rows", set_current=not i, ext=True)
+        if run_binding_func:
+            self.MT.run_selection_binding("rows")
+        self.set_refresh_timer(redraw)
+        return rows
+
     def hide_rows(
         self,
         rows: int | set[int] | Iterator[int],
@@ -4020,33 +4367,17 @@ class Sheet(tk.Frame):
             if not rows:
                 return
         if self.MT.all_rows_displayed:
-            self.MT.displayed_rows = list(filterfalse(rows.__contains__, range(self.MT.total_data_rows())))
-            to_pop = {r: r for r in rows}
+            displayed = list(range(self.MT.total_data_rows()))
+            positions = sorted(rows)
         else:
-            to_pop = {}
-            new_disp = []
-            if data_indexes:
-                for i, r in enumerate(self.MT.displayed_rows):
-                    if r not in rows:
-                        new_disp.append(r)
-                    else:
-                        to_pop[i] = r
-            else:
-                for i, r in enumerate(self.MT.displayed_rows):
-                    if i not in rows:
-                        new_disp.append(r)
-                    else:
-                        to_pop[i] = r
-            self.MT.displayed_rows = new_disp
+            displayed = self.MT.displayed_rows
+            positions = data_to_displayed_idxs(rows, displayed) if data_indexes else sorted(rows)
+        self.MT.displayed_rows, hidden = split_positions(displayed, positions)
         self.MT.all_rows_displayed = False
         if row_heights:
-            self.MT.set_row_positions(
-                pop_positions(
-                    itr=self.MT.gen_row_heights,
-                    to_pop=to_pop,
-                    save_to=self.MT.saved_row_heights,
-                ),
-            )
+            heights, hidden_heights = split_positions(self.MT.get_row_heights(), positions)
+            self.MT.saved_row_heights.update(zip(hidden, hidden_heights))
+            self.MT.set_row_positions(heights)
         if deselect_all:
             self.MT.deselect(redraw=False)
         return self.set_refresh_timer(redraw)
@@ -4063,15 +4394,15 @@ class Sheet(tk.Frame):
         """
         if self.MT.all_rows_displayed:
             return
-        if isinstance(rows, int):
-            rows = [rows]
-        rhs = self.MT.get_row_heights()
-        for row in rows:
-            idx = bisect_left(self.MT.displayed_rows, row)
-            if len(self.MT.displayed_rows) == idx or self.MT.displayed_rows[idx] != row:
-                self.MT.displayed_rows.insert(idx, row)
-                rhs.insert(idx, self.MT.saved_row_heights.pop(row, self.MT.get_default_row_height()))
-        self.MT.set_row_positions(rhs)
+        self.MT.end_rows_view_order()
+        default_row_height = self.MT.get_default_row_height()
+        self.MT.displayed_rows, heights = merge_displayed(
+            displayed=self.MT.displayed_rows,
+            sizes=self.MT.get_row_heights(),
+            to_show=[rows] if isinstance(rows, int) else sorted(set(rows)),
+            new_size=lambda r: self.MT.saved_row_heights.pop(r, default_row_height),
+        )
+        self.MT.set_row_positions(heights)
         if deselect_all:
             self.MT.deselect(redraw=False)
         return self.set_refresh_timer(redraw)
@@ -4312,6 +4643,10 @@ class Sheet(tk.Frame):
     # Sheet Options and Other Functions
 
     def set_options(self, redraw: bool = True, **kwargs) -> Sheet:
+        if "dropdown_sample_size" in kwargs:
+            check_sample_size("dropdown_sample_size", kwargs["dropdown_sample_size"])
+        if kwargs.get("rectangular_data"):
+            self.MT.check_rectangular(self.MT.data)
         for k, v in kwargs.items():
             if k in self.ops and v != self.ops[k]:
                 if k.endswith("bindings"):
@@ -4525,6 +4860,14 @@ class Sheet(tk.Frame):
 
     refresh = redraw
 
+    def data_changed(self, redraw: bool = True) -> Sheet:
+        """
+        Tells the sheet that rows in the table data were
+        lengthened or shortened without using Sheet functions
+        """
+        self.MT.reset_data_cols()
+        return self.set_refresh_timer(redraw)
+
     # Progress Bars
 
     def create_progress_bar(
@@ -5283,6 +5626,8 @@ class Sheet(tk.Frame):
                 r_ctr += 1
             self.RI.remove_node_from_parents_children(item_node)
             self.RI.tree[item].parent = ""
+        # moved items and their descendants can change tree level
+        self.RI.index_widths = {}
         self.mapping_move_rows(
             data_new_idxs=mapping,
             data_indexes=True,
@@ -5449,11 +5794,50 @@ class Sheet(tk.Frame):
         event: str,
         data: EventDataDict | None = None,
     ) -> None:
+        funcs = self.bound_events[event]
         if data is None:
             data = EventDataDict()
         data["sheetname"] = self.name
         self.last_event_data = data
-        for func in self.bound_events[event]:
+        if not funcs:
+            return
+        if event == "<<SheetModified>>" and self.ops.batch_modified_events:
+            self.modified_batch.append(data)
+            if self.after_modified_id is None:
+                self.after_modified_id = self.after_idle(self.emit_modified_batch)
+            return
+        for func in funcs:
+            func(data)
+
+    def dropdown_provider_error(
+        self,
+        error: Exception,
+        search_for: str,
+        loc: int | tuple[int, int],
+    ) -> bool:
+        if not self.bound_events["<<DropdownProviderError>>"]:
+            return False
+        event_data = event_dict(name="dropdown_provider_error", sheet=self.name, value=search_for, loc=loc)
+        event_data["error"] = error
+        self.emit_event("<<DropdownProviderError>>", event_data)
+        return True
+
+    def emit_modified_batch(self) -> None:
+        self.after_modified_id = None
+        batch, self.modified_batch = self.modified_batch, []
+        if not batch:
+            return
+        if len(batch) == 1:
+            data = batch[0]
+        else:
+            data = event_dict(name="batch", sheet=self.name, data=batch)
+            # the first old value of a cell is kept when it is edited more than once
+            for event_data in batch:
+                for k in ("table", "header", "index"):
+                    cells = data["cells"][k]
+                    for key, value in event_data["cells"][k].items():
+                        cells.setdefault(key, value)
+        for func in self.bound_events["<<SheetModified>>"]:
             func(data)
 
     def set_refresh_timer(self, redraw: bool = True) -> Sheet:
@@ -5483,21 +5867,31 @@ class Sheet(tk.Frame):
         # table
         if table and span.kind == "cell":
             del_from_options(self.MT.cell_options, key, product(rows, cols))
+            for c in cols:
+                self.MT.clear_value_caches(c)
         elif table and span.kind == "row":
             del_from_options(self.MT.row_options, key, rows)
+            self.MT.clear_value_caches()
         elif table and span.kind == "column":
             del_from_options(self.MT.col_options, key, cols)
+            for c in cols:
+                self.MT.clear_value_caches(c)
         self.set_refresh_timer(redraw)
         return span
 
     #  ##########       TABLE       ##########
 
+    # these are also used before adding options, the cached values
+    # of the column are cleared so that they are rebuilt afterwards
+
     def del_cell_options_dropdown(self, datarn: int, datacn: int) -> None:
         self.MT.hide_dropdown_window()
+        self.MT.clear_value_caches(datacn)
         if (datarn, datacn) in self.MT.cell_options and "dropdown" in self.MT.cell_options[(datarn, datacn)]:
             del self.MT.cell_options[(datarn, datacn)]["dropdown"]
 
     def del_cell_options_checkbox(self, datarn: int, datacn: int) -> None:
+        self.MT.clear_value_caches(datacn)
         if (datarn, datacn) in self.MT.cell_options and "checkbox" in self.MT.cell_options[(datarn, datacn)]:
             del self.MT.cell_options[(datarn, datacn)]["checkbox"]
 
@@ -5507,10 +5901,12 @@ class Sheet(tk.Frame):
 
     def del_row_options_dropdown(self, datarn: int) -> None:
         self.MT.hide_dropdown_window()
+        self.MT.clear_value_caches()
         if datarn in self.MT.row_options and "dropdown" in self.MT.row_options[datarn]:
             del self.MT.row_options[datarn]["dropdown"]
 
     def del_row_options_checkbox(self, datarn: int) -> None:
+        self.MT.clear_value_caches()
         if datarn in self.MT.row_options and "checkbox" in self.MT.row_options[datarn]:
             del self.MT.row_options[datarn]["checkbox"]
 
@@ -5520,10 +5916,12 @@ class Sheet(tk.Frame):
 
     def del_column_options_dropdown(self, datacn: int) -> None:
         self.MT.hide_dropdown_window()
+        self.MT.clear_value_caches(datacn)
         if datacn in self.MT.col_options and "dropdown" in self.MT.col_options[datacn]:
             del self.MT.col_options[datacn]["dropdown"]
 
     def del_column_options_checkbox(self, datacn: int) -> None:
+        self.MT.clear_value_caches(datacn)
         if datacn in self.MT.col_options and "checkbox" in self.MT.col_options[datacn]:
             del self.MT.col_options[datacn]["checkbox"]
 
@@ -5755,6 +6153,9 @@ class Sheet(tk.Frame):
                         self.MT.data[r].append(v)
                     else:
                         self.set_cell_data(r=r, c=c, value=v, redraw=False, keep_formatting=keep_formatting)
+            if self.ops.rectangular_data:
+                self.MT.fix_row_len(r, len(self.MT.data[r]) - 1)
+            self.MT.track_data_cols(len(self.MT.data[r]))
         return self.set_refresh_timer(redraw)
 
     def set_column_data(
@@ -6975,6 +7376,9 @@ class Dropdown(Sheet):
         # "r" for r
         # "c" for c
         single_index: Literal["r", "c"] | bool = False,
+        values_provider: Callable | None = None,
+        provider_limit: int = 100,
+        provider_error: Callable | None = None,
     ) -> None:
         Sheet.__init__(
             self,
@@ -6993,6 +7397,9 @@ class Dropdown(Sheet):
             set_cell_sizes_on_zoom=True,
             show_selected_cells_border=False,
             scrollbar_show_arrows=False,
+            # the colors and font are set while the sheet is built
+            # so the first reset() has no options left to change
+            **dropdown_style_options(ops, outline_color, font),
         )
         self.parent = parent
         self.close_dropdown_window = close_dropdown_window
@@ -7000,6 +7407,17 @@ class Dropdown(Sheet):
         self.arrowkey_RIGHT = arrowkey_RIGHT
         self.arrowkey_LEFT = arrowkey_LEFT
         self.single_index = single_index
+        self.search_index = None
+        self.loaded_values = None
+        self.loaded_font = None
+        self.values_width = None
+        self.values_provider = None
+        self.provider_limit = provider_limit
+        self.provider_error = provider_error
+        self.provider_delay = 150
+        self.provider_request_id = 0
+        self.provider_after_id = None
+        self.provider_future = None
         self.bind("<Motion>", self.mouse_motion)
         self.bind("<ButtonPress-1>", self.b1)
         self.bind("<Up>", self.arrowkey_UP)
@@ -7010,7 +7428,19 @@ class Dropdown(Sheet):
         self.bind("<Prior>", self.arrowkey_UP)
         self.bind("<Next>", self.arrowkey_DOWN)
         self.bind("<Return>", self.b1)
-        self.reset(r, c, width, height, font, ops, outline_color, align, values)
+        self.reset(
+            r,
+            c,
+            width,
+            height,
+            font,
+            ops,
+            outline_color,
+            align,
+            values,
+            values_provider,
+            provider_limit,
+        )
 
     def reset(
         self,
@@ -7023,29 +7453,36 @@ class Dropdown(Sheet):
         outline_color: str,
         align: str,
         values: list[object] | None = None,
+        values_provider: Callable | None = None,
+        provider_limit: int = 100,
     ) -> None:
+        self.cancel_provider()
+        self.values_provider = values_provider
+        self.provider_limit = provider_limit
+        self.provider_delay = ops.dropdown_provider_delay
         self.deselect(redraw=False)
         self.r = r
         self.c = c
         self.row = -1
         self.height_and_width(height=height, width=width)
         self.table_align(align)
-        self.set_options(
-            outline_color=outline_color,
-            table_grid_fg=ops.popup_menu_fg,
-            table_selected_cells_border_fg=ops.popup_menu_fg,
-            table_selected_cells_bg=ops.popup_menu_highlight_bg,
-            table_selected_rows_border_fg=ops.popup_menu_fg,
-            table_selected_rows_bg=ops.popup_menu_highlight_bg,
-            table_selected_rows_fg=ops.popup_menu_highlight_fg,
-            table_selected_box_cells_fg=ops.popup_menu_highlight_bg,
-            table_selected_box_rows_fg=ops.popup_menu_highlight_bg,
-            font=font,
-            table_fg=ops.popup_menu_fg,
-            table_bg=ops.popup_menu_bg,
-            **{k: ops[k] for k in scrollbar_options_keys},
+        # set_options() sets the font and restyles the scrollbars
+        # so only the options which have changed are given to it
+        if options := {
+            k: v
+            for k, v in dropdown_style_options(ops, outline_color, font).items()
+            if v != self.ops[backwards_compatibility_keys.get(k, k)]
+        }:
+            self.set_options(**options)
+        self.values_width = width - self.yscroll.winfo_width() - 4
+        self.values(
+            [] if values_provider is not None else values,
+            width=self.values_width,
+            sample_size=ops.dropdown_sample_size,
+            reuse=True,
         )
-        self.values(values, width=width - self.yscroll.winfo_width() - 4)
+        if values_provider is not None:
+            self.request_values("", delay=0)
 
     def arrowkey_UP(self, event: object = None) -> None:
         if self.row > 0:
@@ -7062,13 +7499,90 @@ class Dropdown(Sheet):
         self.select_row(self.row)
 
     def search_and_see(self, event: object = None) -> None:
+        if self.values_provider is not None:
+            self.request_values(rf"{event['value']}")
+        else:
+            self.search_values(rf"{event['value']}")
+
+    def search_values(self, search_for: str) -> None:
         if self.search_function is not None:
-            rn = self.search_function(search_for=rf"{event['value']}".lower(), data=self.MT.data)
+            search_for = search_for.lower()
+            if self.search_function is dropdown_search_function:
+                if self.search_index is None:
+                    self.search_index = DropdownSearchIndex(self.MT.data)
+                rn = self.search_index.search(search_for)
+            else:
+                rn = self.search_function(search_for=search_for, data=self.MT.data)
             if rn is not None:
                 self.row = rn
                 self.see(self.row, 0, redraw=False)
                 self.select_row(self.row)
 
+    def request_values(self, search_for: str, delay: int | None = None) -> None:
+        # only the latest request is run, each new
+        # keystroke restarts the delay and cancels
+        # any provider call that is still running
+        self.cancel_provider()
+        self.provider_after_id = self.after(
+            self.provider_delay if delay is None else delay,
+            lambda: self.run_provider(search_for),
+        )
+
+    def run_provider(self, search_for: str) -> None:
+        self.provider_after_id = None
+        request_id = self.provider_request_id
+        try:
+            result = self.values_provider(search_for, self.provider_limit)
+        except Exception as error:
+            self.provider_failed(error, search_for)
+            return
+        if isinstance(result, Awaitable):
+            self.provider_future = run_awaitable(result)
+            self.poll_provider(request_id, search_for)
+        else:
+            self.provider_values(result, search_for)
+
+    def poll_provider(self, request_id: int, search_for: str) -> None:
+        if request_id != self.provider_request_id or self.provider_future is None:
+            return
+        if not self.provider_future.done():
+            self.provider_after_id = self.after(20, lambda: self.poll_provider(request_id, search_for))
+            return
+        future, self.provider_future = self.provider_future, None
+        if future.cancelled():
+            return
+        if future.exception() is None:
+            self.provider_values(future.result(), search_for)
+        else:
+            self.provider_failed(future.exception(), search_for)
+
+    def provider_failed(self, error: Exception, search_for: str) -> None:
+        # the box is left empty rather than showing values from an
+        # earlier search, the error is re-raised to tkinter unless
+        # the sheet has a "<<DropdownProviderError>>" binding
+        self.values([], width=self.values_width)
+        if self.provider_error is None or not self.provider_error(error, search_for, self.get_coords()):
+            raise error
+
+    def provider_values(self, values: Iterator[object], search_for: str) -> None:
+        self.values(
+            list(islice(values, self.provider_limit)),
+            redraw=False,
+            width=self.values_width,
+        )
+        self.search_values(search_for)
+        self.set_refresh_timer(True)
+
+    def cancel_provider(self) -> None:
+        # results from requests made before this are ignored
+        self.provider_request_id += 1
+        if self.provider_after_id is not None:
+            self.after_cancel(self.provider_after_id)
+            self.provider_after_id = None
+        if self.provider_future is not None:
+            self.provider_future.cancel()
+            self.provider_future = None
+
     def mouse_motion(self, event):
         row = self.identify_row(event, exclude_index=True, allow_end=False)
         if row is not None and row != self.row:
@@ -7117,7 +7631,23 @@ class Dropdown(Sheet):
         values: list = [],
         redraw: bool = True,
         width: int | None = None,
+        sample_size: int | None = None,
+        reuse: bool = False,
     ) -> None:
+        check_sample_size("sample_size", sample_size)
+        # the same list being reopened keeps its data,
+        # sizes and search index from last time
+        if (
+            reuse
+            and values is self.loaded_values
+            and len(values) == len(self.MT.data)
+            and self.ops.table_font == self.loaded_font
+        ):
+            self.set_refresh_timer(redraw)
+            return
+        self.loaded_values = values
+        self.loaded_font = self.ops.table_font
+        self.search_index = None
         self.set_sheet_data(
             [[v] for v in values],
             reset_col_positions=False,
@@ -7125,4 +7655,5 @@ class Dropdown(Sheet):
             redraw=False,
             verify=False,
         )
-        self.set_all_cell_sizes_to_text(redraw=redraw, width=width, slim=True)
+        self.MT.set_all_cell_sizes_to_text(width=width, slim=True, sample=sample_size)
+        self.set_refresh_timer(redraw)
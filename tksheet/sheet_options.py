@@ -214,6 +214,8 @@ def new_sheet_options() -> DotDict:
             "to_clipboard_lineterminator": "\n",
             "from_clipboard_delimiters": ["\t"],
             "show_dropdown_borders": False,
+            "dropdown_sample_size": None,
+            "dropdown_provider_delay": 150,
             "show_default_header_for_empty": True,
             "show_default_index_for_empty": True,
             "default_header_height": "1",
@@ -227,6 +229,12 @@ def new_sheet_options() -> DotDict:
             "paste_can_expand_y": False,
             "paste_insert_column_limit": None,
             "paste_insert_row_limit": None,
+            "paste_stream_threshold": None,
+            "paste_stream_chunk_rows": 5000,
+            "copy_stream_threshold": None,
+            "copy_stream_chunk_rows": 5000,
+            "batch_modified_events": False,
+            "rectangular_data": False,
             "arrow_key_down_right_scroll_page": False,
             "cell_auto_resize_enabled": True,
             "auto_resize_row_index": True,
@@ -32,12 +32,18 @@ emitted_events: set[str] = {
     "<<Copy>>",
     "<<Cut>>",
     "<<Paste>>",
+    "<<PasteProgress>>",
+    "<<ExportProgress>>",
+    "<<DropdownProviderError>>",
     "<<Delete>>",
     "<<Undo>>",
     "<<Redo>>",
     "<<SelectAll>>",
 }
 
+# the column pyarrow.Table.from_pandas() stores a DataFrame's index in
+arrow_index_name: str = "__index_level_0__"
+
 backwards_compatibility_keys: dict[str, str] = {
     "font": "table_font",
 }
@@ -137,3 +143,6 @@ bind_del_rows: set[str] = {
     "delete rows",
     "del rows",
 }
+
+sheet_state_magic: bytes = b"TKSHEET\x00"
+sheet_state_version: int = 1